@@ -6,23 +6,32 @@ Uses the new plugin system for extensible video processing.
 
 import os
 import sys
+import json
+import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Tuple
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 
 # Import our modules
 from src.config import Config
 from src.events import EventBus
+from src.events.handlers.event_handler import EventProcessor
 from src.processors import DownloadProcessor, TranscriptionProcessor, SummarizationProcessor
 from src.plugin_manager import PluginManager
 
-console = Console()
+# Rich styling is wasted when output is redirected (CI, pipes), so keep it plain there
+IS_TTY = sys.stdout.isatty()
+console = Console(force_terminal=IS_TTY, highlight=False)
 
 def print_banner():
     """Print application banner."""
+    if not IS_TTY:
+        return
     banner = """
 🎥 Plugin-Driven YouTube Video Summarizer 🎥
    Powered by Event-Driven Architecture + Plugin System
@@ -39,33 +48,48 @@ def setup_plugin_pipeline(args) -> tuple[EventBus, PluginManager]:
     
     # Load all plugins
     console.print("\n[bold blue]🔌 Loading Plugins...[/bold blue]")
-    plugin_results = plugin_manager.load_all_plugins()
+    # Processor plugins are only loaded once an event they handle is published,
+    # unless they are about to be listed
+    plugin_results = plugin_manager.load_all_plugins(lazy=not args.list_plugins)
     
     # Show plugin loading results
-    table = Table(title="Plugin Loading Results")
-    table.add_column("Plugin", style="cyan")
-    table.add_column("Status", style="green")
-    
-    for plugin_name, success in plugin_results.items():
-        status = "✅ Loaded" if success else "❌ Failed"
-        table.add_row(plugin_name, status)
-    
-    console.print(table)
+    if IS_TTY:
+        table = Table(title="Plugin Loading Results")
+        table.add_column("Plugin", style="cyan")
+        table.add_column("Status", style="green")
+        
+        for plugin_name, success in plugin_results.items():
+            status = "✅ Loaded" if success else "❌ Failed"
+            table.add_row(plugin_name, status)
+        
+        console.print(table)
+    else:
+        loaded = [name for name, success in plugin_results.items() if success]
+        failed = [name for name, success in plugin_results.items() if not success]
+        console.print(f"Plugins loaded: {', '.join(loaded) or 'none'}; failed: {', '.join(failed) or 'none'}")
     
     # Create core processors (these are built-in, not plugins)
     console.print("\n[bold blue]⚙️  Setting up Core Processors...[/bold blue]")
-    download_processor = DownloadProcessor(event_bus)
+    download_processor = DownloadProcessor(event_bus, max_workers=args.pipeline_workers)
     transcription_processor = TranscriptionProcessor(
         event_bus, 
         whisper_model=args.whisper_model,
-        transcription_method=args.transcription_method
+        transcription_method=args.transcription_method,
+        compute_type=args.compute_type,
+        use_cache=not args.no_cache,
+        max_workers=args.pipeline_workers
     )
     summarization_processor = SummarizationProcessor(
         event_bus,
         summary_style=args.summary_style,
         summary_length=args.summary_length,
-        output_format=args.format
+        output_format=args.format,
+        max_workers=args.pipeline_workers,
+        batch_size=args.summary_batch,
+        use_cache=not args.no_cache
     )
+    # Pipeline order, so draining each stage in turn finishes all work
+    _core_processors[:] = [download_processor, transcription_processor, summarization_processor]
     
     # Subscribe core processors to events
     from src.events import VideoDiscoveredEvent, VideoDownloadedEvent, TranscriptGeneratedEvent
@@ -78,6 +102,33 @@ def setup_plugin_pipeline(args) -> tuple[EventBus, PluginManager]:
     
     return event_bus, plugin_manager
 
+def setup_logging(quiet: bool = False) -> None:
+    """
+    Route log records through Rich on the shared console.
+    
+    Processors, plugins and providers report per-video progress as INFO log records
+    rather than printing directly; ``quiet`` keeps only their warnings and
+    errors. Other libraries log at WARNING and above either way.
+    """
+    from rich.logging import RichHandler
+    
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(message)s",
+        handlers=[RichHandler(console=console, show_time=False, show_path=False)]
+    )
+    level = logging.WARNING if quiet else logging.INFO
+    for name in ('src.processors', 'src.plugins', 'src.providers'):
+        logging.getLogger(name).setLevel(level)
+
+# Core processors of this process's pipeline, in pipeline order
+_core_processors: List[EventProcessor] = []
+
+def drain_pipeline() -> None:
+    """Wait for work queued on the core processors' thread pools (--pipeline-workers)."""
+    for processor in _core_processors:
+        processor.drain()
+
 def process_single_video(url: str, args, event_bus: EventBus, plugin_manager: PluginManager) -> bool:
     """Process a single video using the plugin-driven system."""
     try:
@@ -88,22 +139,18 @@ def process_single_video(url: str, args, event_bus: EventBus, plugin_manager: Pl
             console.print(f"[red]❌ No provider plugins available[/red]")
             return False
         
-        # Check if any provider can handle this URL
-        url_handled = False
-        
-        for provider_plugin in provider_plugins:
-            if provider_plugin.can_handle_url(url):
-                console.print(f"[blue]🔌 Using provider: {provider_plugin.plugin_info.name}[/blue]")
-                provider_plugin.process_url(url)
-                url_handled = True
-                break
+        # Find the provider that handles this URL
+        provider_plugin = plugin_manager.route_url(url)
         
         # If no provider can handle it, error out
-        if not url_handled:
+        if provider_plugin is None:
             console.print(f"[red]❌ No provider can handle URL: {url}[/red]")
             console.print(f"[yellow]Available providers: {[p.plugin_info.name for p in provider_plugins]}[/yellow]")
             return False
         
+        console.print(f"[blue]🔌 Using provider: {provider_plugin.plugin_info.name}[/blue]")
+        provider_plugin.process_url(url)
+        
         console.print(f"\n[bold green]🎉 Plugin-driven processing initiated![/bold green]")
         console.print(f"[yellow]💡 Check the output directory for results.[/yellow]")
         
@@ -118,21 +165,82 @@ def process_single_video(url: str, args, event_bus: EventBus, plugin_manager: Pl
         console.print(f"[red]❌ Error in plugin-driven processing: {e}[/red]")
         return False
 
+# Per-process pipeline state used by --process-workers
+_worker_state: Dict[str, Any] = {}
+
+def _init_worker(config_dict: Dict[str, Any], args_dict: Dict[str, Any]) -> None:
+    """Initialize a worker process with its own config, event bus and Whisper model."""
+    Config.load_from_dict(config_dict)
+    args = argparse.Namespace(**args_dict)
+    setup_logging(args.quiet)
+    event_bus, plugin_manager = setup_plugin_pipeline(args)
+    _worker_state.update(args=args, event_bus=event_bus, plugin_manager=plugin_manager)
+
+def _process_url_worker(url: str) -> Tuple[str, bool]:
+    """Process one URL inside a worker process."""
+    success = process_single_video(
+        url, _worker_state['args'], _worker_state['event_bus'], _worker_state['plugin_manager']
+    )
+    drain_pipeline()
+    return url, success
+
 def process_multiple_videos(urls: List[str], args, event_bus: EventBus, plugin_manager: PluginManager) -> bool:
-    """Process multiple videos using the plugin-driven system."""
-    console.print(f"\n[blue]📋 Processing {len(urls)} videos with plugin-driven system...[/blue]")
-    
+    """Process multiple videos concurrently using the plugin-driven system."""
     success_count = 0
     failed_urls = []
     
-    for i, url in enumerate(urls, 1):
-        console.print(f"\n[bold blue]Processing video {i}/{len(urls)}[/bold blue]")
-        console.print(f"URL: {url}")
-        
-        if process_single_video(url, args, event_bus, plugin_manager):
-            success_count += 1
-        else:
-            failed_urls.append(url)
+    def _run_one(url: str) -> Tuple[str, bool]:
+        """Run the full pipeline for one URL on a worker thread."""
+        return url, process_single_video(url, args, event_bus, plugin_manager)
+    
+    if args.process_workers:
+        # CPU-bound Whisper work: one pipeline (and model) per process.
+        # Only the URL and plain argument values cross the process boundary.
+        workers = max(1, min(args.process_workers, len(urls)))
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                       initargs=(Config.as_dict(), vars(args)))
+        run = _process_url_worker
+        mode = "processes"
+    else:
+        workers = max(1, min(args.workers or 4, len(urls)))
+        executor = ThreadPoolExecutor(max_workers=workers)
+        run = _run_one
+        mode = "workers"
+    
+    console.print(f"\n[blue]📋 Processing {len(urls)} videos with plugin-driven system ({workers} {mode})...[/blue]")
+    
+    if not IS_TTY:
+        # No live display when redirected: emit one JSON line per finished URL
+        with executor:
+            futures = [executor.submit(run, url) for url in urls]
+            
+            for future in as_completed(futures):
+                url, success = future.result()
+                if success:
+                    success_count += 1
+                else:
+                    failed_urls.append(url)
+                print(json.dumps({'url': url, 'success': success}), flush=True)
+    else:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            TimeElapsedColumn(),
+            console=console
+        ) as progress:
+            tasks = {url: progress.add_task(f"⏳ {url}", total=1) for url in urls}
+            
+            with executor:
+                futures = [executor.submit(run, url) for url in urls]
+                
+                for future in as_completed(futures):
+                    url, success = future.result()
+                    if success:
+                        success_count += 1
+                        progress.update(tasks[url], description=f"✅ {url}", completed=1)
+                    else:
+                        failed_urls.append(url)
+                        progress.update(tasks[url], description=f"❌ {url}", completed=1)
     
     # Summary
     console.print(f"\n[bold green]📊 Plugin-Driven Processing Summary:[/bold green]")
@@ -191,6 +299,11 @@ Examples:
                        default=Config.DEFAULT_WHISPER_MODEL,
                        help='Whisper model size (default: small)')
     
+    parser.add_argument('--compute-type',
+                       choices=Config.WHISPER_COMPUTE_TYPES,
+                       default=Config.WHISPER_COMPUTE_TYPE,
+                       help='Whisper compute type (default: int8, int8_float16 on CUDA)')
+    
     parser.add_argument('--transcription-method',
                        choices=['whisper', 'captions'],
                        default='whisper',
@@ -211,6 +324,30 @@ Examples:
                        default='text',
                        help='Output format (default: text)')
     
+    parser.add_argument('--workers',
+                       type=int,
+                       default=4,
+                       help='Number of videos to process concurrently with --urls (default: 4)')
+    
+    parser.add_argument('--process-workers',
+                       type=int,
+                       default=0,
+                       help='Use K worker processes for --urls, each with its own Whisper model (default: threads)')
+    
+    parser.add_argument('--pipeline-workers',
+                       type=int,
+                       default=0,
+                       help='Run each core processor on its own pool of N threads (default: 0, run inline)')
+    
+    parser.add_argument('--summary-batch',
+                       type=int,
+                       default=1,
+                       help='Summarize transcripts N at a time with concurrent OpenAI requests (default: 1)')
+    
+    parser.add_argument('--no-cache',
+                       action='store_true',
+                       help='Always re-transcribe and re-summarize instead of reusing cached results')
+    
     parser.add_argument('--output-dir',
                        default=Config.OUTPUT_DIR,
                        help='Output directory (default: ./output)')
@@ -224,15 +361,32 @@ Examples:
                        action='store_true',
                        help='Show plugin status after processing')
     
+    parser.add_argument('--quiet',
+                       action='store_true',
+                       help='Only log warnings and errors from processors, plugins and providers')
+    
     parser.add_argument('--plugins-dir',
                        default='plugins',
                        help='Directory containing plugins (default: plugins)')
     
     args = parser.parse_args()
+    setup_logging(args.quiet)
     
     # Print banner
     print_banner()
     
+    # Check the URL arguments before paying for plugin loading and model setup
+    if args.url:
+        urls = [args.url]
+    else:
+        # Drop empty entries and duplicates, keeping the given order
+        urls = list(dict.fromkeys(filter(None, (url.strip() for url in (args.urls or '').split(',')))))
+    
+    if not urls and not args.list_plugins:
+        console.print("[red]❌ Error: Please provide either --url or --urls argument[/red]")
+        parser.print_help()
+        sys.exit(1)
+    
     # Set up plugin pipeline
     event_bus, plugin_manager = setup_plugin_pipeline(args)
     
@@ -241,23 +395,17 @@ Examples:
         list_plugins(plugin_manager)
         sys.exit(0)
     
-    # Check if URL is provided
-    if not args.url and not args.urls:
-        console.print("[red]❌ Error: Please provide either --url or --urls argument[/red]")
-        parser.print_help()
-        sys.exit(1)
-    
     # Process URLs
-    if args.url:
+    if len(urls) == 1:
         # Single video
-        success = process_single_video(args.url, args, event_bus, plugin_manager)
-        sys.exit(0 if success else 1)
-    
+        success = process_single_video(urls[0], args, event_bus, plugin_manager)
     else:
         # Multiple videos
-        urls = [url.strip() for url in args.urls.split(',')]
         success = process_multiple_videos(urls, args, event_bus, plugin_manager)
-        sys.exit(0 if success else 1)
+    drain_pipeline()
+    for processor in _core_processors:
+        processor.shutdown()
+    sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""
+Persistent transcript and summary caches backed by SQLite.
+"""
+
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+import dataclasses
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+from src.config import Config
+
+
+def _to_json(obj: Any) -> Any:
+    """Serialize objects json doesn't know about (e.g. faster-whisper Word segments)."""
+    if dataclasses.is_dataclass(obj):
+        # Shallow field copy: json recurses into the values itself
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    if hasattr(obj, '_asdict'):
+        return obj._asdict()
+    return str(obj)
+
+
+class TranscriptCache:
+    """Stores finished transcripts keyed by (url, method, model, compute type)."""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Open (or create) the transcript cache.
+
+        Args:
+            path: SQLite database path (default: Config.CACHE_PATH)
+        """
+        self.path = Path(path or Config.CACHE_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS transcripts ("
+            "key TEXT PRIMARY KEY, transcript TEXT NOT NULL, "
+            "created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(url: str, method: str, model: str, compute_type: str) -> str:
+        """Build the cache key for a transcript."""
+        return "|".join((url.strip(), method, model, compute_type))
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached transcript for a key, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute("SELECT transcript FROM transcripts WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, transcript: Dict[str, Any]):
+        """Store a transcript under a key, replacing any previous entry."""
+        data = json.dumps(transcript, ensure_ascii=False, default=_to_json)
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO transcripts (key, transcript) VALUES (?, ?)", (key, data))
+            self._conn.commit()
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class SummaryCache:
+    """Stores AI summaries keyed by a hash of (model, style, length, transcript)."""
+
+    def __init__(self, path: Optional[str] = None, ttl_days: float = 30):
+        """
+        Open (or create) the summary cache.
+
+        Args:
+            path: SQLite database path (default: Config.CACHE_PATH, next to the transcripts)
+            ttl_days: Age in days after which a cached summary is ignored
+        """
+        self.path = Path(path or Config.CACHE_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_days * 86400
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS summaries ("
+            "key TEXT PRIMARY KEY, summary TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, style: str, length: str, text: str) -> str:
+        """Build the cache key for a summary; the transcript is hashed, not stored."""
+        return hashlib.sha256(f"{model}|{style}|{length}|{text}".encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached summary for a key, or None on a miss or an expired entry."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT summary FROM summaries WHERE key = ? AND created_at > ?",
+                (key, time.time() - self.ttl_seconds)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, summary: Dict[str, Any]):
+        """Store a summary under a key, replacing any previous entry."""
+        data = json.dumps(summary, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, summary, created_at) VALUES (?, ?, ?)",
+                (key, data, time.time())
+            )
+            self._conn.commit()
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -8,7 +8,8 @@ from src.downloaders import (
     VideoDownloader,
     YouTubeDownloader,
     VimeoDownloader,
-    DownloaderRegistry
+    DownloaderRegistry,
+    get_registry
 )
 
 # Re-export for backward compatibility
@@ -16,5 +17,6 @@ __all__ = [
     'VideoDownloader',
     'YouTubeDownloader',
     'VimeoDownloader', 
-    'DownloaderRegistry'
+    'DownloaderRegistry',
+    'get_registry'
 ]
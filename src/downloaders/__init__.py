@@ -5,11 +5,12 @@ Downloaders package for video platform-specific downloaders.
 from .base import VideoDownloader
 from .youtube import YouTubeDownloader
 from .vimeo import VimeoDownloader
-from .registry import DownloaderRegistry
+from .registry import DownloaderRegistry, get_registry
 
 __all__ = [
     'VideoDownloader',
     'YouTubeDownloader', 
     'VimeoDownloader',
-    'DownloaderRegistry'
+    'DownloaderRegistry',
+    'get_registry'
 ] 
\ No newline at end of file
@@ -3,19 +3,179 @@ Base video downloader interface.
 """
 
 import os
+import re
+import atexit
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List
+from yt_dlp import YoutubeDL
+from yt_dlp.utils import DownloadError
 from rich.console import Console
 
+from src.config import Config
+
 console = Console()
 
+# Characters kept in filenames derived from video titles (word chars, space, dash)
+_UNSAFE_CHARS = re.compile(r'[^\w -]')
+_SPACES_AND_DASHES = str.maketrans(' -', '__')
+
+# Download write buffer and HTTP range size: larger writes mean far fewer
+# flushes for fragmented (DASH/HLS) streams
+DOWNLOAD_BUFFER_SIZE = 64 * 1024
+HTTP_CHUNK_SIZE = 10 * 1024 * 1024
+
+# Downloaders with pooled YoutubeDL instances, closed together at exit
+_live_downloaders: "weakref.WeakSet[VideoDownloader]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_downloaders():
+    for downloader in list(_live_downloaders):
+        downloader.close()
+
+
+# Full yt-dlp info dicts (formats, subtitles, ...) kept per downloader
+_RAW_INFO_CACHE_SIZE = 256
+
 class VideoDownloader(ABC):
     """Abstract base class for video downloaders."""
     
+    # yt-dlp options for metadata-only extraction: no download, no format
+    # probing, and playlist entries left unresolved
+    _info_opts: Dict[str, Any] = {
+        'quiet': True,
+        'no_warnings': True,
+        'skip_download': True,
+        'extract_flat': 'in_playlist',
+        'check_formats': False,
+    }
+    
     def __init__(self, temp_dir: str = "./temp"):
         self.temp_dir = Path(temp_dir)
-        self.temp_dir.mkdir(exist_ok=True)
+        if not Config._dirs_ensured:
+            Config.ensure_dirs()
+        self._info_cache: Dict[str, Dict[str, Any]] = {}  # video info keyed by URL
+        self._raw_info_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # full yt-dlp info, LRU by URL
+        self._raw_info_lock = threading.Lock()
+        self._ydl_pool: Dict[str, List[YoutubeDL]] = {}  # idle YoutubeDL instances per option set
+        self._ydl_instances: List[YoutubeDL] = []
+        self._ydl_pool_lock = threading.Lock()
+        _live_downloaders.add(self)
+    
+    @contextmanager
+    def _ydl(self, ydl_opts: Dict[str, Any]) -> Iterator[YoutubeDL]:
+        """
+        Check a reusable yt-dlp YoutubeDL instance for the given options out of the pool.
+        
+        YoutubeDL is not thread-safe, so each instance is used by one caller at
+        a time and returned to the pool afterwards; the pool grows only to the
+        peak concurrency, and extractor and cookie jar setup is paid once per
+        instance. The output template is applied per checkout so downloads to
+        different files share instances.
+        """
+        opts = dict(ydl_opts)
+        outtmpl = opts.pop('outtmpl', None)
+        key = repr(sorted(opts.items()))
+        
+        with self._ydl_pool_lock:
+            idle = self._ydl_pool.setdefault(key, [])
+            ydl = idle.pop() if idle else None
+        
+        if ydl is None:
+            ydl = YoutubeDL(opts)
+            with self._ydl_pool_lock:
+                self._ydl_instances.append(ydl)
+        
+        if outtmpl is not None:
+            ydl.params['outtmpl']['default'] = outtmpl
+        try:
+            yield ydl
+        finally:
+            with self._ydl_pool_lock:
+                idle.append(ydl)
+    
+    def close(self):
+        """Close all pooled YoutubeDL instances."""
+        with self._ydl_pool_lock:
+            instances, self._ydl_instances = self._ydl_instances, []
+            self._ydl_pool.clear()
+        for ydl in instances:
+            ydl.close()
+    
+    def _extract_info(self, url: str) -> Dict[str, Any]:
+        """
+        Return yt-dlp's full info dict for a URL, extracting it once.
+        
+        The whole dict is kept (not just the summary fields), so captions
+        listings and downloads can reuse the same extraction.
+        """
+        with self._raw_info_lock:
+            info = self._raw_info_cache.get(url)
+            if info is not None:
+                self._raw_info_cache.move_to_end(url)
+                return info
+        
+        with self._ydl(self._info_opts) as ydl:
+            info = ydl.extract_info(url, download=False)
+        if info is None:
+            raise Exception("Could not extract video info")
+        
+        with self._raw_info_lock:
+            self._raw_info_cache[url] = info
+            if len(self._raw_info_cache) > _RAW_INFO_CACHE_SIZE:
+                self._raw_info_cache.popitem(last=False)
+        return info
+    
+    def _download_with_info(self, ydl, url: str) -> Dict[str, Any]:
+        """
+        Download ``url`` with ``ydl``, reusing a cached extraction when there is one.
+        
+        Feeding the cached info dict to ``process_ie_result`` skips the second
+        watch-page fetch that ``download([url])`` would do. Falls back to a fresh
+        extraction if there is no cached single-video entry or it is stale.
+        
+        Returns:
+            The info dict yt-dlp processed for the download
+        """
+        with self._raw_info_lock:
+            info = self._raw_info_cache.get(url)
+        
+        if info is not None and info.get('_type', 'video') == 'video':
+            try:
+                return ydl.process_ie_result(ydl.sanitize_info(info, remove_private_keys=True), download=True)
+            except DownloadError:
+                # e.g. format URLs expired since the info was extracted
+                pass
+        
+        downloaded_info = ydl.extract_info(url, download=True)
+        if downloaded_info is None:
+            raise Exception("Could not extract video info")
+        return downloaded_info
+    
+    @staticmethod
+    def _safe_title(title: str) -> str:
+        """Strip characters that are unsafe in filenames from a video title."""
+        return _UNSAFE_CHARS.sub('', title).rstrip()
+    
+    @staticmethod
+    def _captions_filename(title: str, lang: str) -> str:
+        """Build the captions filename stem for a video title."""
+        safe_title = _UNSAFE_CHARS.sub('', title).rstrip().translate(_SPACES_AND_DASHES)
+        return f"{safe_title[:50]}_{lang}_captions"
+    
+    @staticmethod
+    def _downloaded_filepath(ydl, info: Dict[str, Any]) -> str:
+        """Return the path of the file written by ``ydl.extract_info(url, download=True)``."""
+        downloads = info.get('requested_downloads') or []
+        if downloads and downloads[0].get('filepath'):
+            return downloads[0]['filepath']
+        return ydl.prepare_filename(info)
     
     @abstractmethod
     def can_handle_url(self, url: str) -> bool:
@@ -28,13 +188,13 @@ class VideoDownloader(ABC):
         pass
     
     @abstractmethod
-    def download_audio(self, url: str, output_filename: Optional[str] = None) -> str:
-        """Download audio from video."""
+    def download_audio(self, url: str, output_filename: Optional[str] = None, info: Optional[Dict[str, Any]] = None) -> str:
+        """Download audio from video, reusing ``info`` from get_video_info if given."""
         pass
     
     @abstractmethod
-    def download_captions(self, url: str, output_filename: Optional[str] = None, lang: str = "en", prefer_manual: bool = True) -> Optional[str]:
-        """Download closed captions from video."""
+    def download_captions(self, url: str, output_filename: Optional[str] = None, lang: str = "en", prefer_manual: bool = True, info: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Download closed captions from video, reusing ``info`` from get_video_info if given."""
         pass
     
     @abstractmethod
@@ -42,6 +202,28 @@ class VideoDownloader(ABC):
         """List available captions for video."""
         pass
     
+    def download_audio_batch(self, urls: List[str], max_workers: int = 4) -> Dict[str, str]:
+        """
+        Download audio for several videos concurrently.
+        
+        Downloads are network-bound, so a few threads overlap the waits; keep
+        ``max_workers`` small to stay clear of rate limiting.
+        
+        Args:
+            urls: Video URLs to download
+            max_workers: Maximum number of parallel downloads (default: 4)
+            
+        Returns:
+            Dictionary mapping each URL to its downloaded audio file path
+        """
+        if not urls:
+            return {}
+        
+        workers = max(1, min(max_workers, len(urls)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self.download_audio, url): url for url in urls}
+            return {futures[future]: future.result() for future in as_completed(futures)}
+    
     def cleanup_temp_files(self, file_path: str):
         """Clean up temporary downloaded files."""
         try:
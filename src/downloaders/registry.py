@@ -2,7 +2,10 @@
 Registry for managing different video downloaders.
 """
 
-from typing import Optional
+import functools
+import threading
+from typing import Dict, List, Optional, Type
+from urllib.parse import urlparse
 from rich.console import Console
 
 from .base import VideoDownloader
@@ -11,11 +14,19 @@ from .vimeo import VimeoDownloader
 
 console = Console()
 
+# Known hosts mapped to the downloader class that serves them
+HOST_MAP: Dict[str, Type[VideoDownloader]] = {
+    'youtube.com': YouTubeDownloader,
+    'youtu.be': YouTubeDownloader,
+    'vimeo.com': VimeoDownloader,
+}
+
 class DownloaderRegistry:
     """Registry for managing different video downloaders."""
     
     def __init__(self):
         self.downloaders = []
+        self._instances: Dict[Type[VideoDownloader], VideoDownloader] = {}
         self._register_default_downloaders()
     
     def _register_default_downloaders(self):
@@ -26,17 +37,49 @@ class DownloaderRegistry:
     def register_downloader(self, downloader: VideoDownloader):
         """Register a new downloader."""
         self.downloaders.append(downloader)
+        self._instances.setdefault(type(downloader), downloader)
         console.print(f"[blue]Registered downloader: {downloader.__class__.__name__}[/blue]")
     
     def get_downloader_for_url(self, url: str) -> Optional[VideoDownloader]:
         """Get the appropriate downloader for a given URL."""
+        # Fast path: dispatch on the URL host
+        host = urlparse(url).netloc.lower().removeprefix('www.')
+        downloader = self._instances.get(HOST_MAP.get(host))
+        if downloader is not None and downloader.can_handle_url(url):
+            return downloader
+        
+        # Fallback: ask every registered downloader
         for downloader in self.downloaders:
             if downloader.can_handle_url(url):
                 return downloader
         return None
     
+    def get_downloaders_for_urls(self, urls: List[str]) -> List[Optional[VideoDownloader]]:
+        """Get the downloader for each URL in a batch, in input order."""
+        resolved: Dict[str, Optional[VideoDownloader]] = {}
+        downloaders = []
+        for url in urls:
+            if url not in resolved:
+                resolved[url] = self.get_downloader_for_url(url)
+            downloaders.append(resolved[url])
+        return downloaders
+    
     def list_downloaders(self):
         """List all registered downloaders."""
         console.print("[bold blue]Registered Downloaders:[/bold blue]")
         for downloader in self.downloaders:
-            console.print(f"  - {downloader.__class__.__name__}") 
\ No newline at end of file
+            console.print(f"  - {downloader.__class__.__name__}")
+
+
+_registry_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _create_registry() -> DownloaderRegistry:
+    return DownloaderRegistry()
+
+
+def get_registry() -> DownloaderRegistry:
+    """Return the process-wide DownloaderRegistry, creating it on first use."""
+    with _registry_lock:
+        return _create_registry()
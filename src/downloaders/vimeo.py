@@ -2,30 +2,31 @@
 Vimeo-specific video downloader using yt-dlp.
 """
 
+import os
 import re
+import logging
 from typing import Optional, Dict, Any
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .base import VideoDownloader
+from .base import VideoDownloader, DOWNLOAD_BUFFER_SIZE, HTTP_CHUNK_SIZE
 
 console = Console()
+logger = logging.getLogger(__name__)
 
 class VimeoDownloader(VideoDownloader):
     """Vimeo-specific video downloader using yt-dlp."""
     
+    _URL_RE = re.compile(r'vimeo\.com/(?:\d+|channels/\w+/\d+|groups/\w+/videos/\d+)')
+    
     def can_handle_url(self, url: str) -> bool:
         """Check if this is a Vimeo URL."""
-        vimeo_patterns = [
-            r'(?:vimeo\.com/\d+)',
-            r'(?:vimeo\.com/channels/\w+/\d+)',
-            r'(?:vimeo\.com/groups/\w+/videos/\d+)'
-        ]
-        return any(re.search(pattern, url) for pattern in vimeo_patterns)
+        return self._URL_RE.search(url) is not None
     
     def get_video_info(self, url: str) -> Dict[str, Any]:
-        """Get video information without downloading."""
-        import yt_dlp
+        """Get video information without downloading (cached per URL)."""
+        if url in self._info_cache:
+            return self._info_cache[url]
         
         ydl_opts = {
             'quiet': True,
@@ -33,51 +34,51 @@ class VimeoDownloader(VideoDownloader):
             'extract_flat': True,
         }
         
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            try:
+        try:
+            with self._ydl(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
-                if info is None:
-                    raise Exception("Could not extract video info")
-                return {
-                    'title': info.get('title', 'Unknown'),
-                    'duration': info.get('duration', 0),
-                    'uploader': info.get('uploader', 'Unknown'),
-                    'view_count': info.get('view_count', 0),
-                    'description': info.get('description', '')[:200] + '...' if info.get('description') else ''
-                }
-            except Exception as e:
-                console.print(f"[red]Error getting video info: {e}[/red]")
-                raise
+            if info is None:
+                raise Exception("Could not extract video info")
+            video_info = {
+                'title': info.get('title', 'Unknown'),
+                'duration': info.get('duration', 0),
+                'uploader': info.get('uploader', 'Unknown'),
+                'view_count': info.get('view_count', 0),
+                'description': info.get('description', '')[:200] + '...' if info.get('description') else ''
+            }
+            self._info_cache[url] = video_info
+            return video_info
+        except Exception as e:
+            console.print(f"[red]Error getting video info: {e}[/red]")
+            raise
     
-    def download_audio(self, url: str, output_filename: Optional[str] = None) -> str:
+    def download_audio(self, url: str, output_filename: Optional[str] = None, info: Optional[Dict[str, Any]] = None) -> str:
         """
         Download audio from Vimeo video.
         
         Args:
             url: Vimeo video URL
             output_filename: Optional custom filename
+            info: Video info from get_video_info, fetched if not given
             
         Returns:
             Path to downloaded audio file
         """
-        import yt_dlp
-        
         if not output_filename:
             # Generate filename from video info
-            info = self.get_video_info(url)
-            safe_title = "".join(c for c in info['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            output_filename = f"{safe_title[:50]}.mp3"
+            info = info or self.get_video_info(url)
+            safe_title = self._safe_title(info['title'])
+            output_filename = safe_title[:50]
         
         output_path = self.temp_dir / output_filename
         
+        # Keep the source audio container: Whisper decodes it directly, so
+        # re-encoding to MP3 would only cost time and disk space
         ydl_opts = {
             'format': 'bestaudio/best',
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
-            }],
-            'outtmpl': str(output_path.with_suffix('')),
+            'outtmpl': str(output_path.with_suffix('')) + '.%(ext)s',
+            'buffersize': DOWNLOAD_BUFFER_SIZE,
+            'http_chunk_size': HTTP_CHUNK_SIZE,
             'quiet': True,
             'no_warnings': True,
         }
@@ -90,17 +91,20 @@ class VimeoDownloader(VideoDownloader):
             task = progress.add_task("Downloading audio...", total=None)
             
             try:
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([url])
+                with self._ydl(ydl_opts) as ydl:
+                    downloaded_info = ydl.extract_info(url, download=True)
+                    if downloaded_info is None:
+                        raise Exception("Could not extract video info")
+                    audio_path = self._downloaded_filepath(ydl, downloaded_info)
                 
                 progress.update(task, description="✅ Audio downloaded successfully!")
-                return str(output_path)
+                return audio_path
                 
             except Exception as e:
                 progress.update(task, description=f"❌ Download failed: {e}")
                 raise
     
-    def download_captions(self, url: str, output_filename: Optional[str] = None, lang: str = "en", prefer_manual: bool = True) -> Optional[str]:
+    def download_captions(self, url: str, output_filename: Optional[str] = None, lang: str = "en", prefer_manual: bool = True, info: Optional[Dict[str, Any]] = None) -> Optional[str]:
         """
         Download closed captions from Vimeo video.
         Args:
@@ -108,19 +112,16 @@ class VimeoDownloader(VideoDownloader):
             output_filename: Optional custom filename
             lang: Language code for captions (default: 'en')
             prefer_manual: Whether to prefer manual captions over auto-generated (default: True)
+            info: Video info from get_video_info, fetched if not given
         Returns:
             Path to downloaded captions file, or None if not available
         """
-        import yt_dlp
+        if not output_filename and info:
+            output_filename = self._captions_filename(info['title'], lang)
         
-        info = self.get_video_info(url)
-        safe_title = "".join(c for c in info['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        safe_title = safe_title.replace(' ', '_').replace('-', '_')
-        safe_title = "".join(c for c in safe_title if c.isalnum() or c == '_')
-        output_filename = output_filename or f"{safe_title[:50]}_{lang}_captions"
-        output_path = self.temp_dir / f"{output_filename}.{lang}.srt"
-
-        console.print(f"[blue]Attempting to download captions to: {output_path}[/blue]")
+        # Without a known title, write under the video id and rename once the
+        # download has returned the title (avoids a separate info request)
+        download_name = output_filename or '%(id)s'
 
         # Try to download captions
         ydl_opts = {
@@ -129,24 +130,37 @@ class VimeoDownloader(VideoDownloader):
             'writeautomaticsub': True,
             'subtitleslangs': [lang],
             'subtitlesformat': 'srt',
-            'outtmpl': str(self.temp_dir / output_filename),
+            'outtmpl': str(self.temp_dir / download_name),
             'quiet': False,
             'no_warnings': False,
         }
 
         console.print(f"[yellow]Trying to download captions for language: {lang}[/yellow]")
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            try:
-                ydl.download([url])
-                if output_path.exists():
-                    console.print(f"[green]✅ Downloaded captions for language: {lang}[/green]")
-                    console.print(f"[green]File size: {output_path.stat().st_size} bytes[/green]")
-                    return str(output_path)
-                else:
-                    console.print(f"[red]❌ File not found after download: {output_path}[/red]")
-                    console.print(f"[blue]Files in temp directory: {list(self.temp_dir.glob('*'))}[/blue]")
-            except Exception as e:
-                console.print(f"[yellow]No captions found for {lang}: {e}[/yellow]")
+        try:
+            with self._ydl(ydl_opts) as ydl:
+                downloaded_info = ydl.extract_info(url, download=True)
+            if downloaded_info is None:
+                raise Exception("Could not extract video info")
+            
+            if output_filename:
+                output_path = self.temp_dir / f"{output_filename}.{lang}.srt"
+            else:
+                output_filename = self._captions_filename(downloaded_info.get('title', 'Unknown'), lang)
+                output_path = self.temp_dir / f"{output_filename}.{lang}.srt"
+                id_path = self.temp_dir / f"{downloaded_info.get('id')}.{lang}.srt"
+                if id_path.exists():
+                    os.replace(id_path, output_path)
+            
+            if output_path.exists():
+                console.print(f"[green]✅ Downloaded captions for language: {lang}[/green]")
+                console.print(f"[green]File size: {output_path.stat().st_size} bytes[/green]")
+                return str(output_path)
+            else:
+                console.print(f"[red]❌ File not found after download: {output_path}[/red]")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Files in temp directory: %s", list(self.temp_dir.glob('*')))
+        except Exception as e:
+            console.print(f"[yellow]No captions found for {lang}: {e}[/yellow]")
 
         return None
     
@@ -158,27 +172,25 @@ class VimeoDownloader(VideoDownloader):
         Returns:
             Dictionary with available captions information
         """
-        import yt_dlp
-        
         ydl_opts = {
             'quiet': True,
             'no_warnings': True,
             'skip_download': True,
         }
         
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            try:
+        try:
+            with self._ydl(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
-                if info is None:
-                    raise Exception("Could not extract video info")
-                captions = info.get('subtitles', {})
-                auto_captions = info.get('automatic_captions', {})
-                
-                return {
-                    'manual_captions': captions,
-                    'auto_captions': auto_captions,
-                    'all_languages': list(set(list(captions.keys()) + list(auto_captions.keys())))
-                }
-            except Exception as e:
-                console.print(f"[red]Error getting captions info: {e}[/red]")
-                return {'manual_captions': {}, 'auto_captions': {}, 'all_languages': []} 
\ No newline at end of file
+            if info is None:
+                raise Exception("Could not extract video info")
+            captions = info.get('subtitles', {})
+            auto_captions = info.get('automatic_captions', {})
+            
+            return {
+                'manual_captions': captions,
+                'auto_captions': auto_captions,
+                'all_languages': list(set(list(captions.keys()) + list(auto_captions.keys())))
+            }
+        except Exception as e:
+            console.print(f"[red]Error getting captions info: {e}[/red]")
+            return {'manual_captions': {}, 'auto_captions': {}, 'all_languages': []} 
\ No newline at end of file
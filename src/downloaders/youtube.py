@@ -3,79 +3,144 @@ YouTube-specific video downloader using yt-dlp.
 """
 
 import re
-from typing import Optional, Dict, Any
+import json
+import asyncio
+import logging
+from typing import Optional, Dict, Any, List
+import requests
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .base import VideoDownloader
+from .base import VideoDownloader, DOWNLOAD_BUFFER_SIZE, HTTP_CHUNK_SIZE
 
 console = Console()
+logger = logging.getLogger(__name__)
+
+# Watch, short, embed and legacy /e/ and /v/ player URLs
+_YT_RE = re.compile(r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/|youtube\.com/e/|youtube\.com/v/)')
+
+# Fast metadata path: the 11-character video id and the player response
+# embedded in the watch page
+_VIDEO_ID_RE = re.compile(r'(?:[?&]v=|youtu\.be/|/embed/|/e/|/v/)([\w-]{11})')
+_PLAYER_RESPONSE_RE = re.compile(r'var ytInitialPlayerResponse\s*=\s*(\{.+?\})\s*;\s*(?:var\s|</script>)', re.DOTALL)
+_WATCH_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Cookie': 'CONSENT=YES+',
+}
 
 class YouTubeDownloader(VideoDownloader):
     """YouTube-specific video downloader using yt-dlp."""
     
-    def can_handle_url(self, url: str) -> bool:
+    # Skip the DASH manifest request; the player response already lists the
+    # adaptive formats, captions and metadata
+    _info_opts = {
+        **VideoDownloader._info_opts,
+        'extractor_args': {'youtube': {'skip': ['dash']}},
+    }
+    
+    @staticmethod
+    def can_handle_url(url: str) -> bool:
         """Check if this is a YouTube URL."""
-        youtube_patterns = [
-            r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)',
-        ]
-        return any(re.search(pattern, url) for pattern in youtube_patterns)
+        return _YT_RE.search(url) is not None
     
     def get_video_info(self, url: str) -> Dict[str, Any]:
-        """Get video information without downloading."""
-        import yt_dlp
+        """Get video information without downloading (extracted once per URL)."""
+        try:
+            info = self._extract_info(url)
+            return {
+                'title': info.get('title', 'Unknown'),
+                'duration': info.get('duration', 0),
+                'uploader': info.get('uploader', 'Unknown'),
+                'view_count': info.get('view_count', 0),
+                'description': info.get('description', '')[:200] + '...' if info.get('description') else ''
+            }
+        except Exception as e:
+            console.print(f"[red]Error getting video info: {e}[/red]")
+            raise
+    
+    def _fetch_video_info_fast(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Read video info from the watch page's embedded player response.
         
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': True,
+        One plain HTTPS GET instead of yt-dlp's full extraction (player JS,
+        format enumeration). Returns None if the page doesn't parse.
+        """
+        match = _VIDEO_ID_RE.search(url)
+        if not match:
+            return None
+        
+        response = requests.get(
+            f"https://www.youtube.com/watch?v={match.group(1)}",
+            headers=_WATCH_HEADERS,
+            timeout=15,
+        )
+        response.raise_for_status()
+        
+        player_match = _PLAYER_RESPONSE_RE.search(response.text)
+        if not player_match:
+            return None
+        details = json.loads(player_match.group(1)).get('videoDetails')
+        if not details:
+            return None
+        
+        description = details.get('shortDescription', '')
+        return {
+            'title': details.get('title', 'Unknown'),
+            'duration': int(details.get('lengthSeconds') or 0),
+            'uploader': details.get('author', 'Unknown'),
+            'view_count': int(details.get('viewCount') or 0),
+            'description': description[:200] + '...' if description else ''
         }
+    
+    async def get_video_info_fast(self, url: str) -> Dict[str, Any]:
+        """
+        Get video information from the watch page, without yt-dlp.
         
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            try:
-                info = ydl.extract_info(url, download=False)
-                if info is None:
-                    raise Exception("Could not extract video info")
-                return {
-                    'title': info.get('title', 'Unknown'),
-                    'duration': info.get('duration', 0),
-                    'uploader': info.get('uploader', 'Unknown'),
-                    'view_count': info.get('view_count', 0),
-                    'description': info.get('description', '')[:200] + '...' if info.get('description') else ''
-                }
-            except Exception as e:
-                console.print(f"[red]Error getting video info: {e}[/red]")
-                raise
+        The request runs in a worker thread so many lookups can be awaited
+        together. Falls back to get_video_info if the fast path fails.
+        """
+        try:
+            info = await asyncio.to_thread(self._fetch_video_info_fast, url)
+        except (requests.RequestException, ValueError) as e:
+            logger.debug("Fast info lookup failed for %s: %s", url, e)
+            info = None
+        
+        if info is None:
+            info = await asyncio.to_thread(self.get_video_info, url)
+        return info
+    
+    async def get_video_infos(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """Get video information for several URLs concurrently, in input order."""
+        return await asyncio.gather(*(self.get_video_info_fast(url) for url in urls))
     
-    def download_audio(self, url: str, output_filename: Optional[str] = None) -> str:
+    def download_audio(self, url: str, output_filename: Optional[str] = None, info: Optional[Dict[str, Any]] = None) -> str:
         """
         Download audio from YouTube video.
         
         Args:
             url: YouTube video URL
             output_filename: Optional custom filename
+            info: Video info from get_video_info, fetched if not given
             
         Returns:
             Path to downloaded audio file
         """
-        import yt_dlp
-        
         if not output_filename:
             # Generate filename from video info
-            info = self.get_video_info(url)
-            safe_title = "".join(c for c in info['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            output_filename = f"{safe_title[:50]}.mp3"
+            info = info or self.get_video_info(url)
+            safe_title = self._safe_title(info['title'])
+            output_filename = safe_title[:50]
         
         output_path = self.temp_dir / output_filename
         
+        # Keep the source audio container: Whisper decodes it directly, so
+        # re-encoding to MP3 would only cost time and disk space
         ydl_opts = {
             'format': 'bestaudio/best',
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
-            }],
-            'outtmpl': str(output_path.with_suffix('')),
+            'outtmpl': str(output_path.with_suffix('')) + '.%(ext)s',
+            'buffersize': DOWNLOAD_BUFFER_SIZE,
+            'http_chunk_size': HTTP_CHUNK_SIZE,
             'quiet': True,
             'no_warnings': True,
         }
@@ -88,17 +153,18 @@ class YouTubeDownloader(VideoDownloader):
             task = progress.add_task("Downloading audio...", total=None)
             
             try:
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([url])
+                with self._ydl(ydl_opts) as ydl:
+                    downloaded_info = self._download_with_info(ydl, url)
+                    audio_path = self._downloaded_filepath(ydl, downloaded_info)
                 
                 progress.update(task, description="✅ Audio downloaded successfully!")
-                return str(output_path)
+                return audio_path
                 
             except Exception as e:
                 progress.update(task, description=f"❌ Download failed: {e}")
                 raise
     
-    def download_captions(self, url: str, output_filename: Optional[str] = None, lang: str = "en", prefer_manual: bool = True) -> Optional[str]:
+    def download_captions(self, url: str, output_filename: Optional[str] = None, lang: str = "en", prefer_manual: bool = True, info: Optional[Dict[str, Any]] = None) -> Optional[str]:
         """
         Download closed captions (subtitles) from a YouTube video.
         Args:
@@ -106,78 +172,56 @@ class YouTubeDownloader(VideoDownloader):
             output_filename: Optional custom filename
             lang: Language code for captions (default: 'en')
             prefer_manual: Whether to prefer manual captions over auto-generated (default: True)
+            info: Video info from get_video_info, fetched if not given
         Returns:
             Path to downloaded captions file, or None if not available
         """
-        import yt_dlp
-        
-        info = self.get_video_info(url)
-        safe_title = "".join(c for c in info['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        # Further sanitize the filename to remove spaces and problematic characters
-        safe_title = safe_title.replace(' ', '_').replace('-', '_')
-        safe_title = "".join(c for c in safe_title if c.isalnum() or c == '_')
-        output_filename = output_filename or f"{safe_title[:50]}_{lang}_captions"
-        output_path = self.temp_dir / f"{output_filename}.{lang}.srt"
+        info = info or self.get_video_info(url)
+        output_filename = output_filename or self._captions_filename(info['title'], lang)
         expected_path = self.temp_dir / f"{output_filename}.{lang}.srt"
+        
+        # Diagnostics (yt-dlp output, paths, temp dir listing) only when debugging
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Attempting to download %s captions to: %s", lang, expected_path)
 
-        console.print(f"[blue]Attempting to download captions to: {expected_path}[/blue]")
+        # Check the cached extraction first so yt-dlp only runs for a track that exists
+        try:
+            full_info = self._extract_info(url)
+        except Exception as e:
+            console.print(f"[yellow]No captions found for {lang}: {e}[/yellow]")
+            return None
+        has_manual = lang in (full_info.get('subtitles') or {})
+        has_auto = lang in (full_info.get('automatic_captions') or {})
+        if not has_manual and not has_auto:
+            console.print(f"[yellow]No captions found for {lang}[/yellow]")
+            return None
 
-        # First try manual captions
         ydl_opts = {
             'skip_download': True,
-            'writesubtitles': True,
-            'writeautomaticsub': False,  # Don't write auto captions yet
+            'writesubtitles': has_manual,
+            'writeautomaticsub': has_auto and (not prefer_manual or not has_manual),
             'subtitleslangs': [lang],
             'subtitlesformat': 'srt',
             'outtmpl': str(self.temp_dir / output_filename),  # Remove .srt, yt_dlp will add it
-            'quiet': False,  # Enable output for debugging
-            'no_warnings': False,  # Show warnings for debugging
+            'quiet': not debug,
+            'no_warnings': not debug,
         }
 
-        console.print(f"[yellow]Trying manual captions for language: {lang}[/yellow]")
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            try:
-                ydl.download([url])
-                console.print(f"[blue]Download completed. Checking if file exists: {expected_path}[/blue]")
-                if expected_path.exists():
-                    console.print(f"[green]✅ Downloaded manual captions for language: {lang}[/green]")
-                    console.print(f"[green]File size: {expected_path.stat().st_size} bytes[/green]")
-                    return str(expected_path)
-                else:
-                    console.print(f"[red]❌ File not found after download: {expected_path}[/red]")
-                    # List files in temp directory to see what was actually created
-                    console.print(f"[blue]Files in temp directory: {list(self.temp_dir.glob('*'))}[/blue]")
-            except Exception as e:
-                console.print(f"[yellow]No manual captions found for {lang}: {e}[/yellow]")
-
-        # If no manual captions and we're allowed to use auto captions, try those
-        if not prefer_manual or not expected_path.exists():
-            ydl_opts = {
-                'skip_download': True,
-                'writesubtitles': False,  # Don't write manual captions
-                'writeautomaticsub': True,  # Write auto captions
-                'subtitleslangs': [lang],
-                'subtitlesformat': 'srt',
-                'outtmpl': str(self.temp_dir / output_filename),  # Remove .srt, yt_dlp will add it
-                'quiet': False,  # Enable output for debugging
-                'no_warnings': False,  # Show warnings for debugging
-            }
-
-            console.print(f"[yellow]Trying auto-generated captions for language: {lang}[/yellow]")
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                try:
-                    ydl.download([url])
-                    console.print(f"[blue]Download completed. Checking if file exists: {expected_path}[/blue]")
-                    if expected_path.exists():
-                        console.print(f"[green]✅ Downloaded auto-generated captions for language: {lang}[/green]")
-                        console.print(f"[green]File size: {expected_path.stat().st_size} bytes[/green]")
-                        return str(expected_path)
-                    else:
-                        console.print(f"[red]❌ File not found after download: {expected_path}[/red]")
-                        # List files in temp directory to see what was actually created
-                        console.print(f"[blue]Files in temp directory: {list(self.temp_dir.glob('*'))}[/blue]")
-                except Exception as e:
-                    console.print(f"[red]No auto-generated captions found for {lang}: {e}[/red]")
+        try:
+            with self._ydl(ydl_opts) as ydl:
+                self._download_with_info(ydl, url)
+            if expected_path.exists():
+                console.print(f"[green]✅ Downloaded captions for language: {lang}[/green]")
+                if debug:
+                    logger.debug("Captions file size: %d bytes", expected_path.stat().st_size)
+                return str(expected_path)
+            else:
+                console.print(f"[red]❌ File not found after download: {expected_path}[/red]")
+                if debug:
+                    logger.debug("Files in temp directory: %s", list(self.temp_dir.glob('*')))
+        except Exception as e:
+            console.print(f"[yellow]No captions found for {lang}: {e}[/yellow]")
 
         return None
     
@@ -189,27 +233,16 @@ class YouTubeDownloader(VideoDownloader):
         Returns:
             Dictionary with available captions information
         """
-        import yt_dlp
-        
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'skip_download': True,
-        }
-        
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            try:
-                info = ydl.extract_info(url, download=False)
-                if info is None:
-                    raise Exception("Could not extract video info")
-                captions = info.get('subtitles', {})
-                auto_captions = info.get('automatic_captions', {})
-                
-                return {
-                    'manual_captions': captions,
-                    'auto_captions': auto_captions,
-                    'all_languages': list(set(list(captions.keys()) + list(auto_captions.keys())))
-                }
-            except Exception as e:
-                console.print(f"[red]Error getting captions info: {e}[/red]")
-                return {'manual_captions': {}, 'auto_captions': {}, 'all_languages': []} 
\ No newline at end of file
+        try:
+            info = self._extract_info(url)
+            captions = info.get('subtitles', {})
+            auto_captions = info.get('automatic_captions', {})
+            
+            return {
+                'manual_captions': captions,
+                'auto_captions': auto_captions,
+                'all_languages': list(set(list(captions.keys()) + list(auto_captions.keys())))
+            }
+        except Exception as e:
+            console.print(f"[red]Error getting captions info: {e}[/red]")
+            return {'manual_captions': {}, 'auto_captions': {}, 'all_languages': []} 
\ No newline at end of file
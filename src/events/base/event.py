@@ -3,42 +3,101 @@ Base Event class for the event-driven system.
 """
 
 from abc import ABC
-from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional
-import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import dataclasses
+import itertools
+import json
+import os
+import sys
+
+# Keyword arguments for @dataclass giving value classes __slots__ where supported (3.10+)
+DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Event ids are "<pid>-<n>": unique within a run without a urandom call per event
+_pid = os.getpid()
+_counter = itertools.count()
+
+
+def _reset_event_ids_after_fork():
+    """Give forked worker processes their own id prefix."""
+    global _pid, _counter
+    _pid = os.getpid()
+    _counter = itertools.count()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_event_ids_after_fork)
+
+
+# Field names per class (slots along the MRO, or dataclass fields), computed once
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Return the field names of a slotted event or dataclass type."""
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        if dataclasses.is_dataclass(cls):
+            names = tuple(f.name for f in dataclasses.fields(cls))
+        else:
+            names = tuple(name for base in reversed(cls.__mro__) for name in base.__dict__.get('__slots__', ()))
+        _FIELD_NAMES[cls] = names
+    return names
+
+
+def _to_builtin(value: Any) -> Any:
+    """Convert an event field value to JSON-compatible builtins (one level of value objects)."""
+    if value is None or isinstance(value, (str, int, float, bool, dict)):
+        return value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Path):
+        return str(value)
+    to_dicts = getattr(value, 'to_dicts', None)
+    if to_dicts is not None:
+        return to_dicts()
+    if dataclasses.is_dataclass(value):
+        return {name: getattr(value, name) for name in _field_names(type(value))}
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(item) for item in value]
+    return value
 
 
-@dataclass
 class Event(ABC):
-    """Base class for all events in the system."""
+    """Base class for all events in the system.
+    
+    Events are plain slotted classes: each subclass declares its fields in
+    ``__slots__`` and sets every one of them in a single ``__init__``.
+    """
+    __slots__ = ('event_id', 'timestamp', 'source', 'metadata')
+    
     # Event identification
-    event_id: str = field(default_factory=lambda: str(uuid.uuid4()), init=False)
-    timestamp: datetime = field(default_factory=datetime.now, init=False)
+    event_id: str
+    timestamp: datetime
+    source: str
+    metadata: Dict[str, Any]
     
-    def __init__(self, *args, source: str = "", metadata: Optional[Dict[str, Any]] = None, **kwargs):
+    def __init__(self, *, source: str = "", metadata: Optional[Dict[str, Any]] = None):
+        self.event_id = f"{_pid}-{next(_counter)}"
+        self.timestamp = datetime.now()
         self.source = source
         self.metadata = metadata if metadata is not None else {}
-        super().__init__()
     
-    def __post_init__(self):
-        if not hasattr(self, 'event_id') or not self.event_id:
-            self.event_id = str(uuid.uuid4())
-        if not hasattr(self, 'timestamp') or not self.timestamp:
-            self.timestamp = datetime.now()
-        if not hasattr(self, 'metadata'):
-            self.metadata = {}
-        if not hasattr(self, 'source'):
-            self.source = ""
+    def __repr__(self) -> str:
+        fields = _field_names(type(self))
+        return f"{type(self).__name__}({', '.join(f'{name}={getattr(self, name)!r}' for name in fields)})"
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'event_id': self.event_id,
-            'timestamp': self.timestamp.isoformat(),
-            'source': self.source,
-            'metadata': self.metadata,
-            'event_type': self.__class__.__name__
-        }
+        """Return every field of the event as JSON-compatible builtins, plus ``event_type``."""
+        data = {name: _to_builtin(getattr(self, name)) for name in _field_names(type(self))}
+        data['event_type'] = type(self).__name__
+        return data
+    
+    def to_json(self) -> str:
+        """Serialize the event to a JSON string (e.g. for logs or a message queue)."""
+        return json.dumps(self.to_dict(), ensure_ascii=False, default=str)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Event':
@@ -2,9 +2,11 @@
 Event Bus for publishing and subscribing to events.
 """
 
-from collections import defaultdict
-from typing import Callable, Dict, List, Type, Any
+from collections import defaultdict, deque
+from typing import Callable, Deque, Dict, List, Tuple, Type, Any
 import logging
+import queue
+import threading
 from rich.console import Console
 
 from .event import Event
@@ -14,64 +16,154 @@ logger = logging.getLogger(__name__)
 
 
 class EventBus:
-    """Simple event bus for publishing and subscribing to events."""
+    """Simple event bus for publishing and subscribing to events.
     
-    def __init__(self):
+    Safe to share between threads: the handler registry and event history are
+    guarded by a re-entrant lock, while handlers themselves run outside of it so
+    a handler may publish follow-up events.
+    
+    By default handlers run synchronously inside ``publish``. With
+    ``async_dispatch=True`` publish only enqueues the event and background
+    worker threads run the handlers; call ``flush()`` to wait for them.
+    """
+    
+    def __init__(self, verbose: bool = False, async_dispatch: bool = False, workers: int = 2):
+        """
+        Args:
+            verbose: Print every published event to the console
+            async_dispatch: Run handlers on background worker threads
+            workers: Number of worker threads when async_dispatch is set
+        """
         self.handlers: Dict[Type[Event], List[Callable]] = defaultdict(list)
-        self.event_history: List[Event] = []
         self.max_history = 1000  # Keep last 1000 events for debugging
+        self.event_history: Deque[Event] = deque(maxlen=self.max_history)
+        self.verbose = verbose
+        self._lock = threading.RLock()
+        # Per event type: immutable (callable, name) pairs, rebuilt on (un)subscribe
+        self._handler_tuples: Dict[Type[Event], Tuple[Tuple[Callable[[Event], Any], str], ...]] = {}
+        # Per concrete event type: handlers of the type and all its bases, built on first publish
+        self._effective_cache: Dict[Type[Event], Tuple[Tuple[Callable[[Event], Any], str], ...]] = {}
+        
+        self.async_dispatch = async_dispatch
+        self._queue: "queue.Queue" = queue.Queue()
+        if async_dispatch:
+            for index in range(max(1, workers)):
+                threading.Thread(target=self._dispatch_worker, name=f"EventBus-{index}", daemon=True).start()
+    
+    @staticmethod
+    def _handler_name(handler) -> str:
+        """Name used for a handler in log messages."""
+        return getattr(handler, 'name', handler.__class__.__name__)
+    
+    def _rebuild_handlers(self, event_type: Type[Event]):
+        """Rebuild the dispatch tuple for an event type. Caller holds the lock."""
+        self._handler_tuples[event_type] = tuple(
+            (getattr(handler, 'handle', handler), self._handler_name(handler))
+            for handler in self.handlers[event_type]
+        )
+        self._effective_cache.clear()
+    
+    def _compute_effective(self, event_type: Type[Event]):
+        """Collect handlers along the event type's MRO, most specific first. Caller holds the lock."""
+        handlers = tuple(
+            entry
+            for base in event_type.__mro__
+            for entry in self._handler_tuples.get(base, ())
+        )
+        self._effective_cache[event_type] = handlers
+        return handlers
     
     def subscribe(self, event_type: Type[Event], handler: Callable[[Event], None]):
-        """Subscribe a handler to an event type."""
-        self.handlers[event_type].append(handler)
-        handler_name = getattr(handler, 'name', handler.__class__.__name__)
-        logger.info(f"Subscribed handler {handler_name} to {event_type.__name__}")
+        """
+        Subscribe a handler to an event type (and, through it, to its subclasses).
+        
+        The handler may be a plain callable or an object with a ``handle(event)``
+        method (event processors and processor plugins).
+        """
+        with self._lock:
+            self.handlers[event_type].append(handler)
+            self._rebuild_handlers(event_type)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Subscribed handler %s to %s", self._handler_name(handler), event_type.__name__)
     
     def unsubscribe(self, event_type: Type[Event], handler: Callable[[Event], None]):
         """Unsubscribe a handler from an event type."""
-        if event_type in self.handlers:
+        with self._lock:
+            if event_type not in self.handlers:
+                return
             try:
                 self.handlers[event_type].remove(handler)
-                handler_name = getattr(handler, 'name', handler.__class__.__name__)
-                logger.info(f"Unsubscribed handler {handler_name} from {event_type.__name__}")
             except ValueError:
-                handler_name = getattr(handler, 'name', handler.__class__.__name__)
-                logger.warning(f"Handler {handler_name} not found for {event_type.__name__}")
+                logger.warning("Handler %s not found for %s", self._handler_name(handler), event_type.__name__)
+                return
+            self._rebuild_handlers(event_type)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Unsubscribed handler %s from %s", self._handler_name(handler), event_type.__name__)
     
     def publish(self, event: Event):
         """Publish an event to all subscribed handlers."""
         event_type = type(event)
         
-        # Store event in history
-        self.event_history.append(event)
-        if len(self.event_history) > self.max_history:
-            self.event_history.pop(0)
+        with self._lock:
+            # Store event in history (the deque drops the oldest past max_history)
+            self.event_history.append(event)
+            
+            # The tuple is immutable, so handlers run on it without holding the lock
+            handlers = self._effective_cache.get(event_type)
+            if handlers is None:
+                handlers = self._compute_effective(event_type)
         
         # Log event
-        logger.info(f"Publishing {event_type.__name__}: {event.event_id}")
-        console.print(f"[blue]📡 Event: {event_type.__name__}[/blue]")
+        event_type_name = event_type.__name__
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Publishing %s: %s", event_type_name, event.event_id)
+        if self.verbose:
+            console.print(f"[blue]📡 Event: {event_type_name}[/blue]")
+        
+        if self.async_dispatch:
+            self._queue.put((event, handlers))
+        else:
+            self._dispatch(event, handlers)
+    
+    def _dispatch(self, event: Event, handlers: Tuple[Tuple[Callable[[Event], Any], str], ...]):
+        """Run the handlers for an event, logging (not raising) handler errors."""
+        event_type_name = type(event).__name__
         
-        # Notify all handlers
-        handlers = self.handlers.get(event_type, [])
-        for handler in handlers:
+        # Notify handlers registered for this event type or any of its base classes
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for handle, handler_name in handlers:
             try:
-                handler(event)
-                handler_name = getattr(handler, 'name', handler.__class__.__name__)
-                logger.debug(f"Handler {handler_name} processed {event_type.__name__}")
+                handle(event)
+                if debug:
+                    logger.debug("Handler %s processed %s", handler_name, event_type_name)
             except Exception as e:
-                handler_name = getattr(handler, 'name', handler.__class__.__name__)
-                logger.error(f"Error in handler {handler_name} for {event_type.__name__}: {e}")
+                logger.error("Error in handler %s for %s: %s", handler_name, event_type_name, e)
                 console.print(f"[red]❌ Handler error: {e}[/red]")
     
+    def _dispatch_worker(self):
+        """Background thread: dispatch queued events until the process exits."""
+        while True:
+            event, handlers = self._queue.get()
+            try:
+                self._dispatch(event, handlers)
+            finally:
+                self._queue.task_done()
+    
+    def flush(self):
+        """Block until every queued event (including ones published by handlers) is dispatched."""
+        self._queue.join()
+    
     def get_event_history(self, event_type: Type[Event] = None) -> List[Event]:
         """Get event history, optionally filtered by event type."""
-        if event_type:
-            return [event for event in self.event_history if isinstance(event, event_type)]
-        return self.event_history.copy()
+        with self._lock:
+            if event_type:
+                return [event for event in self.event_history if isinstance(event, event_type)]
+            return list(self.event_history)
     
     def clear_history(self):
         """Clear event history."""
-        self.event_history.clear()
+        with self._lock:
+            self.event_history.clear()
         logger.info("Event history cleared")
     
     def get_subscriber_count(self, event_type: Type[Event]) -> int:
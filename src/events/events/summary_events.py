@@ -2,25 +2,25 @@
 Summary-related events for the processing pipeline.
 """
 
-from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 
 from ..base.event import Event
 
 
-@dataclass
 class SummaryCreatedEvent(Event):
     """Event emitted when a summary has been created."""
+    __slots__ = ('video_id', 'summary_text', 'format', 'summary_style', 'summary_length', 'word_count', 'model_used', 'tokens_used', 'processing_duration', 'output_path')
+    
     video_id: str
     summary_text: str
-    format: str = "text"  # text, markdown, json, pdf
-    summary_style: str = "comprehensive"  # comprehensive, bullet_points, etc.
-    summary_length: str = "medium"  # short, medium, long
-    word_count: int = 0
-    model_used: str = ""
-    tokens_used: Optional[int] = None
-    processing_duration: float = 0.0
-    output_path: Optional[str] = None  # Path to saved summary file
+    format: str  # text, markdown, json, pdf
+    summary_style: str  # comprehensive, bullet_points, etc.
+    summary_length: str  # short, medium, long
+    word_count: int
+    model_used: str
+    tokens_used: Optional[int]
+    processing_duration: float
+    output_path: Optional[str]  # Path to saved summary file
     
     def __init__(self, video_id: str, summary_text: str, format: str = "text", summary_style: str = "comprehensive", summary_length: str = "medium", word_count: int = 0, model_used: str = "", tokens_used: Optional[int] = None, processing_duration: float = 0.0, output_path: Optional[str] = None, *, source: str = "", metadata: dict = None):
         super().__init__(source=source, metadata=metadata)
@@ -29,27 +29,22 @@ class SummaryCreatedEvent(Event):
         self.format = format
         self.summary_style = summary_style
         self.summary_length = summary_length
-        self.word_count = word_count
+        self.word_count = word_count or len(summary_text.split())
         self.model_used = model_used
         self.tokens_used = tokens_used
         self.processing_duration = processing_duration
         self.output_path = output_path
-        self.__post_init__()
-    
-    def __post_init__(self):
-        super().__post_init__()
-        if not self.word_count:
-            self.word_count = len(self.summary_text.split())
 
 
-@dataclass
 class SummaryProcessingErrorEvent(Event):
     """Event emitted when summary processing fails."""
+    __slots__ = ('video_id', 'error_message', 'error_type', 'summary_style', 'format')
+    
     video_id: str
     error_message: str
-    error_type: str = "unknown"
-    summary_style: str = "unknown"
-    format: str = "unknown"
+    error_type: str
+    summary_style: str
+    format: str
     
     def __init__(self, video_id: str, error_message: str, error_type: str = "unknown", summary_style: str = "unknown", format: str = "unknown", *, source: str = "", metadata: dict = None):
         super().__init__(source=source, metadata=metadata)
@@ -58,4 +53,3 @@ class SummaryProcessingErrorEvent(Event):
         self.error_type = error_type
         self.summary_style = summary_style
         self.format = format
-        self.__post_init__() 
\ No newline at end of file
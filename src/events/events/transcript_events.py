@@ -2,13 +2,14 @@
 Transcript-related events for the processing pipeline.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, Any, List
+from dataclasses import dataclass
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Union
+import numpy as np
 
-from ..base.event import Event
+from ..base.event import Event, DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TranscriptSegment:
     """A segment of transcribed text with timing information."""
     start: float
@@ -17,16 +18,72 @@ class TranscriptSegment:
     confidence: float = 0.0
 
 
-@dataclass
+class TranscriptSegments:
+    """Transcript segments stored column-wise (struct of arrays).
+    
+    Timings and confidences live in float32 NumPy arrays and texts in a plain
+    list, so long transcripts cost a few bytes per segment and can be filtered
+    with vector ops. Indexing and iteration still yield TranscriptSegment
+    objects for code that expects the list form.
+    """
+    __slots__ = ('starts', 'ends', 'confidences', 'texts')
+    
+    def __init__(self, starts: np.ndarray, ends: np.ndarray, texts: List[str], confidences: Optional[np.ndarray] = None):
+        self.starts = starts
+        self.ends = ends
+        self.texts = texts
+        self.confidences = confidences if confidences is not None else np.zeros(len(texts), dtype=np.float32)
+    
+    @classmethod
+    def from_dicts(cls, segments: Sequence[Dict[str, Any]]) -> 'TranscriptSegments':
+        """Bulk-build from segment dicts (extra keys such as ``words`` are ignored)."""
+        n = len(segments)
+        return cls(
+            starts=np.fromiter((seg['start'] for seg in segments), dtype=np.float32, count=n),
+            ends=np.fromiter((seg['end'] for seg in segments), dtype=np.float32, count=n),
+            texts=[seg['text'] for seg in segments],
+            confidences=np.fromiter((seg.get('confidence', 0.0) for seg in segments), dtype=np.float32, count=n),
+        )
+    
+    def __len__(self) -> int:
+        return len(self.texts)
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[TranscriptSegment, 'TranscriptSegments']:
+        if isinstance(index, slice):
+            return TranscriptSegments(self.starts[index], self.ends[index], self.texts[index], self.confidences[index])
+        return TranscriptSegment(
+            start=float(self.starts[index]),
+            end=float(self.ends[index]),
+            text=self.texts[index],
+            confidence=float(self.confidences[index]),
+        )
+    
+    def __iter__(self) -> Iterator[TranscriptSegment]:
+        for index in range(len(self)):
+            yield self[index]
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Return the segments as a list of plain dicts (the serialized form)."""
+        return [
+            {'start': start, 'end': end, 'text': text, 'confidence': confidence}
+            for start, end, text, confidence in zip(self.starts.tolist(), self.ends.tolist(), self.texts, self.confidences.tolist())
+        ]
+    
+    def __repr__(self) -> str:
+        return f"TranscriptSegments(n={len(self)})"
+
+
 class TranscriptGeneratedEvent(Event):
     """Event emitted when a transcript has been generated."""
+    __slots__ = ('video_id', 'transcript_text', 'language', 'language_probability', 'segments', 'transcription_method', 'processing_duration')
+    
     video_id: str
     transcript_text: str
-    language: str = "en"
-    language_probability: float = 0.0
-    segments: List[TranscriptSegment] = field(default_factory=list)
-    transcription_method: str = "whisper"  # whisper, captions, etc.
-    processing_duration: float = 0.0
+    language: str
+    language_probability: float
+    segments: Union[List[TranscriptSegment], TranscriptSegments]
+    transcription_method: str  # whisper, captions, etc.
+    processing_duration: float
     
     def __init__(self, video_id: str, transcript_text: str, language: str = "en", language_probability: float = 0.0, segments: List[TranscriptSegment] = None, transcription_method: str = "whisper", processing_duration: float = 0.0, *, source: str = "", metadata: dict = None):
         super().__init__(source=source, metadata=metadata)
@@ -34,25 +91,22 @@ class TranscriptGeneratedEvent(Event):
         self.transcript_text = transcript_text
         self.language = language
         self.language_probability = language_probability
+        # Store dict segments (e.g. from Whisper) column-wise
+        if segments and isinstance(segments[0], dict):
+            segments = TranscriptSegments.from_dicts(segments)
         self.segments = segments if segments is not None else []
         self.transcription_method = transcription_method
         self.processing_duration = processing_duration
-        self.__post_init__()
-    
-    def __post_init__(self):
-        super().__post_init__()
-        # Convert segments to TranscriptSegment objects if they're dicts
-        if self.segments and isinstance(self.segments[0], dict):
-            self.segments = [TranscriptSegment(**seg) for seg in self.segments]
 
 
-@dataclass
 class TranscriptProcessingErrorEvent(Event):
     """Event emitted when transcript processing fails."""
+    __slots__ = ('video_id', 'error_message', 'error_type', 'transcription_method')
+    
     video_id: str
     error_message: str
-    error_type: str = "unknown"
-    transcription_method: str = "unknown"
+    error_type: str
+    transcription_method: str
     
     def __init__(self, video_id: str, error_message: str, error_type: str = "unknown", transcription_method: str = "unknown", *, source: str = "", metadata: dict = None):
         super().__init__(source=source, metadata=metadata)
@@ -60,4 +114,3 @@ class TranscriptProcessingErrorEvent(Event):
         self.error_message = error_message
         self.error_type = error_type
         self.transcription_method = transcription_method
-        self.__post_init__() 
\ No newline at end of file
@@ -6,10 +6,10 @@ from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 from pathlib import Path
 
-from ..base.event import Event
+from ..base.event import Event, DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class VideoInfo:
     """Information about a video."""
     title: str
@@ -21,60 +21,50 @@ class VideoInfo:
     tags: list = field(default_factory=list)
 
 
-@dataclass
 class VideoDiscoveredEvent(Event):
     """Event emitted when a video is discovered (URL provided)."""
+    __slots__ = ('url', 'title', 'provider', 'video_info')
+    
     url: str
-    title: str = ""
-    provider: str = "unknown"
-    video_info: Optional[VideoInfo] = None
+    title: str
+    provider: str
+    video_info: Optional[VideoInfo]
     
     def __init__(self, url: str, title: str = "", provider: str = "unknown", video_info: Optional[VideoInfo] = None, *, source: str = "", metadata: Optional[dict] = None):
         super().__init__(source=source, metadata=metadata)
         self.url = url
-        self.title = title
+        self.title = title or (video_info.title if video_info else "")
         self.provider = provider
         self.video_info = video_info
-        self.__post_init__()
-    
-    def __post_init__(self):
-        super().__post_init__()
-        if not self.title and self.video_info:
-            self.title = self.video_info.title
 
 
-@dataclass
 class VideoDownloadedEvent(Event):
     """Event emitted when a video has been downloaded."""
+    __slots__ = ('video_id', 'audio_path', 'video_info', 'url', 'download_duration')
+    
     video_id: str
     audio_path: str
     video_info: VideoInfo
-    url: str = ""  # Original video URL
-    download_duration: float = 0.0
+    url: str  # Original video URL
+    download_duration: float
     
     def __init__(self, video_id: str, audio_path: str, video_info: VideoInfo, url: str = "", download_duration: float = 0.0, *, source: str = "", metadata: Optional[dict] = None):
         super().__init__(source=source, metadata=metadata)
         self.video_id = video_id
-        self.audio_path = audio_path
+        self.audio_path = str(audio_path) if isinstance(audio_path, Path) else audio_path
         self.video_info = video_info
         self.url = url
         self.download_duration = download_duration
-        self.__post_init__()
-    
-    def __post_init__(self):
-        super().__post_init__()
-        # Ensure audio_path is a string
-        if isinstance(self.audio_path, Path):
-            self.audio_path = str(self.audio_path)
 
 
-@dataclass
 class VideoProcessingErrorEvent(Event):
     """Event emitted when video processing fails."""
+    __slots__ = ('video_id', 'error_message', 'error_type', 'stage')
+    
     video_id: str
     error_message: str
-    error_type: str = "unknown"
-    stage: str = "unknown"  # download, transcription, etc.
+    error_type: str
+    stage: str  # download, transcription, etc.
     
     def __init__(self, video_id: str, error_message: str, error_type: str = "unknown", stage: str = "unknown", *, source: str = "", metadata: Optional[dict] = None):
         super().__init__(source=source, metadata=metadata)
@@ -82,4 +72,3 @@ class VideoProcessingErrorEvent(Event):
         self.error_message = error_message
         self.error_type = error_type
         self.stage = stage
-        self.__post_init__() 
\ No newline at end of file
@@ -3,8 +3,10 @@ Base event handler interface and common functionality.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Optional, Set
 import logging
+import threading
 from rich.console import Console
 
 from ..base.event import Event
@@ -49,11 +51,58 @@ class EventHandler(ABC):
 
 
 class EventProcessor(EventHandler):
-    """Base class for event processors that consume and produce events."""
+    """Base class for event processors that consume and produce events.
     
-    def __init__(self, event_bus, name: str = None):
+    With ``max_workers > 0`` the processor gets its own thread pool: ``handle``
+    submits the work and returns at once, so a slow download or transcription
+    does not hold up the thread that published the event. Follow-up and error
+    events are published from the pool threads. Call ``drain()`` or
+    ``shutdown()`` to wait for submitted work.
+    """
+    
+    def __init__(self, event_bus, name: str = None, max_workers: int = 0):
         super().__init__(name)
         self.event_bus = event_bus
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Set[Future] = set()
+        self._pending_lock = threading.Lock()
+        if max_workers > 0:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=self.name)
+            # The event bus looks up ``handle`` on the instance, so shadow the
+            # subclass method with one that runs it on the pool
+            self._handle_inline = self.handle
+            self.handle = self._submit
+    
+    def _submit(self, event: Event) -> Future:
+        """Run the processor's ``handle`` for an event on its thread pool."""
+        future = self._executor.submit(self._handle_inline, event)
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(lambda done: self._on_done(event, done))
+        return future
+    
+    def _on_done(self, event: Event, future: Future):
+        """Done callback: forget the future and record a failure."""
+        with self._pending_lock:
+            self._pending.discard(future)
+        error = future.exception()
+        if error is not None:
+            # The handler has already published its error event
+            self.on_error(event, error)
+    
+    def drain(self):
+        """Block until all work submitted so far has finished."""
+        while True:
+            with self._pending_lock:
+                pending = list(self._pending)
+            if not pending:
+                return
+            wait(pending)
+    
+    def shutdown(self, wait: bool = True):
+        """Stop the processor's thread pool, by default after finishing submitted work."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
     
     def publish_event(self, event: Event):
         """Publish an event to the event bus."""
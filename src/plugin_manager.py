@@ -3,17 +3,86 @@ Plugin manager for discovering, loading, and managing plugins.
 """
 
 import json
+import os
+import py_compile
+import threading
 import yaml
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Type
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
+from typing import Callable, Dict, List, Optional, Any, Tuple, Type
 
 from src.events import EventBus, Event
-from src.plugins.base.plugin_base import Plugin, ProcessorPlugin, ProviderPlugin, PluginInfo, PluginLoader
+from src.plugins.base.plugin_base import Plugin, ProcessorPlugin, ProviderPlugin, PluginInfo, PluginLoader, deferred_registration
 
-console = Console()
+# libyaml's C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# orjson parses config.json faster when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Rich is imported on first print, not at module import
+_console = None
+
+
+def _get_console():
+    """Return the module console, importing and creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+# Parsed plugin config files keyed by path, with the mtime they were read at
+_config_file_cache: Dict[str, Tuple[int, Any]] = {}
+
+
+class _DeferredPluginActivator:
+    """Stands in for a processor plugin until the first event it handles arrives."""
+    
+    def __init__(self, manager: 'PluginManager', plugin_name: str, plugin_class: Type[ProcessorPlugin], event_types: List[Type[Event]]):
+        self.name = f"deferred:{plugin_name}"
+        self.manager = manager
+        self.plugin_name = plugin_name
+        self.plugin_class = plugin_class
+        self.event_types = event_types
+        self.activated = False
+        self._lock = threading.Lock()
+    
+    def handle(self, event: Event) -> Any:
+        """Load the plugin on first use and hand it the triggering event."""
+        with self._lock:
+            if not self.activated:
+                # Build and initialize the plugin without blocking publishes; its
+                # handlers are only subscribed in the swap below
+                with deferred_registration():
+                    plugin = self.manager._build_plugin(self.plugin_name, self.plugin_class)
+                
+                # Swap this activator for the real plugin while holding the bus lock, so a
+                # concurrent publish sees exactly one of the two and never both
+                with self.manager.event_bus._lock:
+                    self.activated = True
+                    for event_type in self.event_types:
+                        self.manager.event_bus.unsubscribe(event_type, self)
+                    if plugin is not None:
+                        plugin._register_handlers()
+                
+                with self.manager._plugins_lock:
+                    self.manager._deferred_plugins.pop(self.plugin_name, None)
+                if plugin is not None:
+                    self.manager._store_plugin(self.plugin_name, plugin)
+        
+        plugin = self.manager.plugins.get(self.plugin_name)
+        if plugin is None:
+            return None
+        return plugin.handle(event)
 
 
 class PluginManager:
@@ -24,8 +93,16 @@ class PluginManager:
         self.plugins_dir = Path(plugins_dir)
         self.plugins: Dict[str, Plugin] = {}
         self.plugin_configs: Dict[str, Dict[str, Any]] = {}
-        self.enabled_plugins: List[str] = []  # Changed from disabled_plugins
+        self.enabled_plugins: Dict[str, None] = {}  # Insertion-ordered set of enabled plugin names
         self.load_all_plugins_by_default: bool = True  # Load all discovered plugins by default
+        self._deferred_plugins: Dict[str, _DeferredPluginActivator] = {}  # Processor plugins awaiting their first event
+        # Loaded plugins indexed by plugin type and base class, maintained on load/unload
+        self._by_type: Dict[str, List[Plugin]] = defaultdict(list)
+        self._processors: List[ProcessorPlugin] = []
+        self._providers: List[ProviderPlugin] = []
+        self._url_router: List[Tuple[Callable[[str], bool], ProviderPlugin]] = []  # (URL matcher, provider)
+        self._plugins_lock = threading.Lock()  # Guards plugins/_deferred_plugins during parallel loading
+        self._discovery_cache: Optional[Tuple[int, List[PluginInfo]]] = None  # (plugins_dir mtime, discovered plugins)
         
         # Create plugins directory if it doesn't exist
         self.plugins_dir.mkdir(exist_ok=True)
@@ -34,39 +111,75 @@ class PluginManager:
         self._load_plugin_configs()
     
     def discover_plugins(self) -> List[PluginInfo]:
-        """Discover all available plugins."""
+        """
+        Discover all available plugins.
+        
+        Plugin modules are not imported here when they declare their metadata
+        (manifest sidecar or ``PLUGIN_INFO`` literal); that happens in load_plugin.
+        """
         plugin_infos = []
         
-        if not self.plugins_dir.exists():
-            console.print(f"[yellow]⚠️  Plugins directory not found: {self.plugins_dir}[/yellow]")
+        try:
+            dir_mtime = self.plugins_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            _get_console().print(f"[yellow]⚠️  Plugins directory not found: {self.plugins_dir}[/yellow]")
             return plugin_infos
         
-        # Look for Python files in the plugins directory
-        for plugin_file in self.plugins_dir.glob("*.py"):
-            if plugin_file.name.startswith("_"):
-                continue  # Skip private files
-            
+        # Plugins are only added or removed by changing the directory, which bumps its mtime
+        if self._discovery_cache is not None and self._discovery_cache[0] == dir_mtime:
+            return list(self._discovery_cache[1])
+        
+        # Look for Python files in the plugins directory (one scandir pass, no extra stats)
+        with os.scandir(self.plugins_dir) as entries:
+            plugin_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(".py")
+                and not entry.name.startswith("_")  # Skip private files
+                and entry.is_file(follow_symlinks=False)
+            ]
+        
+        for plugin_file in plugin_files:
             try:
-                plugin_info = PluginLoader.load_plugin_info_from_file(plugin_file)
+                # Read the declared metadata; import the module only if there is none
+                plugin_info = (PluginLoader.load_plugin_info_from_manifest(plugin_file)
+                               or PluginLoader.load_plugin_info_from_file(plugin_file))
                 plugin_infos.append(plugin_info)
-                console.print(f"[green]✅ Discovered plugin: {plugin_info.name} v{plugin_info.version}[/green]")
+                _get_console().print(f"[green]✅ Discovered plugin: {plugin_info.name} v{plugin_info.version}[/green]")
             except Exception as e:
-                console.print(f"[red]❌ Failed to load plugin {plugin_file.name}: {e}[/red]")
+                _get_console().print(f"[red]❌ Failed to load plugin {plugin_file.name}: {e}[/red]")
         
-        return plugin_infos
+        self._discovery_cache = (dir_mtime, plugin_infos)
+        return list(plugin_infos)
     
     def load_plugin(self, plugin_name: str, config: Optional[Dict[str, Any]] = None) -> bool:
         """Load a specific plugin by name."""
+        self._discovery_cache = None
         plugin_file = self.plugins_dir / f"{plugin_name}.py"
         
         if not plugin_file.exists():
-            console.print(f"[red]❌ Plugin file not found: {plugin_file}[/red]")
+            _get_console().print(f"[red]❌ Plugin file not found: {plugin_file}[/red]")
             return False
         
         try:
             # Load plugin class
             plugin_class = PluginLoader.load_plugin_from_file(plugin_file)
-            
+        except Exception as e:
+            _get_console().print(f"[red]❌ Failed to load plugin {plugin_name}: {e}[/red]")
+            return False
+        
+        return self._create_plugin(plugin_name, plugin_class, config)
+    
+    def _create_plugin(self, plugin_name: str, plugin_class: Type[Plugin], config: Optional[Dict[str, Any]] = None) -> bool:
+        """Instantiate, initialize and register a loaded plugin class."""
+        plugin = self._build_plugin(plugin_name, plugin_class, config)
+        if plugin is None:
+            return False
+        self._store_plugin(plugin_name, plugin)
+        return True
+    
+    def _build_plugin(self, plugin_name: str, plugin_class: Type[Plugin], config: Optional[Dict[str, Any]] = None) -> Optional[Plugin]:
+        """Instantiate and initialize a loaded plugin class, or return None if that fails."""
+        try:
             # Get plugin configuration
             plugin_config = config or self.plugin_configs.get(plugin_name, {})
             
@@ -75,110 +188,178 @@ class PluginManager:
             
             # Initialize plugin
             if not plugin.initialize():
-                console.print(f"[red]❌ Failed to initialize plugin: {plugin_name}[/red]")
-                return False
+                _get_console().print(f"[red]❌ Failed to initialize plugin: {plugin_name}[/red]")
+                return None
             
-            # Store plugin
-            self.plugins[plugin_name] = plugin
-            
-            console.print(f"[green]✅ Loaded plugin: {plugin_name}[/green]")
-            return True
+            return plugin
             
         except Exception as e:
-            console.print(f"[red]❌ Failed to load plugin {plugin_name}: {e}[/red]")
+            _get_console().print(f"[red]❌ Failed to load plugin {plugin_name}: {e}[/red]")
+            return None
+    
+    def _store_plugin(self, plugin_name: str, plugin: Plugin) -> None:
+        """Record an initialized plugin as loaded."""
+        with self._plugins_lock:
+            self.plugins[plugin_name] = plugin
+            self._index_plugin(plugin)
+        
+        _get_console().print(f"[green]✅ Loaded plugin: {plugin_name}[/green]")
+    
+    def defer_plugin(self, plugin_name: str) -> bool:
+        """
+        Register a processor plugin to be loaded on the first event it handles.
+        
+        Until then only a lightweight activator is subscribed, so unused
+        processors are never instantiated or initialized.
+        """
+        plugin_file = self.plugins_dir / f"{plugin_name}.py"
+        
+        try:
+            plugin_class = PluginLoader.load_plugin_from_file(plugin_file)
+            event_types = plugin_class.get_event_types()
+        except Exception as e:
+            _get_console().print(f"[red]❌ Failed to load plugin {plugin_name}: {e}[/red]")
             return False
+        
+        activator = _DeferredPluginActivator(self, plugin_name, plugin_class, event_types)
+        for event_type in event_types:
+            self.event_bus.subscribe(event_type, activator)
+        with self._plugins_lock:
+            self._deferred_plugins[plugin_name] = activator
+        
+        _get_console().print(f"[green]✅ Deferred plugin until first event: {plugin_name}[/green]")
+        return True
     
-    def load_all_plugins(self) -> Dict[str, bool]:
-        """Load all discovered plugins."""
+    def load_all_plugins(self, lazy: bool = False) -> Dict[str, bool]:
+        """
+        Load all discovered plugins.
+        
+        Args:
+            lazy: Defer processor plugins until the first event they handle
+                  (provider plugins are always loaded, they are needed for URL matching)
+        """
         results = {}
         plugin_infos = self.discover_plugins()
         
+        # Decide what to load up front (the enabled list grows as plugins load)
+        load_all = not self.enabled_plugins  # If no enabled list, load all
+        to_load = []
         for plugin_info in plugin_infos:
-            # Check if plugin should be loaded based on enabled list
-            should_load = (not self.enabled_plugins or  # If no enabled list, load all
-                          plugin_info.name in self.enabled_plugins)  # Or if explicitly enabled
-            
-            if not should_load:
-                console.print(f"[yellow]⏭️  Skipping disabled plugin: {plugin_info.name}[/yellow]")
+            if load_all or plugin_info.name in self.enabled_plugins:  # Or if explicitly enabled
+                to_load.append(plugin_info)
+            else:
+                _get_console().print(f"[yellow]⏭️  Skipping disabled plugin: {plugin_info.name}[/yellow]")
                 results[plugin_info.name] = False
-                continue
-            
-            success = self.load_plugin(plugin_info.name)
-            results[plugin_info.name] = success
-            
-            # Add to enabled list if successfully loaded and not already there
-            if success and plugin_info.name not in self.enabled_plugins:
-                self.enabled_plugins.append(plugin_info.name)
+        
+        def load(plugin_info: PluginInfo) -> bool:
+            if lazy and plugin_info.plugin_type == "processor":
+                return self.defer_plugin(plugin_info.name)
+            return self.load_plugin(plugin_info.name)
+        
+        # Imports and initialize() calls are mostly I/O (disk, credentials), so overlap them
+        if to_load:
+            with ThreadPoolExecutor(max_workers=min(8, len(to_load))) as executor:
+                futures = {executor.submit(load, plugin_info): plugin_info.name for plugin_info in to_load}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+        
+        # Add to enabled list if successfully loaded (in discovery order)
+        for plugin_info in to_load:
+            if results[plugin_info.name]:
+                self.enabled_plugins[plugin_info.name] = None
         
         return results
     
     def unload_plugin(self, plugin_name: str) -> bool:
         """Unload a plugin."""
         if plugin_name not in self.plugins:
-            console.print(f"[yellow]⚠️  Plugin not loaded: {plugin_name}[/yellow]")
+            _get_console().print(f"[yellow]⚠️  Plugin not loaded: {plugin_name}[/yellow]")
             return False
         
+        self._discovery_cache = None
         try:
             plugin = self.plugins[plugin_name]
             plugin.cleanup()
-            del self.plugins[plugin_name]
+            with self._plugins_lock:
+                del self.plugins[plugin_name]
+                self._unindex_plugin(plugin)
             
-            console.print(f"[green]✅ Unloaded plugin: {plugin_name}[/green]")
+            _get_console().print(f"[green]✅ Unloaded plugin: {plugin_name}[/green]")
             return True
             
         except Exception as e:
-            console.print(f"[red]❌ Failed to unload plugin {plugin_name}: {e}[/red]")
+            _get_console().print(f"[red]❌ Failed to unload plugin {plugin_name}: {e}[/red]")
             return False
     
     def get_plugin(self, plugin_name: str) -> Optional[Plugin]:
         """Get a loaded plugin by name."""
         return self.plugins.get(plugin_name)
     
+    def _index_plugin(self, plugin: Plugin) -> None:
+        """Add a plugin to the type buckets. Caller holds the plugins lock."""
+        self._by_type[plugin.plugin_info.plugin_type].append(plugin)
+        if isinstance(plugin, ProcessorPlugin):
+            self._processors.append(plugin)
+        if isinstance(plugin, ProviderPlugin):
+            self._providers.append(plugin)
+            self._url_router.append((plugin.matches_url, plugin))
+    
+    def _unindex_plugin(self, plugin: Plugin) -> None:
+        """Remove a plugin from the type buckets. Caller holds the plugins lock."""
+        for bucket in (self._by_type[plugin.plugin_info.plugin_type], self._processors, self._providers):
+            if plugin in bucket:
+                bucket.remove(plugin)
+        self._url_router = [route for route in self._url_router if route[1] is not plugin]
+    
     def get_plugins_by_type(self, plugin_type: str) -> List[Plugin]:
         """Get all plugins of a specific type."""
-        return [plugin for plugin in self.plugins.values() 
-                if plugin.plugin_info.plugin_type == plugin_type]
+        return list(self._by_type.get(plugin_type, ()))
     
     def get_processor_plugins(self) -> List[ProcessorPlugin]:
         """Get all processor plugins."""
-        return [plugin for plugin in self.plugins.values() 
-                if isinstance(plugin, ProcessorPlugin)]
+        return list(self._processors)
     
     def get_provider_plugins(self) -> List[ProviderPlugin]:
         """Get all provider plugins."""
-        return [plugin for plugin in self.plugins.values() 
-                if isinstance(plugin, ProviderPlugin)]
+        return list(self._providers)
+    
+    def route_url(self, url: str) -> Optional[ProviderPlugin]:
+        """Return the first loaded provider whose URL patterns match the URL, or None."""
+        for matches, provider in self._url_router:
+            if matches(url):
+                return provider
+        return None
     
     def enable_plugin(self, plugin_name: str) -> bool:
         """Enable a plugin."""
         if plugin_name in self.plugins:
             self.plugins[plugin_name].enable()
-            if plugin_name not in self.enabled_plugins:
-                self.enabled_plugins.append(plugin_name)
-            console.print(f"[green]✅ Enabled plugin: {plugin_name}[/green]")
+            self.enabled_plugins[plugin_name] = None
+            _get_console().print(f"[green]✅ Enabled plugin: {plugin_name}[/green]")
             return True
         else:
-            console.print(f"[red]❌ Plugin not found: {plugin_name}[/red]")
+            _get_console().print(f"[red]❌ Plugin not found: {plugin_name}[/red]")
             return False
     
     def disable_plugin(self, plugin_name: str) -> bool:
         """Disable a plugin."""
         if plugin_name in self.plugins:
             self.plugins[plugin_name].disable()
-            if plugin_name in self.enabled_plugins:
-                self.enabled_plugins.remove(plugin_name)
-            console.print(f"[yellow]⚠️  Disabled plugin: {plugin_name}[/yellow]")
+            self.enabled_plugins.pop(plugin_name, None)
+            _get_console().print(f"[yellow]⚠️  Disabled plugin: {plugin_name}[/yellow]")
             return True
         else:
-            console.print(f"[red]❌ Plugin not found: {plugin_name}[/red]")
+            _get_console().print(f"[red]❌ Plugin not found: {plugin_name}[/red]")
             return False
     
     def list_plugins(self) -> None:
         """List all loaded plugins."""
         if not self.plugins:
-            console.print("[yellow]No plugins loaded[/yellow]")
+            _get_console().print("[yellow]No plugins loaded[/yellow]")
             return
         
+        from rich.table import Table
+        
         table = Table(title="Loaded Plugins")
         table.add_column("Name", style="cyan")
         table.add_column("Type", style="magenta")
@@ -206,61 +387,105 @@ class PluginManager:
                 plugin.plugin_info.description[:40] + "..." if len(plugin.plugin_info.description) > 40 else plugin.plugin_info.description
             )
         
-        console.print(table)
+        _get_console().print(table)
         
         # Show configuration info
-        console.print(f"\n[bold]Configuration:[/bold]")
-        console.print(f"  Load all plugins by default: {'✅ Yes' if self.load_all_plugins_by_default else '❌ No'}")
-        console.print(f"  Enabled plugins in config: {len(self.enabled_plugins)}")
+        _get_console().print(f"\n[bold]Configuration:[/bold]")
+        _get_console().print(f"  Load all plugins by default: {'✅ Yes' if self.load_all_plugins_by_default else '❌ No'}")
+        _get_console().print(f"  Enabled plugins in config: {len(self.enabled_plugins)}")
         if self.enabled_plugins:
-            console.print(f"  Enabled: {', '.join(self.enabled_plugins)}")
+            _get_console().print(f"  Enabled: {', '.join(self.enabled_plugins)}")
+    
+    def _config_file(self) -> Path:
+        """Return the plugin config file: config.json if present, else config.yaml."""
+        json_file = self.plugins_dir / "config.json"
+        return json_file if json_file.exists() else self.plugins_dir / "config.yaml"
     
     def _load_plugin_configs(self) -> None:
         """Load plugin configurations from config files."""
-        config_file = self.plugins_dir / "config.yaml"
+        config_file = self._config_file()
         
         if config_file.exists():
             try:
-                with open(config_file, 'r') as f:
-                    config_data = yaml.safe_load(f)
+                # Parse the file once per modification, however many managers read it
+                cache_key = str(config_file.resolve())
+                mtime = config_file.stat().st_mtime_ns
+                cached = _config_file_cache.get(cache_key)
+                if cached is not None and cached[0] == mtime:
+                    config_data = cached[1]
+                else:
+                    if config_file.suffix == '.json':
+                        raw = config_file.read_bytes()
+                        config_data = orjson.loads(raw) if orjson else json.loads(raw)
+                    else:
+                        with open(config_file, 'r') as f:
+                            config_data = yaml.load(f, Loader=SafeLoader)
+                    _config_file_cache[cache_key] = (mtime, config_data)
                 
                 if config_data:
-                    # Load plugin-specific configurations
+                    # Load plugin-specific configurations (copied, plugins may modify theirs)
                     if 'plugins' in config_data:
                         for plugin_name, config in config_data['plugins'].items():
-                            self.plugin_configs[plugin_name] = config
+                            self.plugin_configs[plugin_name] = dict(config or {})
                     
                     # Load enabled plugins list
                     if 'enabled_plugins' in config_data:
-                        self.enabled_plugins = config_data['enabled_plugins']
+                        self.enabled_plugins = dict.fromkeys(config_data['enabled_plugins'] or ())
                     
                     # Load load-all-by-default setting
                     if 'load_all_plugins_by_default' in config_data:
                         self.load_all_plugins_by_default = config_data['load_all_plugins_by_default']
                 
-                console.print(f"[green]✅ Loaded plugin configurations from {config_file}[/green]")
+                _get_console().print(f"[green]✅ Loaded plugin configurations from {config_file}[/green]")
                 
             except Exception as e:
-                console.print(f"[red]❌ Failed to load plugin configs: {e}[/red]")
+                _get_console().print(f"[red]❌ Failed to load plugin configs: {e}[/red]")
     
     def save_plugin_configs(self) -> None:
         """Save plugin configurations to config file."""
-        config_file = self.plugins_dir / "config.yaml"
+        config_file = self._config_file()
         
         try:
             config_data = {
                 'plugins': self.plugin_configs,
-                'enabled_plugins': self.enabled_plugins,
+                'enabled_plugins': list(self.enabled_plugins),
                 'load_all_plugins_by_default': self.load_all_plugins_by_default
             }
             
             with open(config_file, 'w') as f:
-                yaml.dump(config_data, f, default_flow_style=False)
+                if config_file.suffix == '.json':
+                    json.dump(config_data, f, indent=2)
+                else:
+                    yaml.dump(config_data, f, Dumper=SafeDumper, default_flow_style=False)
+            self._discovery_cache = None
+            
+            _get_console().print(f"[green]✅ Saved plugin configurations to {config_file}[/green]")
             
-            console.print(f"[green]✅ Saved plugin configurations to {config_file}[/green]")
+            # Refresh plugin bytecode alongside the config, so the next start skips compiling
+            self.compile_plugins()
             
         except Exception as e:
-            console.print(f"[red]❌ Failed to save plugin configs: {e}[/red]")
+            _get_console().print(f"[red]❌ Failed to save plugin configs: {e}[/red]")
+    
+    def compile_plugins(self) -> int:
+        """
+        Write up-to-date ``__pycache__`` bytecode for every plugin file.
+        
+        Plugin modules are loaded through importlib's source loader, which
+        uses the cached bytecode when its timestamp matches and only parses
+        and compiles otherwise. Compiling ahead of time keeps that off startup,
+        including where the process can't write ``__pycache__`` itself.
+        
+        Returns:
+            Number of plugin files compiled
+        """
+        compiled = 0
+        with os.scandir(self.plugins_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".py") and entry.is_file(follow_symlinks=False):
+                    if py_compile.compile(entry.path, doraise=False, quiet=1):
+                        compiled += 1
+        return compiled
     
     def get_plugin_status(self) -> Dict[str, Any]:
         """Get status information about all plugins."""
@@ -268,8 +493,8 @@ class PluginManager:
             'total_plugins': len(self.plugins),
             'enabled_plugins': len([p for p in self.plugins.values() if p.is_enabled]),
             'disabled_plugins': len([p for p in self.plugins.values() if not p.is_enabled]),
-            'processor_plugins': len(self.get_processor_plugins()),
-            'provider_plugins': len(self.get_provider_plugins()),
+            'processor_plugins': len(self._processors),
+            'provider_plugins': len(self._providers),
             'load_all_by_default': self.load_all_plugins_by_default,
             'plugins': {
                 name: {
@@ -295,11 +520,11 @@ class PluginManager:
     def set_load_all_plugins_by_default(self, enabled: bool) -> None:
         """Set whether all discovered plugins should be loaded by default."""
         self.load_all_plugins_by_default = enabled
-        console.print(f"[green]✅ Load all plugins by default: {'enabled' if enabled else 'disabled'}[/green]")
+        _get_console().print(f"[green]✅ Load all plugins by default: {'enabled' if enabled else 'disabled'}[/green]")
     
     def get_enabled_plugins_list(self) -> List[str]:
         """Get list of enabled plugin names."""
-        return self.enabled_plugins.copy()
+        return list(self.enabled_plugins)
     
     def get_disabled_plugins_list(self) -> List[str]:
         """Get list of disabled plugin names."""
@@ -3,30 +3,82 @@ Base classes for the plugin system.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Dict, Any, List, Optional, Type
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import Dict, Any, List, Mapping, Optional, Pattern, Sequence, Tuple, Type
 from pathlib import Path
+from types import MappingProxyType
+import ast
 import importlib.util
 import inspect
+import re
+import threading
+import yaml
 
 from src.events import EventBus, Event
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
-@dataclass
+
+@dataclass(frozen=True)
 class PluginInfo:
-    """Information about a plugin."""
+    """Information about a plugin.
+    
+    Immutable, so plugins can build theirs once at import time and share it:
+    ``config_schema`` is exposed read-only and ``dependencies`` as a tuple.
+    """
     name: str
     version: str
     description: str
     author: str
     plugin_type: str  # "processor" or "provider"
     entry_point: str  # Class name to instantiate
-    config_schema: Optional[Dict[str, Any]] = None
-    dependencies: List[str] = None
+    config_schema: Optional[Mapping[str, Any]] = field(default=None, hash=False)
+    dependencies: Tuple[str, ...] = ()
     
     def __post_init__(self):
-        if self.dependencies is None:
-            self.dependencies = []
+        if isinstance(self.config_schema, dict):
+            object.__setattr__(self, 'config_schema', MappingProxyType(self.config_schema))
+        object.__setattr__(self, 'dependencies', tuple(self.dependencies or ()))
+
+
+# Python types accepted for each config_schema "type"
+_SCHEMA_TYPES = {
+    'string': str,
+    'boolean': bool,
+    'integer': int,
+    'float': (int, float),
+}
+
+# A module-level ``PLUGIN_INFO = {...}`` literal, closed by a brace in column 0
+_PLUGIN_INFO_RE = re.compile(r'^PLUGIN_INFO\s*=\s*(\{.*?^\})', re.M | re.S)
+
+# Set on a thread while it builds processor plugins whose handlers are subscribed later
+_registration = threading.local()
+
+
+@contextmanager
+def deferred_registration():
+    """Build processor plugins on this thread without subscribing their handlers.
+    
+    The caller subscribes them with ``_register_handlers()`` once they are
+    initialized, so the bus never dispatches to a half-built plugin.
+    """
+    _registration.deferred = True
+    try:
+        yield
+    finally:
+        _registration.deferred = False
+
+
+@lru_cache(maxsize=None)
+def _compile_url_pattern(patterns: Tuple[str, ...]) -> Pattern:
+    """Compile a provider's URL patterns into one alternation, once per distinct pattern set."""
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
 
 
 class Plugin(ABC):
@@ -35,12 +87,17 @@ class Plugin(ABC):
     def __init__(self, event_bus: EventBus, config: Optional[Dict[str, Any]] = None):
         self.event_bus = event_bus
         self.config = config or {}
-        self.plugin_info = self.get_plugin_info()
         self._enabled = True
     
+    @cached_property
+    def plugin_info(self) -> PluginInfo:
+        """Plugin information, built on first access."""
+        return self.get_plugin_info()
+    
+    @classmethod
     @abstractmethod
-    def get_plugin_info(self) -> PluginInfo:
-        """Return plugin information."""
+    def get_plugin_info(cls) -> PluginInfo:
+        """Return plugin information (static, so no instance is needed)."""
         pass
     
     def initialize(self) -> bool:
@@ -64,6 +121,31 @@ class Plugin(ABC):
         """Check if plugin is enabled."""
         return self._enabled
     
+    def validate_config(self) -> Dict[str, Any]:
+        """
+        Check the config against the plugin's config_schema once.
+        
+        Returns:
+            The config with schema defaults filled in for missing keys
+            
+        Raises:
+            ValueError: If a configured value has the wrong type or is not one of its choices
+        """
+        resolved = dict(self.config)
+        for key, spec in (self.plugin_info.config_schema or {}).items():
+            if key not in resolved or resolved[key] is None:
+                if 'default' in spec:
+                    resolved[key] = spec['default']
+                continue
+            
+            value = resolved[key]
+            expected = _SCHEMA_TYPES.get(spec.get('type'))
+            if expected is not None and (not isinstance(value, expected) or (expected is not bool and isinstance(value, bool))):
+                raise ValueError(f"Config '{key}' must be of type {spec['type']}, got {value!r}")
+            if 'choices' in spec and value not in spec['choices']:
+                raise ValueError(f"Config '{key}' must be one of {spec['choices']}, got {value!r}")
+        return resolved
+    
     def get_config(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
         return self.config.get(key, default)
@@ -78,12 +160,18 @@ class ProcessorPlugin(Plugin):
     
     def __init__(self, event_bus: EventBus, config: Optional[Dict[str, Any]] = None):
         super().__init__(event_bus, config)
-        self.event_types = self.get_event_types()
-        self._register_handlers()
+        if not getattr(_registration, 'deferred', False):
+            self._register_handlers()
     
+    @cached_property
+    def event_types(self) -> List[Type[Event]]:
+        """Event types this processor handles, built on first access."""
+        return self.get_event_types()
+    
+    @classmethod
     @abstractmethod
-    def get_event_types(self) -> List[Type[Event]]:
-        """Return list of event types this processor handles."""
+    def get_event_types(cls) -> List[Type[Event]]:
+        """Return list of event types this processor handles (static, so no instance is needed)."""
         pass
     
     def _register_handlers(self) -> None:
@@ -106,15 +194,30 @@ class ProcessorPlugin(Plugin):
 class ProviderPlugin(Plugin):
     """Base class for provider plugins."""
     
+    # Substrings (host names) every supported URL contains; URLs without any of
+    # them are rejected before the regex runs. Empty disables the check.
+    _URL_HOSTS: Tuple[str, ...] = ()
+    
     def __init__(self, event_bus: EventBus, config: Optional[Dict[str, Any]] = None):
         super().__init__(event_bus, config)
         self.supported_urls = self.get_supported_urls()
     
     @abstractmethod
-    def get_supported_urls(self) -> List[str]:
-        """Return list of URL patterns this provider supports."""
+    def get_supported_urls(self) -> Sequence[str]:
+        """Return the URL patterns this provider supports (ideally a class-level tuple)."""
         pass
     
+    @cached_property
+    def url_pattern(self) -> Pattern:
+        """All supported URL patterns compiled into a single alternation."""
+        return _compile_url_pattern(tuple(self.supported_urls))
+    
+    def matches_url(self, url: str) -> bool:
+        """Check a URL against the supported patterns, rejecting other hosts cheaply first."""
+        if self._URL_HOSTS and not any(host in url for host in self._URL_HOSTS):
+            return False
+        return self.url_pattern.match(url) is not None
+    
     @abstractmethod
     def can_handle_url(self, url: str) -> bool:
         """Check if this provider can handle the given URL."""
@@ -166,12 +269,28 @@ class PluginLoader:
     def load_plugin_info_from_file(file_path: Path) -> PluginInfo:
         """Load plugin information from a plugin file."""
         plugin_class = PluginLoader.load_plugin_from_file(file_path)
+        return plugin_class.get_plugin_info()
+    
+    @staticmethod
+    def load_plugin_info_from_manifest(file_path: Path) -> Optional[PluginInfo]:
+        """
+        Read plugin information without importing the plugin module.
+        
+        Tries a ``<plugin>.manifest.yaml`` sidecar first, then a ``PLUGIN_INFO``
+        dict literal in the plugin source.
         
-        # Create a temporary instance to get plugin info
-        # We'll use a mock event bus for this
-        class MockEventBus:
-            def subscribe(self, event_type, handler):
-                pass
+        Returns:
+            PluginInfo, or None if the plugin declares neither
+        """
+        manifest_file = file_path.with_suffix('.manifest.yaml')
+        if manifest_file.exists():
+            with open(manifest_file, 'r') as f:
+                return PluginInfo(**yaml.load(f, Loader=SafeLoader))
         
-        temp_plugin = plugin_class(MockEventBus())
-        return temp_plugin.get_plugin_info() 
\ No newline at end of file
+        match = _PLUGIN_INFO_RE.search(file_path.read_text(encoding='utf-8'))
+        if match:
+            try:
+                return PluginInfo(**ast.literal_eval(match.group(1)))
+            except (ValueError, SyntaxError, TypeError):
+                return None
+        return None
@@ -3,211 +3,345 @@ Google Drive upload processor plugin.
 Uploads transcript and summary files to Google Drive.
 """
 
+import io
 import os
-from pathlib import Path
-from typing import List, Optional
-from rich.console import Console
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from src.plugins.base.plugin_base import ProcessorPlugin, PluginInfo
 from src.events import TranscriptGeneratedEvent, SummaryCreatedEvent
 from src.config import Config
 
-console = Console()
+# Rich is imported on first print, not at module import
+_console = None
+
+
+def _get_console():
+    """Return the module console, importing and creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+# Plugin metadata as a plain literal, so discovery can read it without importing
+PLUGIN_INFO = {
+    "name": "google_drive_uploader",
+    "version": "1.0.0",
+    "description": "Uploads transcript and summary files to Google Drive",
+    "author": "YouTube Summarizer Team",
+    "plugin_type": "processor",
+    "entry_point": "GoogleDriveUploader",
+    "config_schema": {
+        "folder_id": {"type": "string", "required": True, "description": "Google Drive folder ID"},
+        "upload_transcripts": {"type": "boolean", "default": True},
+        "upload_summaries": {"type": "boolean", "default": True},
+        "create_subfolders": {"type": "boolean", "default": True}
+    }
+}
+
+_PLUGIN_INFO = PluginInfo(**PLUGIN_INFO)
 
 
 class GoogleDriveUploader(ProcessorPlugin):
     """Google Drive upload processor plugin."""
     
-    def get_plugin_info(self) -> PluginInfo:
-        return PluginInfo(
-            name="google_drive_uploader",
-            version="1.0.0",
-            description="Uploads transcript and summary files to Google Drive",
-            author="YouTube Summarizer Team",
-            plugin_type="processor",
-            entry_point="GoogleDriveUploader",
-            config_schema={
-                "folder_id": {"type": "string", "required": True, "description": "Google Drive folder ID"},
-                "upload_transcripts": {"type": "boolean", "default": True},
-                "upload_summaries": {"type": "boolean", "default": True},
-                "create_subfolders": {"type": "boolean", "default": True}
-            }
-        )
+    @classmethod
+    def get_plugin_info(cls) -> PluginInfo:
+        return _PLUGIN_INFO
+    
+    # Google API client pieces, imported once by _lazy_google_imports()
+    _build = None
+    _MediaFileUpload = None
+    _MediaIoBaseUpload = None
+    _Credentials = None
+    _Request = None
+    _AuthorizedHttp = None
+    _Http = None
+    
+    @classmethod
+    def _lazy_google_imports(cls) -> None:
+        """Import the Google API client modules once and keep them on the class."""
+        if cls._build is not None:
+            return
+        from googleapiclient.discovery import build
+        from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
+        from google.oauth2.credentials import Credentials
+        from google.auth.transport.requests import Request
+        from google_auth_httplib2 import AuthorizedHttp
+        from httplib2 import Http
+        
+        cls._MediaFileUpload = staticmethod(MediaFileUpload)
+        cls._MediaIoBaseUpload = staticmethod(MediaIoBaseUpload)
+        cls._Credentials = Credentials
+        cls._Request = Request
+        cls._AuthorizedHttp = staticmethod(AuthorizedHttp)
+        cls._Http = staticmethod(Http)
+        cls._build = staticmethod(build)
     
-    def get_event_types(self) -> List[type]:
+    def initialize(self) -> bool:
+        """Import the Google API client and set up the Drive service and folder caches."""
+        try:
+            self._lazy_google_imports()
+        except ImportError as e:
+            _get_console().print(f"[red]❌ Google API client libraries not installed: {e}[/red]")
+            return False
+        
+        # Validate the config once and keep the settings as attributes for the per-event checks
+        try:
+            config = self.validate_config()
+        except ValueError as e:
+            _get_console().print(f"[red]❌ Invalid Google Drive uploader config: {e}[/red]")
+            return False
+        self._folder_id: Optional[str] = config.get("folder_id")
+        self._upload_transcripts: bool = config["upload_transcripts"]
+        self._upload_summaries: bool = config["upload_summaries"]
+        self._create_subfolders: bool = config["create_subfolders"]
+        
+        self._service = None
+        self._credentials = None
+        self._service_lock = threading.Lock()
+        self._local = threading.local()  # per-thread HTTP transport
+        self._folder_lock = threading.Lock()
+        self._folder_ids: Dict[Tuple[str, str], str] = {}  # (folder name, parent id) -> folder id
+        # Exact event type -> upload method
+        self._handlers = {
+            TranscriptGeneratedEvent: self._upload_transcript,
+            SummaryCreatedEvent: self._upload_summary,
+        }
+        return True
+    
+    def _get_service(self):
+        """
+        Return the Drive API service, building it once.
+        
+        build() parses the API discovery document, so it is far too expensive
+        to repeat for every upload. The service is shared across threads, so
+        its requests are executed with ``_get_http()`` rather than the
+        service's own transport. Returns None if credentials are missing.
+        """
+        with self._service_lock:
+            if self._service is None:
+                creds = self._get_credentials()
+                if creds is None:
+                    return None
+                self._service = self._build('drive', 'v3', credentials=creds, cache_discovery=False, static_discovery=True)
+                self._credentials = creds
+            return self._service
+    
+    def _get_http(self):
+        """Return this thread's authorized HTTP transport (httplib2 is not thread-safe)."""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = self._local.http = self._AuthorizedHttp(self._credentials, http=self._Http())
+        return http
+    
+    @classmethod
+    def get_event_types(cls) -> List[type]:
         """Return the event types this processor handles."""
         return [TranscriptGeneratedEvent, SummaryCreatedEvent]
     
     def process_event(self, event) -> None:
         """Process events and upload files to Google Drive."""
-        if isinstance(event, TranscriptGeneratedEvent):
-            self._upload_transcript(event)
-        elif isinstance(event, SummaryCreatedEvent):
-            self._upload_summary(event)
+        handler = self._handlers.get(type(event))
+        if handler is not None:
+            handler(event)
     
     def _upload_transcript(self, event: TranscriptGeneratedEvent) -> None:
         """Upload transcript file to Google Drive."""
-        if not self.config.get("upload_transcripts", True):
+        if not self._upload_transcripts:
             return
         
         try:
-            # For now, we'll save the transcript text to a file and then upload
-            # In a real implementation, you might want to modify the transcription processor
-            # to save the transcript to a file and include the path in the event
-            
-            # Create a temporary transcript file
-            transcript_dir = Config.TEMP_DIR or "./temp"
             transcript_filename = f"{event.video_id}_transcript.txt"
-            transcript_path = Path(transcript_dir) / transcript_filename
-            
-            # Save transcript text to file
-            with open(transcript_path, 'w', encoding='utf-8') as f:
-                f.write(event.transcript_text)
             
             # Upload to Google Drive
-            folder_id = self.config.get("folder_id")
+            folder_id = self._folder_id
             if not folder_id:
-                console.print("[red]❌ Google Drive folder ID not configured[/red]")
+                _get_console().print("[red]❌ Google Drive folder ID not configured[/red]")
                 return
             
             # Create subfolder if enabled
-            if self.config.get("create_subfolders", True):
+            if self._create_subfolders:
                 folder_name = f"Transcripts_{event.video_id}"
-                folder_id = self._create_or_get_folder(folder_name, folder_id)
+                folder_id = self._create_or_get_folder(folder_name, folder_id, self._video_folder_names(event.video_id))
             
-            # Upload file
-            file_id = self._upload_file(str(transcript_path), folder_id)
+            # Upload the transcript text straight from memory (no temp file)
+            media = self._MediaIoBaseUpload(
+                io.BytesIO(event.transcript_text.encode('utf-8')),
+                mimetype='text/plain',
+                resumable=True
+            )
+            file_id = self._upload_media(transcript_filename, media, folder_id)
             if file_id:
-                console.print(f"[green]✅ Transcript uploaded to Google Drive: {file_id}[/green]")
+                _get_console().print(f"[green]✅ Transcript uploaded to Google Drive: {file_id}[/green]")
             else:
-                console.print(f"[red]❌ Failed to upload transcript[/red]")
+                _get_console().print(f"[red]❌ Failed to upload transcript[/red]")
                 
         except Exception as e:
-            console.print(f"[red]❌ Error uploading transcript: {e}[/red]")
+            _get_console().print(f"[red]❌ Error uploading transcript: {e}[/red]")
     
     def _upload_summary(self, event: SummaryCreatedEvent) -> None:
         """Upload summary file to Google Drive."""
-        if not self.config.get("upload_summaries", True):
+        if not self._upload_summaries:
             return
         
         try:
             # Get summary file path
             summary_path = event.output_path
             if not summary_path or not os.path.exists(summary_path):
-                console.print(f"[yellow]⚠️  Summary file not found: {summary_path}[/yellow]")
+                _get_console().print(f"[yellow]⚠️  Summary file not found: {summary_path}[/yellow]")
                 return
             
             # Upload to Google Drive
-            folder_id = self.config.get("folder_id")
+            folder_id = self._folder_id
             if not folder_id:
-                console.print("[red]❌ Google Drive folder ID not configured[/red]")
+                _get_console().print("[red]❌ Google Drive folder ID not configured[/red]")
                 return
             
             # Create subfolder if enabled
-            if self.config.get("create_subfolders", True):
+            if self._create_subfolders:
                 folder_name = f"Summaries_{event.video_id}"
-                folder_id = self._create_or_get_folder(folder_name, folder_id)
+                folder_id = self._create_or_get_folder(folder_name, folder_id, self._video_folder_names(event.video_id))
             
             # Upload file
             file_id = self._upload_file(summary_path, folder_id)
             if file_id:
-                console.print(f"[green]✅ Summary uploaded to Google Drive: {file_id}[/green]")
+                _get_console().print(f"[green]✅ Summary uploaded to Google Drive: {file_id}[/green]")
             else:
-                console.print(f"[red]❌ Failed to upload summary[/red]")
+                _get_console().print(f"[red]❌ Failed to upload summary[/red]")
                 
         except Exception as e:
-            console.print(f"[red]❌ Error uploading summary: {e}[/red]")
+            _get_console().print(f"[red]❌ Error uploading summary: {e}[/red]")
+    
+    def _video_folder_names(self, video_id: str) -> List[str]:
+        """Names of the per-video subfolders this plugin will upload into."""
+        names = []
+        if self._upload_transcripts:
+            names.append(f"Transcripts_{video_id}")
+        if self._upload_summaries:
+            names.append(f"Summaries_{video_id}")
+        return names
     
-    def _create_or_get_folder(self, folder_name: str, parent_folder_id: str) -> str:
-        """Create a folder in Google Drive or get existing one."""
+    def _create_or_get_folder(self, folder_name: str, parent_folder_id: str, sibling_names: Sequence[str] = ()) -> str:
+        """
+        Create a folder in Google Drive or get existing one.
+        
+        Folders named in ``sibling_names`` are resolved in the same round trip
+        (one files().list for all of them, one batch request for any missing),
+        so a video's transcript and summary folders cost two RPCs in total.
+        """
+        cache_key = (folder_name, parent_folder_id)
+        folder_id = self._folder_ids.get(cache_key)
+        if folder_id:
+            return folder_id
+        
+        # Resolve under a lock so two threads can't both find a folder missing and create it twice
+        with self._folder_lock:
+            folder_id = self._folder_ids.get(cache_key)
+            if folder_id:
+                return folder_id
+            return self._resolve_folders(folder_name, parent_folder_id, sibling_names)
+    
+    def _resolve_folders(self, folder_name: str, parent_folder_id: str, sibling_names: Sequence[str]) -> str:
+        """Look up (and create any missing) folders for ``_create_or_get_folder``; call with ``_folder_lock`` held."""
+        cache_key = (folder_name, parent_folder_id)
+        names = [folder_name] + [name for name in sibling_names
+                                 if name != folder_name and (name, parent_folder_id) not in self._folder_ids]
+        
         try:
-            from googleapiclient.discovery import build
-            from google.oauth2.credentials import Credentials
-            
-            # Initialize Google Drive API
-            creds = self._get_credentials()
-            service = build('drive', 'v3', credentials=creds)
-            
-            # Check if folder already exists
-            query = f"name='{folder_name}' and '{parent_folder_id}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false"
-            results = service.files().list(q=query, spaces='drive', fields='files(id, name)').execute()
-            files = results.get('files', [])
-            
-            if files:
-                return files[0]['id']
-            
-            # Create new folder
-            folder_metadata = {
-                'name': folder_name,
-                'mimeType': 'application/vnd.google-apps.folder',
-                'parents': [parent_folder_id]
-            }
+            service = self._get_service()
+            if service is None:
+                return parent_folder_id
+            
+            # Check which folders already exist
+            name_clause = " or ".join(f"name='{name}'" for name in names)
+            query = f"({name_clause}) and '{parent_folder_id}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false"
+            results = service.files().list(q=query, spaces='drive', fields='files(id, name)').execute(http=self._get_http())
+            for file in results.get('files', []):
+                self._folder_ids.setdefault((file['name'], parent_folder_id), file['id'])
             
-            folder = service.files().create(body=folder_metadata, fields='id').execute()
-            return folder.get('id')
+            # Create the missing folders in one batch request
+            missing = [name for name in names if (name, parent_folder_id) not in self._folder_ids]
+            if missing:
+                def on_created(request_id, response, exception):
+                    if exception is None and response.get('id'):
+                        self._folder_ids[(request_id, parent_folder_id)] = response['id']
+                    elif exception is not None:
+                        _get_console().print(f"[red]❌ Error creating folder {request_id}: {exception}[/red]")
+                
+                batch = service.new_batch_http_request(callback=on_created)
+                for name in missing:
+                    folder_metadata = {
+                        'name': name,
+                        'mimeType': 'application/vnd.google-apps.folder',
+                        'parents': [parent_folder_id]
+                    }
+                    batch.add(service.files().create(body=folder_metadata, fields='id'), request_id=name)
+                batch.execute(http=self._get_http())
+            
+            return self._folder_ids.get(cache_key, parent_folder_id)
             
         except Exception as e:
-            console.print(f"[red]❌ Error creating folder: {e}[/red]")
+            _get_console().print(f"[red]❌ Error creating folder: {e}[/red]")
             return parent_folder_id
     
     def _upload_file(self, file_path: str, folder_id: str) -> Optional[str]:
         """Upload a file to Google Drive."""
         try:
-            from googleapiclient.discovery import build
-            from google.oauth2.credentials import Credentials
-            from googleapiclient.http import MediaFileUpload
-            
-            # Initialize Google Drive API
-            creds = self._get_credentials()
-            service = build('drive', 'v3', credentials=creds)
+            media = self._MediaFileUpload(file_path, resumable=True)
+        except Exception as e:
+            _get_console().print(f"[red]❌ Error uploading file: {e}[/red]")
+            return None
+        return self._upload_media(os.path.basename(file_path), media, folder_id)
+    
+    def _upload_media(self, file_name: str, media, folder_id: str) -> Optional[str]:
+        """Upload a media body (file or in-memory) to Google Drive under the given name."""
+        try:
+            service = self._get_service()
+            if service is None:
+                return None
             
             # Prepare file metadata
-            file_name = os.path.basename(file_path)
             file_metadata = {
                 'name': file_name,
                 'parents': [folder_id]
             }
             
-            # Create media upload
-            media = MediaFileUpload(file_path, resumable=True)
-            
             # Upload file
             file = service.files().create(
                 body=file_metadata,
                 media_body=media,
                 fields='id'
-            ).execute()
+            ).execute(http=self._get_http())
             
             return file.get('id')
             
         except Exception as e:
-            console.print(f"[red]❌ Error uploading file: {e}[/red]")
+            _get_console().print(f"[red]❌ Error uploading file: {e}[/red]")
             return None
     
     def _get_credentials(self):
         """Get Google Drive API credentials."""
         try:
-            from google.oauth2.credentials import Credentials
-            from google.auth.transport.requests import Request
-            from google_auth_oauthlib.flow import InstalledAppFlow
-            
             # If you have a credentials file, load it
             creds_path = Config.GOOGLE_CREDENTIALS_PATH
             if creds_path and os.path.exists(creds_path):
-                creds = Credentials.from_authorized_user_file(creds_path, ['https://www.googleapis.com/auth/drive'])
+                creds = self._Credentials.from_authorized_user_file(creds_path, ['https://www.googleapis.com/auth/drive'])
                 
                 # Refresh if expired
                 if creds and creds.expired and creds.refresh_token:
-                    creds.refresh(Request())
+                    creds.refresh(self._Request())
                 
                 return creds
             
             # For now, return None - user needs to set up credentials
-            console.print("[yellow]⚠️  Google Drive credentials not configured. Please set up authentication.[/yellow]")
+            _get_console().print("[yellow]⚠️  Google Drive credentials not configured. Please set up authentication.[/yellow]")
             return None
             
         except Exception as e:
-            console.print(f"[red]❌ Error loading Google Drive credentials: {e}[/red]")
+            _get_console().print(f"[red]❌ Error loading Google Drive credentials: {e}[/red]")
             return None
     
     def get_capabilities(self) -> List[str]:
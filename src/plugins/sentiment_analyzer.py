@@ -2,35 +2,92 @@
 Sentiment analysis processor plugin for the YouTube summarizer.
 """
 
+import re
 import time
-from typing import List, Type, Dict, Any
-from rich.console import Console
+import logging
+from collections import Counter
+from typing import List, Type, Dict, Any, Tuple
 
 from src.plugins.base.plugin_base import ProcessorPlugin, PluginInfo
 from src.events import TranscriptGeneratedEvent, SummaryCreatedEvent
 from src.events.events.transcript_events import TranscriptSegment
 
-console = Console()
+# Plugins are loaded from file under their bare module name; log under
+# src.plugins so the application configures them together
+logger = logging.getLogger(f"src.plugins.{__name__.rpartition('.')[2]}")
+
+# Plugin metadata as a plain literal, so discovery can read it without importing
+PLUGIN_INFO = {
+    "name": "sentiment_analyzer",
+    "version": "1.0.0",
+    "description": "Analyzes sentiment of video transcripts and summaries",
+    "author": "YouTube Summarizer Team",
+    "plugin_type": "processor",
+    "entry_point": "SentimentAnalyzer",
+    "config_schema": {
+        "analysis_type": {"type": "string", "default": "basic", "choices": ["basic", "detailed"]},
+        "confidence_threshold": {"type": "float", "default": 0.7}
+    }
+}
+
+_PLUGIN_INFO = PluginInfo(**PLUGIN_INFO)
+
+# Basic sentiment keywords
+_POSITIVE_WORDS = frozenset({'good', 'great', 'excellent', 'amazing', 'wonderful', 'love', 'like', 'best', 'awesome'})
+_NEGATIVE_WORDS = frozenset({'bad', 'terrible', 'awful', 'hate', 'worst', 'dislike', 'horrible'})
+
+# Keyword -> polarity, and every keyword in one alternation: a single scan of the
+# text finds all whole-word matches ("like" does not match inside "dislike"),
+# case-insensitively so the text itself is never lowercased
+_KEYWORD_POLARITY = {**dict.fromkeys(_POSITIVE_WORDS, 'positive'), **dict.fromkeys(_NEGATIVE_WORDS, 'negative')}
+_KEYWORD_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, sorted(_KEYWORD_POLARITY, key=len, reverse=True))) + r')\b', re.IGNORECASE)
+
+
+def _count_keywords(text: str) -> Counter:
+    """Count positive and negative keyword occurrences in text, ignoring case."""
+    return Counter(_KEYWORD_POLARITY[match.lower()] for match in _KEYWORD_RE.findall(text))
+
+
+def _score(text: str) -> Tuple[str, float, int, int, int]:
+    """
+    Score the sentiment of a text.
+    
+    Returns:
+        (sentiment, sentiment score, positive count, negative count, total words)
+    """
+    counts = _count_keywords(text)
+    positive_count = counts['positive']
+    negative_count = counts['negative']
+    
+    # Words are space-separated in transcripts and summaries; counting spaces avoids building a word list
+    total_words = text.count(' ') + 1 if text and not text.isspace() else 0
+    
+    # Calculate sentiment score
+    if total_words > 0:
+        sentiment_score = (positive_count - negative_count) / total_words
+    else:
+        sentiment_score = 0.0
+    
+    # Determine sentiment
+    if sentiment_score > 0.01:
+        sentiment = "positive"
+    elif sentiment_score < -0.01:
+        sentiment = "negative"
+    else:
+        sentiment = "neutral"
+    
+    return sentiment, sentiment_score, positive_count, negative_count, total_words
 
 
 class SentimentAnalyzer(ProcessorPlugin):
     """Sentiment analysis processor plugin."""
     
-    def get_plugin_info(self) -> PluginInfo:
-        return PluginInfo(
-            name="sentiment_analyzer",
-            version="1.0.0",
-            description="Analyzes sentiment of video transcripts and summaries",
-            author="YouTube Summarizer Team",
-            plugin_type="processor",
-            entry_point="SentimentAnalyzer",
-            config_schema={
-                "analysis_type": {"type": "string", "default": "basic", "choices": ["basic", "detailed"]},
-                "confidence_threshold": {"type": "float", "default": 0.7}
-            }
-        )
+    @classmethod
+    def get_plugin_info(cls) -> PluginInfo:
+        return _PLUGIN_INFO
     
-    def get_event_types(self) -> List[Type]:
+    @classmethod
+    def get_event_types(cls) -> List[Type]:
         return [TranscriptGeneratedEvent, SummaryCreatedEvent]
     
     def process_event(self, event) -> Dict[str, Any]:
@@ -44,86 +101,36 @@ class SentimentAnalyzer(ProcessorPlugin):
     
     def _analyze_transcript_sentiment(self, event: TranscriptGeneratedEvent) -> Dict[str, Any]:
         """Analyze sentiment of transcript."""
-        console.print(f"[blue]😊 Analyzing transcript sentiment for video: {event.video_id}[/blue]")
-        
-        # Simple sentiment analysis (in a real implementation, you'd use a proper NLP library)
-        text = event.transcript_text.lower()
-        
-        # Basic sentiment keywords
-        positive_words = ['good', 'great', 'excellent', 'amazing', 'wonderful', 'love', 'like', 'best', 'awesome']
-        negative_words = ['bad', 'terrible', 'awful', 'hate', 'worst', 'dislike', 'horrible', 'terrible']
-        
-        positive_count = sum(1 for word in positive_words if word in text)
-        negative_count = sum(1 for word in negative_words if word in text)
-        
-        # Calculate sentiment score
-        total_words = len(text.split())
-        if total_words > 0:
-            sentiment_score = (positive_count - negative_count) / total_words
-        else:
-            sentiment_score = 0.0
-        
-        # Determine sentiment
-        if sentiment_score > 0.01:
-            sentiment = "positive"
-        elif sentiment_score < -0.01:
-            sentiment = "negative"
-        else:
-            sentiment = "neutral"
-        
-        analysis_result = {
-            'video_id': event.video_id,
-            'sentiment': sentiment,
-            'sentiment_score': sentiment_score,
-            'positive_words': positive_count,
-            'negative_words': negative_count,
-            'total_words': total_words,
-            'analysis_type': 'transcript',
-            'processing_time': time.time()
-        }
-        
-        console.print(f"[green]✅ Sentiment analysis complete: {sentiment} (score: {sentiment_score:.3f})[/green]")
+        logger.info("😊 Analyzing transcript sentiment for video: %s", event.video_id)
+        analysis_result = self._analyze(event.video_id, event.transcript_text, 'transcript')
+        logger.info("✅ Sentiment analysis complete: %s (score: %.3f)",
+                    analysis_result['sentiment'], analysis_result['sentiment_score'])
         return analysis_result
     
     def _analyze_summary_sentiment(self, event: SummaryCreatedEvent) -> Dict[str, Any]:
         """Analyze sentiment of summary."""
-        console.print(f"[blue]😊 Analyzing summary sentiment for video: {event.video_id}[/blue]")
-        
-        # Similar analysis for summary
-        text = event.summary_text.lower()
-        
-        positive_words = ['good', 'great', 'excellent', 'amazing', 'wonderful', 'love', 'like', 'best', 'awesome']
-        negative_words = ['bad', 'terrible', 'awful', 'hate', 'worst', 'dislike', 'horrible', 'terrible']
-        
-        positive_count = sum(1 for word in positive_words if word in text)
-        negative_count = sum(1 for word in negative_words if word in text)
-        
-        total_words = len(text.split())
-        if total_words > 0:
-            sentiment_score = (positive_count - negative_count) / total_words
-        else:
-            sentiment_score = 0.0
-        
-        if sentiment_score > 0.01:
-            sentiment = "positive"
-        elif sentiment_score < -0.01:
-            sentiment = "negative"
-        else:
-            sentiment = "neutral"
+        logger.info("😊 Analyzing summary sentiment for video: %s", event.video_id)
+        analysis_result = self._analyze(event.video_id, event.summary_text, 'summary')
+        logger.info("✅ Summary sentiment analysis complete: %s (score: %.3f)",
+                    analysis_result['sentiment'], analysis_result['sentiment_score'])
+        return analysis_result
+    
+    @staticmethod
+    def _analyze(video_id: str, text: str, analysis_type: str) -> Dict[str, Any]:
+        """Score a text and build the analysis result shared by transcripts and summaries."""
+        # Simple sentiment analysis (in a real implementation, you'd use a proper NLP library)
+        sentiment, sentiment_score, positive_count, negative_count, total_words = _score(text)
         
-        analysis_result = {
-            'video_id': event.video_id,
+        return {
+            'video_id': video_id,
             'sentiment': sentiment,
             'sentiment_score': sentiment_score,
             'positive_words': positive_count,
             'negative_words': negative_count,
             'total_words': total_words,
-            'analysis_type': 'summary',
+            'analysis_type': analysis_type,
             'processing_time': time.time()
         }
-        
-        console.print(f"[green]✅ Summary sentiment analysis complete: {sentiment} (score: {sentiment_score:.3f})[/green]")
-        return analysis_result
     
     def get_analysis_history(self) -> List[Dict[str, Any]]:
         """Get history of sentiment analyses."""
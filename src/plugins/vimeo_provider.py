@@ -3,45 +3,57 @@ Vimeo provider plugin for the YouTube summarizer.
 """
 
 import re
-from typing import List
-from rich.console import Console
+import logging
+from typing import List, Tuple
 
 from src.plugins.base.plugin_base import ProviderPlugin, PluginInfo
 from src.events import VideoDiscoveredEvent
 from src.events.events.video_events import VideoInfo
+from src.utils import url_hash
 
-console = Console()
+# Plugins are loaded from file under their bare module name; log under
+# src.plugins so the application configures them together
+logger = logging.getLogger(f"src.plugins.{__name__.rpartition('.')[2]}")
+
+# Video ID in plain, channel and group video URLs, as one pattern
+_ID_RE = re.compile(r'vimeo\.com/(?:channels/\w+/|groups/\w+/videos/)?(?P<id>\d+)')
+
+# Plugin metadata as a plain literal, so discovery can read it without importing
+PLUGIN_INFO = {
+    "name": "vimeo_provider",
+    "version": "1.0.0",
+    "description": "Provider for Vimeo videos",
+    "author": "YouTube Summarizer Team",
+    "plugin_type": "provider",
+    "entry_point": "VimeoProvider",
+    "config_schema": {
+        "api_key": {"type": "string", "required": False},
+        "download_quality": {"type": "string", "default": "best"}
+    }
+}
+
+_PLUGIN_INFO = PluginInfo(**PLUGIN_INFO)
 
 
 class VimeoProvider(ProviderPlugin):
     """Vimeo content provider plugin."""
     
-    def get_plugin_info(self) -> PluginInfo:
-        return PluginInfo(
-            name="vimeo_provider",
-            version="1.0.0",
-            description="Provider for Vimeo videos",
-            author="YouTube Summarizer Team",
-            plugin_type="provider",
-            entry_point="VimeoProvider",
-            config_schema={
-                "api_key": {"type": "string", "required": False},
-                "download_quality": {"type": "string", "default": "best"}
-            }
-        )
+    _SUPPORTED_URLS = (
+        r'(?:https?://)?(?:www\.)?vimeo\.com/\d+',
+        r'(?:https?://)?(?:www\.)?vimeo\.com/channels/\w+/\d+',
+        r'(?:https?://)?(?:www\.)?vimeo\.com/groups/\w+/videos/\d+',
+    )
+    _URL_HOSTS = ("vimeo.com",)
+    
+    @classmethod
+    def get_plugin_info(cls) -> PluginInfo:
+        return _PLUGIN_INFO
     
-    def get_supported_urls(self) -> List[str]:
-        return [
-            r'(?:https?://)?(?:www\.)?vimeo\.com/\d+',
-            r'(?:https?://)?(?:www\.)?vimeo\.com/channels/\w+/\d+',
-            r'(?:https?://)?(?:www\.)?vimeo\.com/groups/\w+/videos/\d+'
-        ]
+    def get_supported_urls(self) -> Tuple[str, ...]:
+        return self._SUPPORTED_URLS
     
     def can_handle_url(self, url: str) -> bool:
-        for pattern in self.supported_urls:
-            if re.match(pattern, url):
-                return True
-        return False
+        return self.matches_url(url)
     
     def process_url(self, url: str) -> None:
         """Process a Vimeo URL and emit VideoDiscoveredEvent."""
@@ -60,14 +72,14 @@ class VimeoProvider(ProviderPlugin):
             source=self.plugin_info.name
         )
         
-        console.print(f"[blue]🔍 Vimeo provider discovered video: {video_info.title}[/blue]")
+        logger.info("🔍 Vimeo provider discovered video: %s", video_info.title)
         self.event_bus.publish(event)
     
     def _get_video_info(self, url: str) -> VideoInfo:
         """Get video information using the downloader registry."""
-        from src.downloaders import DownloaderRegistry
+        from src.downloaders import get_registry
         
-        registry = DownloaderRegistry()
+        registry = get_registry()
         downloader = registry.get_downloader_for_url(url)
         if not downloader:
             raise Exception(f"No downloader available for URL: {url}")
@@ -85,19 +97,12 @@ class VimeoProvider(ProviderPlugin):
     
     def _extract_video_id(self, url: str) -> str:
         """Extract video ID from Vimeo URL."""
-        patterns = [
-            r'vimeo\.com/(\d+)',
-            r'vimeo\.com/channels/\w+/(\d+)',
-            r'vimeo\.com/groups/\w+/videos/(\d+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
+        match = _ID_RE.search(url)
+        if match:
+            return match.group('id')
         
-        # Fallback: use URL hash
-        return str(hash(url))[-8:]
+        # Fallback: stable hash of the URL
+        return url_hash(url)
     
     def get_capabilities(self) -> List[str]:
         return ['url_processing', 'video_info_extraction', 'vimeo_api'] 
\ No newline at end of file
@@ -2,47 +2,54 @@
 YouTube provider plugin for the video summarizer.
 """
 
-import re
-from typing import List
-from rich.console import Console
+import logging
+from typing import List, Tuple
 
 from src.plugins.base.plugin_base import ProviderPlugin, PluginInfo
 from src.events import VideoDiscoveredEvent
 from src.events.events.video_events import VideoInfo
 from src.config import Config
 
-console = Console()
+# Plugins are loaded from file under their bare module name; log under
+# src.plugins so the application configures them together
+logger = logging.getLogger(f"src.plugins.{__name__.rpartition('.')[2]}")
+
+# Plugin metadata as a plain literal, so discovery can read it without importing
+PLUGIN_INFO = {
+    "name": "youtube_provider",
+    "version": "1.0.0",
+    "description": "Provider for YouTube videos",
+    "author": "YouTube Summarizer Team",
+    "plugin_type": "provider",
+    "entry_point": "YouTubeProvider",
+    "config_schema": {
+        "download_quality": {"type": "string", "default": "best"},
+        "extract_audio": {"type": "boolean", "default": True}
+    }
+}
+
+_PLUGIN_INFO = PluginInfo(**PLUGIN_INFO)
 
 
 class YouTubeProvider(ProviderPlugin):
     """YouTube content provider plugin."""
     
-    def get_plugin_info(self) -> PluginInfo:
-        return PluginInfo(
-            name="youtube_provider",
-            version="1.0.0",
-            description="Provider for YouTube videos",
-            author="YouTube Summarizer Team",
-            plugin_type="provider",
-            entry_point="YouTubeProvider",
-            config_schema={
-                "download_quality": {"type": "string", "default": "best"},
-                "extract_audio": {"type": "boolean", "default": True}
-            }
-        )
+    _SUPPORTED_URLS = (
+        r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+',
+        r'(?:https?://)?(?:www\.)?youtu\.be/[\w-]+',
+        r'(?:https?://)?(?:www\.)?youtube\.com/embed/[\w-]+',
+    )
+    _URL_HOSTS = ("youtube.com", "youtu.be")
+    
+    @classmethod
+    def get_plugin_info(cls) -> PluginInfo:
+        return _PLUGIN_INFO
     
-    def get_supported_urls(self) -> List[str]:
-        return [
-            r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtu\.be/[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtube\.com/embed/[\w-]+'
-        ]
+    def get_supported_urls(self) -> Tuple[str, ...]:
+        return self._SUPPORTED_URLS
     
     def can_handle_url(self, url: str) -> bool:
-        for pattern in self.supported_urls:
-            if re.match(pattern, url):
-                return True
-        return False
+        return self.matches_url(url)
     
     def process_url(self, url: str) -> None:
         """Process a YouTube URL and emit VideoDiscoveredEvent."""
@@ -61,15 +68,15 @@ class YouTubeProvider(ProviderPlugin):
             source=self.plugin_info.name
         )
         
-        console.print(f"[blue]🔍 YouTube provider discovered video: {video_info.title}[/blue]")
+        logger.info("🔍 YouTube provider discovered video: %s", video_info.title)
         self.event_bus.publish(event)
     
     def _get_video_info(self, url: str) -> VideoInfo:
         """Get video information using existing downloader logic."""
         # Import here to avoid circular imports
-        from src.downloaders import DownloaderRegistry
+        from src.downloaders import get_registry
         
-        registry = DownloaderRegistry()
+        registry = get_registry()
         downloader = registry.get_downloader_for_url(url)
         if not downloader:
             raise Exception(f"No downloader available for URL: {url}")
@@ -2,25 +2,30 @@
 Download processor that handles VideoDiscoveredEvent and emits VideoDownloadedEvent.
 """
 
+import re
 import time
+import logging
 from pathlib import Path
-from rich.console import Console
 
 from src.events.handlers.event_handler import EventProcessor
 from src.events import VideoDiscoveredEvent, VideoDownloadedEvent, VideoProcessingErrorEvent
 from src.events.events.video_events import VideoInfo
 from src.config import Config
-from src.downloaders import DownloaderRegistry
+from src.downloaders import get_registry
+from src.utils import url_hash
 
-console = Console()
+logger = logging.getLogger(__name__)
+
+# YouTube video ID pattern
+_YT_ID_RE = re.compile(r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([a-zA-Z0-9_-]+)')
 
 
 class DownloadProcessor(EventProcessor):
     """Processor that downloads videos when VideoDiscoveredEvent is received."""
     
-    def __init__(self, event_bus):
-        super().__init__(event_bus, "DownloadProcessor")
-        self.downloader_registry = DownloaderRegistry()
+    def __init__(self, event_bus, max_workers: int = 0):
+        super().__init__(event_bus, "DownloadProcessor", max_workers)
+        self.downloader_registry = get_registry()
     
     def handle(self, event: VideoDiscoveredEvent):
         """
@@ -29,7 +34,7 @@ class DownloadProcessor(EventProcessor):
         Args:
             event: VideoDiscoveredEvent containing video information
         """
-        console.print(f"[blue]⬇️  Downloading video: {event.title or event.url}[/blue]")
+        logger.info("⬇️  Downloading video: %s", event.title or event.url)
         
         start_time = time.time()
         
@@ -39,8 +44,9 @@ class DownloadProcessor(EventProcessor):
             if not downloader:
                 raise Exception(f"No downloader available for URL: {event.url}")
             
-            # Download audio
-            audio_path = downloader.download_audio(event.url)
+            # Fetch video info once and reuse it for the download
+            info = downloader.get_video_info(event.url)
+            audio_path = downloader.download_audio(event.url, info=info)
             download_duration = time.time() - start_time
             
             # Extract video ID from URL
@@ -80,20 +86,12 @@ class DownloadProcessor(EventProcessor):
     
     def _extract_video_id(self, url: str) -> str:
         """Extract video ID from YouTube URL."""
-        import re
-        
-        # YouTube video ID patterns
-        patterns = [
-            r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([a-zA-Z0-9_-]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
+        match = _YT_ID_RE.search(url)
+        if match:
+            return match.group(1)
         
-        # Fallback: use URL hash
-        return str(hash(url))[-8:]
+        # Fallback: stable hash of the URL
+        return url_hash(url)
     
     def handle_error(self, event: VideoDiscoveredEvent, error: Exception):
         """Handle download errors by emitting error event."""
@@ -2,29 +2,61 @@
 Summarization processor that handles TranscriptGeneratedEvent and emits SummaryCreatedEvent.
 """
 
+import os
 import time
-from pathlib import Path
-from rich.console import Console
+import logging
+import functools
+import threading
+from typing import List, Optional
 
 from src.events.handlers.event_handler import EventProcessor
 from src.events import TranscriptGeneratedEvent, SummaryCreatedEvent, SummaryProcessingErrorEvent
 from src.config import Config
+from src.cache import SummaryCache
 from src.summarizer import AISummarizer
 from src.utils import save_summary_to_file
 
-console = Console()
+logger = logging.getLogger(__name__)
+
+_summarizer_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_summarizer(api_key: str, model: str, use_cache: bool) -> AISummarizer:
+    """Create an AI summarizer once per (API key, model, caching)."""
+    return AISummarizer(api_key, model, SummaryCache() if use_cache else None)
+
+
+def _get_summarizer(api_key: str, model: str, use_cache: bool = True) -> AISummarizer:
+    """Return the shared summarizer, creating it on first use."""
+    with _summarizer_lock:
+        return _load_summarizer(api_key, model, use_cache)
 
 
 class SummarizationProcessor(EventProcessor):
-    """Processor that summarizes transcripts when TranscriptGeneratedEvent is received."""
+    """Processor that summarizes transcripts when TranscriptGeneratedEvent is received.
+    
+    With ``batch_size > 1`` transcripts are collected and summarized
+    ``batch_size`` at a time, with the OpenAI requests of a batch in flight
+    concurrently; ``drain()`` summarizes a partial batch.
+    """
     
     def __init__(self, event_bus, summary_style: str = "comprehensive", 
-                 summary_length: str = "medium", output_format: str = "text"):
-        super().__init__(event_bus, "SummarizationProcessor")
+                 summary_length: str = "medium", output_format: str = "text",
+                 max_workers: int = 0, batch_size: int = 1, use_cache: bool = True):
+        super().__init__(event_bus, "SummarizationProcessor", max_workers)
+        if output_format == 'pdf' and summary_style != 'structured':
+            # PDFs are rendered from the structured summary, so request that style up front
+            logger.warning("⚠️  PDF format requires structured style. Switching to structured style.")
+            summary_style = 'structured'
         self.summary_style = summary_style
         self.summary_length = summary_length
         self.output_format = output_format
-        self.summarizer = AISummarizer(Config.OPENAI_API_KEY, Config.OPENAI_MODEL)
+        self._output_dir = os.fspath(Config.OUTPUT_DIR)
+        self.summarizer = _get_summarizer(Config.OPENAI_API_KEY, Config.OPENAI_MODEL, use_cache)
+        self.batch_size = batch_size
+        self._batch: List[TranscriptGeneratedEvent] = []
+        self._batch_lock = threading.Lock()
     
     def handle(self, event: TranscriptGeneratedEvent):
         """
@@ -33,7 +65,15 @@ class SummarizationProcessor(EventProcessor):
         Args:
             event: TranscriptGeneratedEvent containing transcript text
         """
-        console.print(f"[blue]🤖 Generating {self.summary_style} summary ({self.summary_length})[/blue]")
+        if self.batch_size > 1:
+            with self._batch_lock:
+                self._batch.append(event)
+                if len(self._batch) < self.batch_size:
+                    return None
+                batch, self._batch = self._batch, []
+            return self.handle_batch(batch)
+        
+        logger.info("🤖 Generating %s summary (%s)", self.summary_style, self.summary_length)
         
         start_time = time.time()
         
@@ -50,67 +90,96 @@ class SummarizationProcessor(EventProcessor):
             # Save summary to file
             output_path = self._save_summary(summary_result, event.video_id)
             
-            # Emit SummaryCreatedEvent
-            summary_event = SummaryCreatedEvent(
-                video_id=event.video_id,
-                summary_text=summary_result['summary'],
-                format=self.output_format,
-                summary_style=self.summary_style,
-                summary_length=self.summary_length,
-                word_count=summary_result['word_count'],
-                model_used=summary_result['model_used'],
-                tokens_used=summary_result.get('tokens_used'),
-                processing_duration=processing_duration,
-                output_path=output_path,
-                source=self.name
-            )
-            
-            self.publish_event(summary_event)
+            self._publish_summary(event, summary_result, processing_duration, output_path)
             return summary_result
             
         except Exception as e:
             # Emit error event
-            error_event = SummaryProcessingErrorEvent(
-                video_id=event.video_id,
-                error_message=str(e),
-                error_type=type(e).__name__,
-                summary_style=self.summary_style,
-                format=self.output_format,
-                source=self.name
-            )
-            self.publish_event(error_event)
+            self.handle_error(event, e)
             raise
     
+    def handle_batch(self, events: List[TranscriptGeneratedEvent]) -> list:
+        """
+        Summarize several transcripts with their OpenAI requests in flight together.
+        
+        Requests go through ``AISummarizer.summarize_many``, so they share its
+        rate limiting and retries; summaries are then saved and published in order.
+        
+        Args:
+            events: TranscriptGeneratedEvents to summarize
+            
+        Returns:
+            The summary result, or the exception raised, for each event in order
+        """
+        for event in events:
+            logger.info("🤖 Generating %s summary (%s) for video: %s", self.summary_style, self.summary_length, event.video_id)
+        
+        start_time = time.time()
+        results = self.summarizer.run_async(self.summarizer.summarize_many(
+            [event.transcript_text for event in events],
+            length=self.summary_length,
+            style=self.summary_style,
+            max_concurrent=self.batch_size,
+            return_exceptions=True
+        ))
+        processing_duration = time.time() - start_time
+        
+        for index, (event, result) in enumerate(zip(events, results)):
+            if not isinstance(result, Exception):
+                try:
+                    output_path = self._save_summary(result, event.video_id)
+                    self._publish_summary(event, result, processing_duration, output_path)
+                    continue
+                except Exception as e:
+                    result = results[index] = e
+            self.handle_error(event, result)
+            self.on_error(event, result)
+        return results
+    
+    def drain(self):
+        """Wait for submitted work, then summarize any partial batch."""
+        super().drain()
+        with self._batch_lock:
+            batch, self._batch = self._batch, []
+        if batch:
+            self.handle_batch(batch)
+    
+    def _publish_summary(self, event: TranscriptGeneratedEvent, summary_result: dict,
+                         processing_duration: float, output_path: Optional[str]):
+        """Emit the SummaryCreatedEvent for a finished summary."""
+        summary_event = SummaryCreatedEvent(
+            video_id=event.video_id,
+            summary_text=summary_result['summary'],
+            format=self.output_format,
+            summary_style=self.summary_style,
+            summary_length=self.summary_length,
+            word_count=summary_result['word_count'],
+            model_used=summary_result['model_used'],
+            tokens_used=summary_result.get('tokens_used'),
+            processing_duration=processing_duration,
+            output_path=output_path,
+            source=self.name
+        )
+        self.publish_event(summary_event)
+    
     def _save_summary(self, summary_result: dict, video_id: str) -> str:
         """Save summary to file and return the output path."""
         # Create output filename
-        output_filename = f"{video_id}_{self.summary_style}_{self.summary_length}_{self.output_format}.{self.output_format}"
-        output_path = Path(Config.OUTPUT_DIR) / output_filename
+        output_filename = f"{video_id}_{self.summary_style}_{self.summary_length}.{self.output_format}"
+        output_path = os.path.join(self._output_dir, output_filename)
         
         if self.output_format == 'pdf':
-            # For PDF, use structured style and convert to PDF
-            if self.summary_style != 'structured':
-                console.print("[yellow]⚠️  PDF format requires structured style. Switching to structured style.[/yellow]")
-                self.summary_style = 'structured'
-            
-            # Generate structured summary
-            structured_summary = self.summarizer.summarize(
-                summary_result.get('original_text', ''),
-                length=self.summary_length,
-                style='structured'
-            )
-            
-            # Convert to PDF
-            if self.summarizer.markdown_to_pdf(structured_summary['summary'], str(output_path)):
-                console.print(f"[green]✅ PDF summary saved to: {output_path}[/green]")
+            # The summary is already in structured style (see __init__); convert it to PDF
+            if self.summarizer.markdown_to_pdf(summary_result['summary'], output_path):
+                logger.info("✅ PDF summary saved to: %s", output_path)
             else:
-                console.print(f"[red]❌ Failed to generate PDF: {output_path}[/red]")
+                logger.error("❌ Failed to generate PDF: %s", output_path)
         else:
             # Use regular save method for other formats
-            save_summary_to_file(summary_result, str(output_path), self.output_format)
-            console.print(f"[green]✅ Summary saved to: {output_path}[/green]")
+            save_summary_to_file(summary_result, output_path, self.output_format)
+            logger.info("✅ Summary saved to: %s", output_path)
         
-        return str(output_path)
+        return output_path
     
     def handle_error(self, event: TranscriptGeneratedEvent, error: Exception):
         """Handle summarization errors by emitting error event."""
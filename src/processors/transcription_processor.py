@@ -2,32 +2,64 @@
 Transcription processor that handles VideoDownloadedEvent and emits TranscriptGeneratedEvent.
 """
 
+import os
+import re
+import mmap
 import time
+import logging
+import functools
+import threading
 from pathlib import Path
-from rich.console import Console
+from typing import Optional
 
 from src.events.handlers.event_handler import EventProcessor
 from src.events import VideoDownloadedEvent, TranscriptGeneratedEvent, TranscriptProcessingErrorEvent
 from src.config import Config
+from src.cache import TranscriptCache
 from src.transcriber import WhisperTranscriber
 from src.downloader import YouTubeDownloader
 
-console = Console()
+logger = logging.getLogger(__name__)
+
+# Non-blank SRT lines other than cue indexes and timings, captured without surrounding whitespace
+_SRT_TEXT_LINE = re.compile(
+    rb'(?m)^(?![ \t]*(?:\d+|\d{2}:\d{2}:\d{2},\d{3} --> \d{2}:\d{2}:\d{2},\d{3})[ \t\r]*$)'
+    rb'[ \t]*(\S[^\r\n]*?)[ \t\r]*$'
+)
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+_transcriber_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_transcriber(model_size: str, device: str, compute_type: str, batch_size: int = 0) -> WhisperTranscriber:
+    """Load a Whisper transcriber once per (model, device, compute type, batch size)."""
+    return WhisperTranscriber(model_size=model_size, device=device, compute_type=compute_type, batch_size=batch_size)
+
+
+def _get_transcriber(model_size: str, device: str, compute_type: str, batch_size: int = 0) -> WhisperTranscriber:
+    """Return the shared transcriber, loading it on first use."""
+    with _transcriber_lock:
+        return _load_transcriber(model_size, device, compute_type, batch_size)
 
 
 class TranscriptionProcessor(EventProcessor):
     """Processor that transcribes videos when VideoDownloadedEvent is received."""
     
-    def __init__(self, event_bus, whisper_model: str = "small", transcription_method: str = "whisper"):
-        super().__init__(event_bus, "TranscriptionProcessor")
+    def __init__(self, event_bus, whisper_model: str = "small", transcription_method: str = "whisper", compute_type: Optional[str] = None, use_cache: bool = True, max_workers: int = 0):
+        super().__init__(event_bus, "TranscriptionProcessor", max_workers)
         self.whisper_model = whisper_model
         self.transcription_method = transcription_method
-        self.transcriber = WhisperTranscriber(
-            model_size=whisper_model,
-            device=Config.WHISPER_DEVICE,
-            compute_type=Config.WHISPER_COMPUTE_TYPE
-        )
+        self.device = Config.WHISPER_DEVICE
+        self.compute_type = compute_type or Config.WHISPER_COMPUTE_TYPE
+        self.batch_size = (Config.WHISPER_BATCH_SIZE or 16) if Config.WHISPER_BATCHED else 0
         self.downloader = YouTubeDownloader(Config.TEMP_DIR)
+        self.cache = TranscriptCache() if use_cache else None
+    
+    @property
+    def transcriber(self) -> WhisperTranscriber:
+        """Whisper transcriber, shared across processors and loaded on first use."""
+        return _get_transcriber(self.whisper_model, self.device, self.compute_type, self.batch_size)
     
     def handle(self, event: VideoDownloadedEvent):
         """
@@ -36,17 +68,26 @@ class TranscriptionProcessor(EventProcessor):
         Args:
             event: VideoDownloadedEvent containing audio path and video info
         """
-        console.print(f"[blue]🎤 Transcribing video: {event.video_info.title}[/blue]")
+        logger.info("🎤 Transcribing video: %s", event.video_info.title)
         
         start_time = time.time()
         
         try:
-            if self.transcription_method == "captions":
-                # Try to download captions
-                transcript_result = self._transcribe_with_captions(event)
+            cache_key = TranscriptCache.make_key(event.url, self.transcription_method, self.whisper_model, self.compute_type)
+            transcript_result = self.cache.get(cache_key) if self.cache else None
+            
+            if transcript_result is not None:
+                logger.info("✅ Using cached transcript")
             else:
-                # Use Whisper transcription
-                transcript_result = self._transcribe_with_whisper(event)
+                if self.transcription_method == "captions":
+                    # Try to download captions
+                    transcript_result = self._transcribe_with_captions(event)
+                else:
+                    # Use Whisper transcription
+                    transcript_result = self._transcribe_with_whisper(event)
+                
+                if self.cache:
+                    self.cache.put(cache_key, transcript_result)
             
             processing_duration = time.time() - start_time
             
@@ -89,19 +130,17 @@ class TranscriptionProcessor(EventProcessor):
         if not captions_path:
             raise ValueError("No captions available for this video")
         
-        # Read and process captions
-        with open(captions_path, 'r', encoding='utf-8') as f:
-            captions_text = f.read()
-        
-        # Simple SRT to text conversion
-        import re
-        text_lines = []
-        for line in captions_text.split('\n'):
-            line = line.strip()
-            if line and not re.match(r'^\d+$', line) and not re.match(r'^\d{2}:\d{2}:\d{2},\d{3} --> \d{2}:\d{2}:\d{2},\d{3}$', line):
-                text_lines.append(line)
+        # Simple SRT to text conversion: scan the memory-mapped file for text lines,
+        # so the whole file is never copied into a str
+        with open(captions_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                text_lines = []
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    start = len(_UTF8_BOM) if buffer[:len(_UTF8_BOM)] == _UTF8_BOM else 0
+                    text_lines = [match.group(1) for match in _SRT_TEXT_LINE.finditer(buffer, start)]
         
-        transcript_text = ' '.join(text_lines)
+        transcript_text = b' '.join(text_lines).decode('utf-8')
         
         return {
             'text': transcript_text,
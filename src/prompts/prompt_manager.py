@@ -4,10 +4,75 @@ Handles loading prompts from files and variable substitution.
 """
 
 import os
+import copy
+import string
 import yaml
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Callable, Dict, Any, Mapping, Optional, Tuple
 from pathlib import Path
 
+# libyaml's C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# Parsed configs and prompt file contents shared by all PromptManager
+# instances, keyed by (path, mtime, size) so edited files are read again
+_CONFIG_CACHE: Dict[Tuple[str, float, int], Dict[str, Any]] = {}
+_PROMPT_FILE_CACHE: Dict[Tuple[str, float, int], str] = {}
+
+
+def _stat_key(path: str) -> Tuple[str, float, int]:
+    """Cache key for a file: its path plus modification time and size."""
+    st = os.stat(path)
+    return path, st.st_mtime, st.st_size
+
+
+def _evict(cache: Dict[Tuple[str, float, int], Any], path: str) -> None:
+    """Drop every cached entry for a path."""
+    for key in [key for key in cache if key[0] == path]:
+        cache.pop(key, None)
+
+
+_FORMATTER = string.Formatter()
+
+
+@lru_cache(maxsize=64)
+def _compile_template(template: str) -> Callable[[Mapping[str, Any]], str]:
+    """
+    Turn a prompt template into a function of its variables.
+    
+    The template is split into (literal, field) pieces once, so rendering is
+    a join instead of re-parsing the format string. Templates with format
+    specs, conversions or positional/attribute fields use ``str.format_map``.
+    Like ``str.format``, a missing variable raises KeyError.
+    """
+    pieces = []
+    for literal, field_name, format_spec, conversion in _FORMATTER.parse(template):
+        if field_name is not None and (format_spec or conversion or not field_name.isidentifier()):
+            return template.format_map
+        pieces.append((literal, field_name))
+    
+    def render(variables: Mapping[str, Any]) -> str:
+        return ''.join([literal if field_name is None else literal + format(variables[field_name])
+                        for literal, field_name in pieces])
+    
+    return render
+
+
+class _PromptVars(dict):
+    """Prompt variables that report a missing one only when the template asks for it."""
+    
+    __slots__ = ('_prompt_key',)
+    
+    def __init__(self, variables: Mapping[str, Any], prompt_key: str):
+        super().__init__(variables)
+        self._prompt_key = prompt_key
+    
+    def __missing__(self, var_name: str):
+        raise ValueError(f"Required variable '{var_name}' not provided for prompt '{self._prompt_key}'")
+
 
 class PromptManager:
     """Manages prompts loaded from files with variable substitution."""
@@ -22,12 +87,19 @@ class PromptManager:
         self.config_path = config_path
         self.config = self._load_config()
         self._prompt_cache = {}
+        self._dirty = False  # config has additions not yet written by flush()
         
     def _load_config(self) -> Dict[str, Any]:
-        """Load prompt configuration from YAML file."""
+        """Load prompt configuration from YAML file, parsing it once per file version."""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            key = _stat_key(self.config_path)
+            config = _CONFIG_CACHE.get(key)
+            if config is None:
+                # libyaml reads the UTF-8 bytes itself; no decoded copy needed
+                with open(self.config_path, 'rb') as f:
+                    config = yaml.load(f, Loader=SafeLoader)
+                _CONFIG_CACHE[key] = config
+            return config
         except FileNotFoundError:
             raise FileNotFoundError(f"Prompt configuration file not found: {self.config_path}")
         except yaml.YAMLError as e:
@@ -45,12 +117,16 @@ class PromptManager:
         if file_path in self._prompt_cache:
             return self._prompt_cache[file_path]
         
-        # Load from file
+        # Load from file, or from another instance's read of the same version
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                self._prompt_cache[file_path] = content
-                return content
+            key = _stat_key(file_path)
+            content = _PROMPT_FILE_CACHE.get(key)
+            if content is None:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                _PROMPT_FILE_CACHE[key] = content
+            self._prompt_cache[file_path] = content
+            return content
         except FileNotFoundError:
             raise FileNotFoundError(f"Prompt file not found: {file_path}")
     
@@ -68,19 +144,19 @@ class PromptManager:
         # Load prompt template
         prompt_template = self._load_prompt_file(prompt_key)
         
-        # Validate required variables
-        self._validate_variables(prompt_key, variables)
-        
-        # Substitute variables
+        # Substitute variables; a missing one is reported on lookup instead
+        # of checking every declared variable up front
         try:
-            return prompt_template.format(**variables)
+            return _compile_template(prompt_template)(_PromptVars(variables, prompt_key))
+        except ValueError:
+            raise
         except KeyError as e:
             raise ValueError(f"Missing required variable in prompt '{prompt_key}': {e}")
         except Exception as e:
             raise ValueError(f"Error substituting variables in prompt '{prompt_key}': {e}")
     
     def _validate_variables(self, prompt_key: str, variables: Dict[str, Any]) -> None:
-        """Validate that all required variables are provided."""
+        """Validate that all variables declared for a prompt are provided."""
         if prompt_key not in self.config.get('prompts', {}):
             return
         
@@ -125,6 +201,9 @@ class PromptManager:
         """
         Add a new prompt to the configuration.
         
+        The change is kept in memory; call ``flush()`` to write it, once
+        after adding a batch of prompts.
+        
         Args:
             key: Unique key for the prompt
             file_path: Path to the prompt file
@@ -134,6 +213,9 @@ class PromptManager:
         if key in self.config.get('prompts', {}):
             raise ValueError(f"Prompt key '{key}' already exists")
         
+        # The parsed config is shared with other instances; change a private copy
+        self.config = copy.deepcopy(self.config)
+        
         # Add to config
         if 'prompts' not in self.config:
             self.config['prompts'] = {}
@@ -143,20 +225,27 @@ class PromptManager:
             'description': description,
             'variables': variables
         }
-        
-        # Save updated config
-        self._save_config()
+        self._dirty = True
+    
+    def flush(self) -> None:
+        """Write the configuration to file if prompts were added since the last write."""
+        if self._dirty:
+            self._save_config()
+            self._dirty = False
     
     def _save_config(self) -> None:
         """Save the current configuration back to file."""
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(self.config, f, default_flow_style=False, indent=2)
+            with open(self.config_path, 'wb') as f:
+                yaml.dump(self.config, f, Dumper=SafeDumper, encoding='utf-8', default_flow_style=False, indent=2)
         except Exception as e:
             raise ValueError(f"Error saving prompt configuration: {e}")
     
     def reload_config(self) -> None:
         """Reload configuration from file and clear cache."""
+        _evict(_CONFIG_CACHE, self.config_path)
+        for file_path in self._prompt_cache:
+            _evict(_PROMPT_FILE_CACHE, file_path)
         self.config = self._load_config()
         self._prompt_cache.clear()
     
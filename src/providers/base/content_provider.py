@@ -2,14 +2,14 @@
 Base ContentProvider interface for the event-driven system.
 """
 
+import logging
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
-from rich.console import Console
 
 from src.events import EventBus, VideoDiscoveredEvent
 from src.events.events.video_events import VideoInfo
 
-console = Console()
+logger = logging.getLogger(__name__)
 
 
 class ContentProvider(ABC):
@@ -52,7 +52,7 @@ class ContentProvider(ABC):
             source=self.name
         )
         
-        console.print(f"[blue]🔍 {self.name} discovered video: {title or url}[/blue]")
+        logger.info("🔍 %s discovered video: %s", self.name, title or url)
         self.event_bus.publish(event)
         return event
     
@@ -3,15 +3,47 @@ YouTube content provider that emits events for video processing.
 """
 
 import re
-from typing import Optional
-from rich.console import Console
+import sys
+import functools
+from typing import Optional, Tuple
 
 from src.providers.base.content_provider import ContentProvider
 from src.events import EventBus, VideoDiscoveredEvent
 from src.events.events.video_events import VideoInfo
-from src.config import Config
 
-console = Console()
+# Values repeated on every video, shared as interned strings
+_UNKNOWN = sys.intern('Unknown')
+_EN = sys.intern('en')
+_YOUTUBE = sys.intern('youtube')
+
+# Watch, short-link and embed URLs, as one alternation
+_YOUTUBE_URL_RE = re.compile(r'(?:https?://)?(?:www\.)?(?:youtube\.com/(?:watch\?v=|embed/)|youtu\.be/)[\w-]+')
+
+
+@functools.lru_cache(maxsize=512)
+def _fetch_info(url: str) -> Tuple[str, float, str, int, str]:
+    """
+    Fetch (title, duration, uploader, view_count, description) for a URL once per process.
+    
+    Uses the shared downloader registry rather than a new downloader per call.
+    """
+    # Import here to avoid circular imports
+    from src.downloaders import get_registry
+    
+    downloader = get_registry().get_downloader_for_url(url)
+    if not downloader:
+        raise Exception(f"No downloader available for URL: {url}")
+    
+    info = downloader.get_video_info(url)
+    uploader = info.get('uploader', _UNKNOWN)
+    return (
+        info.get('title', _UNKNOWN),
+        info.get('duration', 0),
+        # Many videos in a batch share a channel: keep one copy of its name
+        sys.intern(uploader) if isinstance(uploader, str) else uploader,
+        info.get('view_count', 0),
+        info.get('description', ''),
+    )
 
 
 class YouTubeProvider(ContentProvider):
@@ -19,11 +51,6 @@ class YouTubeProvider(ContentProvider):
     
     def __init__(self, event_bus: EventBus):
         super().__init__(event_bus, "YouTubeProvider")
-        self.youtube_patterns = [
-            r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtu\.be/[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtube\.com/embed/[\w-]+'
-        ]
     
     def process_url(self, url: str) -> None:
         """
@@ -42,32 +69,28 @@ class YouTubeProvider(ContentProvider):
         self.emit_video_discovered(
             url=url,
             title=video_info.title,
-            provider="youtube",
+            provider=_YOUTUBE,
             video_info=video_info
         )
     
     def _is_valid_youtube_url(self, url: str) -> bool:
         """Validate YouTube URL."""
-        for pattern in self.youtube_patterns:
-            if re.match(pattern, url):
-                return True
-        return False
+        # Cheap rejection of other hosts before entering the regex engine
+        if 'youtube.com' not in url and 'youtu.be' not in url:
+            return False
+        return _YOUTUBE_URL_RE.match(url) is not None
     
     def _get_video_info(self, url: str) -> VideoInfo:
         """Get video information using existing downloader logic."""
-        # Import here to avoid circular imports
-        from src.downloader import YouTubeDownloader
-        
-        downloader = YouTubeDownloader(Config.TEMP_DIR)
-        info = downloader.get_video_info(url)
+        title, duration, uploader, view_count, description = _fetch_info(url)
         
         return VideoInfo(
-            title=info.get('title', 'Unknown'),
-            duration=info.get('duration', 0),
-            uploader=info.get('uploader', 'Unknown'),
-            view_count=info.get('view_count', 0),
-            description=info.get('description', ''),
-            language='en'  # Default assumption
+            title=title,
+            duration=duration,
+            uploader=uploader,
+            view_count=view_count,
+            description=description,
+            language=_EN  # Default assumption
         )
     
     def get_capabilities(self) -> list:
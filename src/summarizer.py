@@ -4,35 +4,418 @@ Uses OpenAI GPT models for intelligent summarization.
 """
 
 import os
-from typing import Dict, Any, Optional
-from openai import OpenAI
+import re
+import json
+import time
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from functools import cached_property, lru_cache
+from html import escape
+from html.parser import HTMLParser
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Dict, Any, Generator, Iterator, List, Mapping, Optional, Tuple, TypeVar
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from src.cache import SummaryCache
 from src.prompts.prompt_manager import PromptManager
 
+# openai, markdown and reportlab take a noticeable part of a second to import,
+# so they are imported on first use rather than when the CLI starts
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+
+_T = TypeVar('_T')
+
+# PDF output needs markdown and reportlab; without them markdown_to_pdf fails fast
+_HAS_PDF = find_spec('markdown') is not None and find_spec('reportlab') is not None
+
 console = Console()
 
+# Target summary length in words per length option
+_LENGTH_CONSTRAINTS = {
+    'short': 150,
+    'medium': 300,
+    'long': 500
+}
+
+# Completion limit of every summary request
+_MAX_COMPLETION_TOKENS = 4000
+
+# Room kept for the system prompt and style instructions
+_PROMPT_OVERHEAD_TOKENS = 512
+
+# Context window (tokens) per model family, matched by longest name prefix;
+# unknown models are assumed to have a 128k window like current GPT-4 models
+_CONTEXT_WINDOWS = {
+    'gpt-3.5-turbo': 16385,
+    'gpt-4': 8192,
+    'gpt-4-32k': 32768,
+    'gpt-4-turbo': 128000,
+    'gpt-4-1106': 128000,
+    'gpt-4-0125': 128000,
+    'gpt-4o': 128000,
+    'gpt-4.1': 1047576,
+}
+_DEFAULT_CONTEXT_WINDOW = 128000
+
+_SYSTEM_PROMPT = "You are an expert content summarizer. Create clear, accurate, and engaging summaries."
+
+# Stands in for the transcript in the style instructions of a single-style
+# request, which go in the system message so the prefix is the same for every
+# transcript and OpenAI's prompt caching can reuse it
+_TRANSCRIPT_MESSAGE_REFERENCE = "[the transcript in the user message]"
+
+# Stands in for the transcript in style instructions of a multi-style request,
+# which carries the transcript once, ahead of the instructions
+_TRANSCRIPT_REFERENCE = "[the transcript above]"
+
+# Transcripts estimated above this many tokens are summarized chunk by chunk
+# (map) and the chunk summaries summarized together (reduce)
+_MAP_REDUCE_TOKENS = 8000
+_CHUNK_TOKENS = 3500
+_CHUNK_STYLE = "key_points"
+
+# Where a chunk may end: after a sentence, else at any whitespace
+_SENTENCE_END_RE = re.compile(r'[.!?]\s')
+
+# Whitespace-separated words, counted without building a word list
+_WORD_RE = re.compile(r'\S+')
+
+# Markdown emphasis left in text nodes after the HTML conversion
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_ITALIC_RE = re.compile(r'\*(.*?)\*')
+
+# Inline HTML tags kept as reportlab paragraph markup
+_INLINE_TAGS = {'strong': 'b', 'b': 'b', 'em': 'i', 'i': 'i', 'u': 'u', 'code': 'font'}
+
+
+
+_markdown_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _markdown_converter():
+    """Markdown converter (with tables) shared by all PDF conversions."""
+    import markdown
+    
+    return markdown.Markdown(extensions=['tables'])
+
+
+@lru_cache(maxsize=64)
+def _markdown_to_html(markdown_content: str) -> str:
+    """Convert markdown to HTML, reusing results for repeated content."""
+    # The converter keeps per-document state, so one conversion at a time
+    with _markdown_lock:
+        return _markdown_converter().reset().convert(markdown_content)
+
+
+@lru_cache(maxsize=None)
+def _pdf_block_styles() -> Dict[str, Tuple[Any, int]]:
+    """Paragraph style and following space per block tag, built on first use."""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib import colors
+    
+    styles = getSampleStyleSheet()
+    
+    # Custom styles
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=16,
+        spaceAfter=12,
+        textColor=colors.darkblue
+    )
+    
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=14,
+        spaceAfter=8,
+        textColor=colors.darkgreen
+    )
+    
+    return {
+        'h1': (title_style, 12),
+        'h2': (heading_style, 8),
+        'h3': (styles['Heading3'], 6),
+        'p': (styles['Normal'], 6),
+        'li': (styles['Normal'], 0),
+    }
+
+
+@lru_cache(maxsize=None)
+def _pdf_table_style():
+    """Style shared by every table in generated PDFs, built on first use."""
+    from reportlab.platypus import TableStyle
+    from reportlab.lib import colors
+    
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+
+
+@lru_cache(maxsize=None)
+def _plain_text_frag(style):
+    """Text fragment reportlab's markup parser produces for unmarked text in ``style``."""
+    from reportlab.platypus import Paragraph
+    
+    return Paragraph('x', style).frags[0]
+
+
+class _StoryBuilder(HTMLParser):
+    """
+    Build a reportlab story from markdown's HTML output in a single pass.
+    
+    Headings, paragraphs and list items become Paragraphs, tables become
+    Tables; inline emphasis and links are kept as paragraph markup.
+    """
+    
+    def __init__(self, block_styles: Dict[str, Tuple[Any, int]], table_style):
+        """
+        Args:
+            block_styles: Paragraph style and following space per block tag (h1-h3, p, li)
+            table_style: TableStyle applied to every table
+        """
+        super().__init__(convert_charrefs=True)
+        from reportlab.platypus import Paragraph, Spacer, Table
+        from reportlab.platypus.paragraph import cleanBlockQuotedText
+        self._Paragraph, self._Spacer, self._Table = Paragraph, Spacer, Table
+        self._clean = cleanBlockQuotedText
+        self.block_styles = block_styles
+        self.table_style = table_style
+        self.story: List[Any] = []
+        self._block: Optional[str] = None  # open h1/h2/h3/p/li block
+        self._parts: List[str] = []  # markup of the open block
+        self._list_depth = 0
+        self._links: List[bool] = []  # whether each open <a> was emitted
+        self._rows: Optional[List[List[str]]] = None  # rows of the open table
+        self._row: List[str] = []
+        self._cell: Optional[List[str]] = None  # text of the open table cell
+    
+    def handle_starttag(self, tag, attrs):
+        if self._cell is not None:
+            return
+        if tag in ('td', 'th'):
+            self._cell = []
+        elif tag == 'tr':
+            self._row = []
+        elif tag == 'table':
+            self._rows = []
+        elif tag in ('ul', 'ol'):
+            self._list_depth += 1
+        elif tag == 'li':
+            self._flush()
+            self._block = 'li'
+            self._parts = ['• ']
+        elif tag in self.block_styles:
+            # A paragraph inside a list item stays part of the item
+            if self._block is None:
+                self._block = tag
+                self._parts = []
+        elif self._block is not None:
+            if tag == 'a':
+                href = dict(attrs).get('href')
+                self._links.append(bool(href))
+                if href:
+                    self._parts.append(f'<a href="{escape(href)}">')
+            elif tag in _INLINE_TAGS:
+                self._parts.append('<font face="Courier">' if tag == 'code' else f'<{_INLINE_TAGS[tag]}>')
+    
+    def handle_endtag(self, tag):
+        if tag in ('td', 'th'):
+            if self._cell is not None:
+                self._row.append(''.join(self._cell).strip())
+                self._cell = None
+        elif self._cell is not None:
+            return
+        elif tag == 'tr':
+            if self._rows is not None and self._row:
+                self._rows.append(self._row)
+        elif tag == 'table':
+            if self._rows:
+                table = self._Table(self._rows)
+                table.setStyle(self.table_style)
+                self.story.append(table)
+                self.story.append(self._Spacer(1, 12))
+            self._rows = None
+        elif tag in ('ul', 'ol'):
+            self._flush()
+            self._list_depth = max(0, self._list_depth - 1)
+            if self._list_depth == 0:
+                self.story.append(self._Spacer(1, 6))
+        elif tag == self._block:
+            self._flush()
+        elif self._block is not None:
+            if tag == 'a':
+                if self._links and self._links.pop():
+                    self._parts.append('</a>')
+            elif tag in _INLINE_TAGS:
+                self._parts.append(f'</{_INLINE_TAGS[tag]}>')
+    
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+        elif self._block is not None:
+            text = escape(data, quote=False)
+            if self._block == 'p':
+                text = _ITALIC_RE.sub(r'<i>\1</i>', _BOLD_RE.sub(r'<b>\1</b>', text))
+            self._parts.append(text)
+        elif data.strip() and self._rows is None and not self._list_depth:
+            # Text outside any block
+            text = _ITALIC_RE.sub(r'<i>\1</i>', _BOLD_RE.sub(r'<b>\1</b>', escape(data.strip(), quote=False)))
+            self.story.append(self._paragraph(text, self.block_styles['p'][0]))
+            self.story.append(self._Spacer(1, 6))
+    
+    def _paragraph(self, markup: str, style):
+        """
+        Build a Paragraph, skipping reportlab's markup parser for plain text.
+        
+        Most summary paragraphs carry no tags or entities, so their single
+        text fragment is cloned from the style's instead of parsed.
+        """
+        if '<' in markup or '&' in markup:
+            return self._Paragraph(markup, style)
+        text = self._clean(markup)
+        frag = _plain_text_frag(style).clone(text=text, link=[], us_lines=[])
+        return self._Paragraph(text, style, frags=[frag])
+    
+    def _flush(self):
+        """Emit the open block as a paragraph."""
+        if self._block is None:
+            return
+        style, space = self.block_styles[self._block]
+        self.story.append(self._paragraph(''.join(self._parts).strip(), style))
+        # List items are spaced once, after the whole list
+        if self._block != 'li':
+            self.story.append(self._Spacer(1, space))
+        self._block = None
+        self._parts = []
+
+
+class _RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute budgets for concurrent API calls.
+    
+    Both budgets refill continuously up to their per-minute capacity; callers
+    wait until the next request fits. Used from a single event loop, so no
+    lock is needed.
+    """
+    
+    def __init__(self, max_rpm: int, max_tpm: int):
+        self.max_rpm = max_rpm
+        self.max_tpm = max_tpm
+        self.available_requests = float(max_rpm)
+        self.available_tokens = float(max_tpm)
+        self._updated = time.monotonic()
+    
+    async def acquire(self, tokens: int):
+        """Wait until one request of ``tokens`` tokens fits in both budgets, then spend it."""
+        tokens = min(tokens, self.max_tpm)
+        while True:
+            now = time.monotonic()
+            elapsed, self._updated = now - self._updated, now
+            self.available_requests = min(self.max_rpm, self.available_requests + elapsed * self.max_rpm / 60)
+            self.available_tokens = min(self.max_tpm, self.available_tokens + elapsed * self.max_tpm / 60)
+            
+            if self.available_requests >= 1 and self.available_tokens >= tokens:
+                self.available_requests -= 1
+                self.available_tokens -= tokens
+                return
+            
+            await asyncio.sleep(max((1 - self.available_requests) * 60 / self.max_rpm,
+                                    (tokens - self.available_tokens) * 60 / self.max_tpm))
+
+
+@lru_cache(maxsize=None)
+def _text_token_budget(model: str) -> int:
+    """Tokens of transcript that fit in a request to ``model`` next to the prompt and completion."""
+    prefixes = [prefix for prefix in _CONTEXT_WINDOWS if model.startswith(prefix)]
+    context = _CONTEXT_WINDOWS[max(prefixes, key=len)] if prefixes else _DEFAULT_CONTEXT_WINDOW
+    return context - _MAX_COMPLETION_TOKENS - _PROMPT_OVERHEAD_TOKENS
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count of English text (~4 characters per token)."""
+    return len(text) // 4
+
+
+def _chunk_text(text: str, tokens_per_chunk: int = _CHUNK_TOKENS) -> List[str]:
+    """
+    Split text into chunks of about ``tokens_per_chunk`` tokens.
+    
+    Chunks end at the last sentence break before the limit, or at the last
+    whitespace when a chunk has no sentence break.
+    """
+    limit = tokens_per_chunk * 4
+    chunks = []
+    start = 0
+    while len(text) - start > limit:
+        end = start + limit
+        breaks = [match.end() for match in _SENTENCE_END_RE.finditer(text, start + limit // 2, end)]
+        if breaks:
+            end = breaks[-1]
+        else:
+            space = text.rfind(' ', start + limit // 2, end)
+            if space != -1:
+                end = space + 1
+        chunks.append(text[start:end].strip())
+        start = end
+    chunks.append(text[start:].strip())
+    return [chunk for chunk in chunks if chunk]
+
+
+def _request_tokens(request: Dict[str, Any]) -> int:
+    """Rough token cost of a chat request: ~4 characters per prompt token plus the completion limit."""
+    return sum(len(message['content']) for message in request['messages']) // 4 + request['max_tokens']
+
+
 class AISummarizer:
     """Handles AI-powered text summarization using OpenAI."""
     
-    def __init__(self, api_key: str, model: str = "gpt-4"):
+    def __init__(self, api_key: str, model: str = "gpt-4", cache: Optional[SummaryCache] = None):
         """
         Initialize AI summarizer.
         
         Args:
             api_key: OpenAI API key
             model: OpenAI model to use (gpt-4, gpt-3.5-turbo)
+            cache: Summary cache consulted before each request (None to always call the API)
         """
-        self.client = OpenAI(api_key=api_key)
+        self.api_key = api_key
         self.model = model
+        self.cache = cache
         self.prompt_manager = PromptManager()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # started by run_async
+        self._loop_pid: Optional[int] = None  # a forked worker must start its own loop thread
+        self._aclient: Optional["AsyncOpenAI"] = None
+        self._loop_lock = threading.Lock()
         
         console.print(f"[blue]Initialized AI Summarizer with model: {model}[/blue]")
     
+    @cached_property
+    def client(self) -> "OpenAI":
+        """OpenAI client, created on first request."""
+        from openai import OpenAI
+        
+        return OpenAI(api_key=self.api_key)
+    
     def summarize(self, text: str, length: str = "medium", style: str = "comprehensive") -> Dict[str, Any]:
         """
         Generate AI summary of the given text.
         
+        Long transcripts (over ~8000 tokens, or more than fits the model's
+        context window) are split into chunks that are
+        summarized concurrently, and the chunk summaries are then summarized
+        in the requested style; the result also lists ``partial_summaries``.
+        
         Args:
             text: Text to summarize
             length: Summary length (short, medium, long)
@@ -41,34 +424,20 @@ class AISummarizer:
         Returns:
             Dictionary containing summary data
         """
-        if not text.strip():
-            raise ValueError("Text cannot be empty")
+        key, cached = self._cache_lookup(text, length, style)
+        if cached is not None:
+            return cached
         
-        # Define length constraints
-        length_constraints = {
-            'short': 150,
-            'medium': 300,
-            'long': 500
-        }
+        if self._needs_map_reduce(text):
+            partials = self.run_async(self.summarize_many(_chunk_text(text), length=length, style=_CHUNK_STYLE))
+            result = self.summarize(self._reduce_input(partials), length=length, style=style)
+            return self._cache_store(key, self._with_partials(result, partials))
         
-        max_length = length_constraints.get(length, 300)
+        request = self._chat_request(text, length, style)
         
-        # Create prompt based on style using the prompt manager
-        try:
-            variables = {
-                'text': text[:200000],  # Limit text length for large transcripts
-                'max_length': max_length
-            }
-            prompt = self.prompt_manager.get_prompt(style, variables)
-        except ValueError as e:
-            # Fallback to default prompt if style not found
-            console.print(f"[yellow]Warning: Unknown prompt style '{style}'. Using default.[/yellow]")
-            default_style = self.prompt_manager.get_default_prompt()
-            variables = {
-                'text': text[:200000],
-                'max_length': max_length
-            }
-            prompt = self.prompt_manager.get_prompt(default_style, variables)
+        if not console.is_terminal:
+            # No spinner (and its refresh thread) when output is not a terminal
+            return self._cache_store(key, self._summary_data(*self._stream_summary(request), length, style))
         
         with Progress(
             SpinnerColumn(),
@@ -78,34 +447,475 @@ class AISummarizer:
             task = progress.add_task("Generating AI summary...", total=None)
             
             try:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": "You are an expert content summarizer. Create clear, accurate, and engaging summaries."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=4000,  # Increased significantly for detailed summaries
-                    temperature=0.3,  # Balanced creativity and accuracy
+                summary, tokens_used = self._stream_summary(
+                    request,
+                    lambda words: progress.update(task, description=f"Generating AI summary... (~{words} words)")
                 )
                 
-                summary = response.choices[0].message.content.strip() if response.choices[0].message.content else ""
-                
                 progress.update(task, description="✅ Summary generated successfully!")
                 
-                return {
-                    'summary': summary,
-                    'length': length,
-                    'style': style,
-                    'word_count': len(summary.split()),
-                    'model_used': self.model,
-                    'tokens_used': response.usage.total_tokens if hasattr(response, 'usage') and response.usage else None
-                }
+                return self._cache_store(key, self._summary_data(summary, tokens_used, length, style))
                 
             except Exception as e:
                 progress.update(task, description=f"❌ Summarization failed: {e}")
                 raise
     
-
+    def summarize_stream(self, text: str, length: str = "medium",
+                         style: str = "comprehensive") -> Generator[str, None, Dict[str, Any]]:
+        """
+        Generate an AI summary, yielding its text as it arrives.
+        
+        For callers that show or write the summary while it is generated,
+        e.g. ``for piece in summarizer.summarize_stream(text): print(piece, end="")``.
+        A cached summary is yielded in one piece; for long transcripts only
+        the final (reduce) summary is streamed.
+        
+        Args:
+            text: Text to summarize
+            length: Summary length (short, medium, long)
+            style: Summary style (comprehensive, bullet_points, key_points, structured)
+            
+        Returns:
+            The summary data (as from ``summarize``), as the generator's return value
+        """
+        key, cached = self._cache_lookup(text, length, style)
+        if cached is not None:
+            yield cached['summary']
+            return cached
+        
+        if self._needs_map_reduce(text):
+            partials = self.run_async(self.summarize_many(_chunk_text(text), length=length, style=_CHUNK_STYLE))
+            result = yield from self.summarize_stream(self._reduce_input(partials), length=length, style=style)
+            return self._cache_store(key, self._with_partials(result, partials))
+        
+        pieces = []
+        usage: List[int] = []
+        for piece in self._stream_pieces(self._chat_request(text, length, style), usage):
+            pieces.append(piece)
+            yield piece
+        
+        summary_data = self._summary_data(''.join(pieces).strip(), usage[0] if usage else None, length, style)
+        return self._cache_store(key, summary_data)
+    
+    def summarize_multi_style(self, text: str, styles: List[str], length: str = "medium") -> Dict[str, Dict[str, Any]]:
+        """
+        Generate summaries in several styles with a single request.
+        
+        The transcript is sent once, followed by each style's instructions,
+        and the model answers with a JSON object keyed by style. Styles with
+        a cached summary are left out of the request.
+        
+        Args:
+            text: Text to summarize
+            styles: Summary styles to produce (prompt keys)
+            length: Summary length (short, medium, long)
+            
+        Returns:
+            Summary data per style; ``tokens_used`` is that of the shared request
+            
+        Raises:
+            ValueError: If a style is unknown or the reply lacks a style's summary
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        keys: Dict[str, Optional[str]] = {}
+        for style in dict.fromkeys(styles):
+            keys[style], cached = self._cache_lookup(text, length, style)
+            if cached is not None:
+                results[style] = cached
+        
+        missing = [style for style in keys if style not in results]
+        if not missing:
+            return results
+        
+        request = self._multi_style_request(text, missing, length)
+        response = self.client.chat.completions.create(**request)
+        tokens_used = response.usage.total_tokens if response.usage else None
+        
+        try:
+            summaries = json.loads(response.choices[0].message.content or "{}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Multi-style summary reply is not valid JSON: {e}")
+        
+        for style in missing:
+            summary = summaries.get(style)
+            if not isinstance(summary, str):
+                raise ValueError(f"Multi-style summary reply has no summary for style '{style}'")
+            results[style] = self._cache_store(keys[style], self._summary_data(summary.strip(), tokens_used, length, style))
+        
+        return {style: results[style] for style in keys}
+    
+    def submit_batch(self, texts: Mapping[str, str], length: str = "medium", style: str = "comprehensive") -> str:
+        """
+        Submit summaries to OpenAI's Batch API for offline processing.
+        
+        Batch requests cost half the regular price and do not count against
+        the per-minute rate limits, but results are only guaranteed within
+        24 hours; use ``summarize_many`` when summaries are needed now. Each
+        transcript is trimmed to the model's context budget (no map-reduce).
+        
+        Args:
+            texts: Text to summarize per caller-chosen id (e.g. video id)
+            length: Summary length (short, medium, long)
+            style: Summary style (comprehensive, bullet_points, key_points, structured)
+            
+        Returns:
+            Batch id to pass to ``poll_batch``
+        """
+        lines = [
+            json.dumps({
+                'custom_id': custom_id,
+                'method': 'POST',
+                'url': '/v1/chat/completions',
+                'body': self._chat_request(text, length, style),
+            }, ensure_ascii=False)
+            for custom_id, text in texts.items()
+        ]
+        
+        batch_file = self.client.files.create(
+            file=('summaries.jsonl', "\n".join(lines).encode('utf-8')),
+            purpose='batch'
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint='/v1/chat/completions',
+            completion_window='24h',
+            metadata={'length': length, 'style': style}
+        )
+        console.print(f"[blue]Submitted batch {batch.id} with {len(lines)} summaries[/blue]")
+        return batch.id
+    
+    def poll_batch(self, batch_id: str, interval: float = 60) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Wait for a batch from ``submit_batch`` to finish and yield its summaries.
+        
+        Args:
+            batch_id: Id returned by ``submit_batch``
+            interval: Seconds between status checks
+            
+        Yields:
+            (custom id, summary data) for each request that succeeded
+            
+        Raises:
+            RuntimeError: If the batch failed, expired or was cancelled
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+            time.sleep(interval)
+            batch = self.client.batches.retrieve(batch_id)
+        
+        if batch.status != 'completed' or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch_id} ended with status '{batch.status}'")
+        
+        metadata = batch.metadata or {}
+        length = metadata.get('length', 'medium')
+        style = metadata.get('style', 'comprehensive')
+        
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get('response') or {}
+            if record.get('error') or response.get('status_code') != 200:
+                reason = record.get('error') or f"HTTP {response.get('status_code')}"
+                console.print(f"[yellow]Warning: batch request {record.get('custom_id')} failed: {reason}[/yellow]")
+                continue
+            body = response['body']
+            content = body['choices'][0]['message']['content'] or ""
+            tokens_used = (body.get('usage') or {}).get('total_tokens')
+            yield record['custom_id'], self._summary_data(content.strip(), tokens_used, length, style)
+    
+    async def asummarize(self, text: str, length: str = "medium", style: str = "comprehensive",
+                         client: Optional["AsyncOpenAI"] = None) -> Dict[str, Any]:
+        """
+        Generate an AI summary without blocking the event loop.
+        
+        Same as ``summarize`` but awaits the OpenAI request, so several
+        summaries can be requested concurrently with ``asyncio.gather``.
+        
+        Args:
+            text: Text to summarize
+            length: Summary length (short, medium, long)
+            style: Summary style (comprehensive, bullet_points, key_points, structured)
+            client: Async client to send the request with; pass one from
+                ``async_client()`` to share its connection pool across requests
+            
+        Returns:
+            Dictionary containing summary data
+        """
+        key, cached = self._cache_lookup(text, length, style)
+        if cached is not None:
+            return cached
+        
+        if self._needs_map_reduce(text):
+            return self._cache_store(key, await self._amap_reduce(text, length, style, client))
+        
+        request = self._chat_request(text, length, style)
+        
+        if client is None:
+            async with self._request_client() as client:
+                response = await client.chat.completions.create(**request)
+        else:
+            response = await client.chat.completions.create(**request)
+        
+        return self._cache_store(key, self._response_data(response, length, style))
+    
+    async def summarize_many(self, texts: List[str], length: str = "medium", style: str = "comprehensive",
+                             max_concurrent: int = 10, max_tpm: int = 90000, max_rpm: int = 3500,
+                             max_retries: int = 5, return_exceptions: bool = False) -> List[Any]:
+        """
+        Summarize several texts with concurrent, rate-limited OpenAI requests.
+        
+        At most ``max_concurrent`` requests are in flight, and requests wait
+        for room in the per-minute request and token budgets. A request that
+        still hits the rate limit is retried with exponential backoff.
+        
+        Args:
+            texts: Texts to summarize
+            length: Summary length (short, medium, long)
+            style: Summary style (comprehensive, bullet_points, key_points, structured)
+            max_concurrent: Maximum number of requests in flight
+            max_tpm: Token budget per minute
+            max_rpm: Request budget per minute
+            max_retries: Retries per request after a rate limit error
+            return_exceptions: Return a failed text's exception in its place
+                instead of raising it
+            
+        Returns:
+            Summary data (or exception) for each text, in input order
+        """
+        from openai import RateLimitError
+        
+        semaphore = asyncio.Semaphore(max_concurrent)
+        limiter = _RateLimiter(max_rpm, max_tpm)
+        
+        async def _one(client: "AsyncOpenAI", text: str) -> Dict[str, Any]:
+            key, cached = self._cache_lookup(text, length, style)
+            if cached is not None:
+                return cached
+            
+            if self._needs_map_reduce(text):
+                return self._cache_store(key, await self._amap_reduce(text, length, style, client))
+            
+            request = self._chat_request(text, length, style)
+            tokens = _request_tokens(request)
+            async with semaphore:
+                for attempt in range(max_retries + 1):
+                    await limiter.acquire(tokens)
+                    try:
+                        response = await client.chat.completions.create(**request)
+                        break
+                    except RateLimitError:
+                        if attempt == max_retries:
+                            raise
+                        await asyncio.sleep(min(60, 2 ** attempt))
+            
+            return self._cache_store(key, self._response_data(response, length, style))
+        
+        async with self._request_client() as client:
+            return await asyncio.gather(*(_one(client, text) for text in texts),
+                                        return_exceptions=return_exceptions)
+    
+    def run_async(self, coro: Awaitable[_T]) -> _T:
+        """
+        Run a coroutine (e.g. ``summarize_many``) from synchronous code and return its result.
+        
+        Coroutines run on an event loop owned by the summarizer, on a daemon
+        thread started on first use, where requests share one async client and
+        its pool of kept-alive connections. Unlike ``asyncio.run``, repeated
+        calls reuse those connections instead of opening new ones each time.
+        """
+        with self._loop_lock:
+            if self._loop is None or self._loop_pid != os.getpid():
+                self._loop = asyncio.new_event_loop()
+                self._loop_pid = os.getpid()
+                self._aclient = None
+                threading.Thread(target=self._loop.run_forever, name="AISummarizer-loop", daemon=True).start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+    
+    @asynccontextmanager
+    async def _request_client(self) -> AsyncIterator["AsyncOpenAI"]:
+        """
+        Async client for requests made without a caller-supplied one.
+        
+        On the summarizer's own loop (``run_async``) that is the shared client;
+        on any other loop, a client for just this call, closed afterwards.
+        """
+        if self._loop is not None and asyncio.get_running_loop() is self._loop:
+            if self._aclient is None:
+                self._aclient = self.async_client()
+            yield self._aclient
+        else:
+            async with self.async_client() as client:
+                yield client
+    
+    def async_client(self) -> "AsyncOpenAI":
+        """
+        Create an async OpenAI client for ``asummarize``.
+        
+        Its connections belong to the event loop that uses them, so create
+        one per ``asyncio.run`` and close it (``async with``) afterwards;
+        coroutines run through ``run_async`` share one client instead.
+        """
+        from openai import AsyncOpenAI
+        
+        return AsyncOpenAI(api_key=self.api_key)
+    
+    def _chat_request(self, text: str, length: str, style: str) -> Dict[str, Any]:
+        """Build the chat completion arguments for a summary request."""
+        if not text.strip():
+            raise ValueError("Text cannot be empty")
+        
+        variables = {
+            'text': _TRANSCRIPT_MESSAGE_REFERENCE,
+            'max_length': _LENGTH_CONSTRAINTS.get(length, 300)
+        }
+        
+        # Style instructions from the prompt manager, with the transcript left out
+        try:
+            instructions = self.prompt_manager.get_prompt(style, variables)
+        except ValueError as e:
+            # Fallback to default prompt if style not found
+            console.print(f"[yellow]Warning: Unknown prompt style '{style}'. Using default.[/yellow]")
+            default_style = self.prompt_manager.get_default_prompt()
+            instructions = self.prompt_manager.get_prompt(default_style, variables)
+        
+        text = self._fit_text(text)
+        
+        # Instructions first and the transcript last, so requests for the same
+        # style and length share a byte-identical prefix
+        return {
+            'model': self.model,
+            'messages': [
+                {"role": "system", "content": f"{_SYSTEM_PROMPT}\n\n{instructions}"},
+                {"role": "user", "content": f"<transcript>\n{text}\n</transcript>"}
+            ],
+            'max_tokens': _MAX_COMPLETION_TOKENS,
+            'temperature': 0.3,  # Balanced creativity and accuracy
+        }
+    
+    def _needs_map_reduce(self, text: str) -> bool:
+        """Whether a transcript is summarized in chunks: it is long, or does not fit the model's context."""
+        return _estimate_tokens(text) > min(_MAP_REDUCE_TOKENS, _text_token_budget(self.model))
+    
+    async def _amap_reduce(self, text: str, length: str, style: str,
+                           client: Optional["AsyncOpenAI"] = None) -> Dict[str, Any]:
+        """Summarize a long transcript chunk by chunk, then reduce the chunk summaries."""
+        partials = await self.summarize_many(_chunk_text(text), length=length, style=_CHUNK_STYLE)
+        result = await self.asummarize(self._reduce_input(partials), length=length, style=style, client=client)
+        return self._with_partials(result, partials)
+    
+    def _fit_text(self, text: str) -> str:
+        """Trim text to the model's transcript token budget; most fit and are returned as is."""
+        max_chars = _text_token_budget(self.model) * 4
+        return text if len(text) <= max_chars else text[:max_chars]
+    
+    def _multi_style_request(self, text: str, styles: List[str], length: str) -> Dict[str, Any]:
+        """Build the chat completion arguments for a ``summarize_multi_style`` request."""
+        if not text.strip():
+            raise ValueError("Text cannot be empty")
+        
+        # Each style's template is rendered against a reference to the transcript,
+        # so the transcript itself is included only once
+        variables = {'text': _TRANSCRIPT_REFERENCE, 'max_length': _LENGTH_CONSTRAINTS.get(length, 300)}
+        instructions = "\n\n".join(
+            f"### {style}\n{self.prompt_manager.get_prompt(style, variables)}" for style in styles
+        )
+        
+        prompt = (
+            f"Transcript:\n{self._fit_text(text)}\n\n"
+            f"Produce a JSON object with the keys {json.dumps(styles)}. Each value is the summary "
+            f"written according to the instructions for that key below, where {_TRANSCRIPT_REFERENCE} "
+            f"refers to the transcript.\n\n{instructions}"
+        )
+        
+        return {
+            'model': self.model,
+            'messages': [
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            'max_tokens': _MAX_COMPLETION_TOKENS,
+            'temperature': 0.3,
+            'response_format': {"type": "json_object"},
+        }
+    
+    def _stream_summary(self, request: Dict[str, Any],
+                        on_progress: Optional[Callable[[int], None]] = None) -> Tuple[str, Optional[int]]:
+        """
+        Send a chat completion request and read the reply as it streams in.
+        
+        Args:
+            request: Arguments from ``_chat_request``
+            on_progress: Called with an approximate running word count
+            
+        Returns:
+            (summary text, total tokens used if reported)
+        """
+        pieces = []
+        words = 0
+        usage: List[int] = []
+        for piece in self._stream_pieces(request, usage):
+            pieces.append(piece)
+            if on_progress is not None:
+                words += piece.count(' ')
+                on_progress(words)
+        return ''.join(pieces).strip(), usage[0] if usage else None
+    
+    def _stream_pieces(self, request: Dict[str, Any], usage: List[int]) -> Generator[str, None, None]:
+        """Yield the reply text of a streamed chat completion; appends the total tokens to ``usage``."""
+        stream = self.client.chat.completions.create(**request, stream=True, stream_options={'include_usage': True})
+        for chunk in stream:
+            if chunk.choices:
+                piece = chunk.choices[0].delta.content
+                if piece:
+                    yield piece
+            if chunk.usage:
+                usage.append(chunk.usage.total_tokens)
+    
+    def _cache_lookup(self, text: str, length: str, style: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Return the cache key for a request and its cached summary data, if any."""
+        if self.cache is None:
+            return None, None
+        key = SummaryCache.make_key(self.model, style, length, text)
+        return key, self.cache.get(key)
+    
+    def _cache_store(self, key: Optional[str], data: Dict[str, Any]) -> Dict[str, Any]:
+        """Store summary data under a key from ``_cache_lookup`` and return it."""
+        if key is not None:
+            self.cache.put(key, data)
+        return data
+    
+    @staticmethod
+    def _reduce_input(partials: List[Dict[str, Any]]) -> str:
+        """Join chunk summaries into the text summarized by the reduce step."""
+        return "\n\n".join(f"Part {index}:\n{partial['summary']}" for index, partial in enumerate(partials, 1))
+    
+    @staticmethod
+    def _with_partials(result: Dict[str, Any], partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Add the chunk summaries (and their tokens) to a reduce step's summary data."""
+        tokens = [data['tokens_used'] for data in (result, *partials) if data.get('tokens_used') is not None]
+        return {
+            **result,
+            'tokens_used': sum(tokens) if tokens else None,
+            'partial_summaries': [partial['summary'] for partial in partials],
+        }
+    
+    def _response_data(self, response, length: str, style: str) -> Dict[str, Any]:
+        """Build the summary data for a (non-streamed) chat completion response."""
+        content = response.choices[0].message.content
+        tokens_used = response.usage.total_tokens if response.usage else None
+        return self._summary_data((content or "").strip(), tokens_used, length, style)
+    
+    def _summary_data(self, summary: str, tokens_used: Optional[int], length: str, style: str) -> Dict[str, Any]:
+        """Build the summary data returned by ``summarize``."""
+        return {
+            'summary': summary,
+            'length': length,
+            'style': style,
+            'word_count': sum(1 for _ in _WORD_RE.finditer(summary)),
+            'model_used': self.model,
+            'tokens_used': tokens_used
+        }
     
     def markdown_to_pdf(self, markdown_content: str, output_path: str) -> bool:
         """
@@ -118,124 +928,26 @@ class AISummarizer:
         Returns:
             True if successful, False otherwise
         """
+        if not _HAS_PDF:
+            console.print("[red]Error generating PDF: markdown and reportlab are required[/red]")
+            return False
+        
         try:
-            import markdown
-            from reportlab.lib.pagesizes import letter, A4
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.lib.units import inch
-            from reportlab.lib import colors
-            import re
+            from reportlab.lib.pagesizes import A4
+            from reportlab.platypus import SimpleDocTemplate
             
             # Convert markdown to HTML first
-            html_content = markdown.markdown(markdown_content, extensions=['tables'])
-            
-            # Create PDF document
-            doc = SimpleDocTemplate(output_path, pagesize=A4)
-            styles = getSampleStyleSheet()
-            story = []
+            html_content = _markdown_to_html(markdown_content)
             
-            # Custom styles
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=16,
-                spaceAfter=12,
-                textColor=colors.darkblue
-            )
+            # Create PDF document; page streams are always compressed, whatever
+            # the installed reportlab's rl_config default
+            doc = SimpleDocTemplate(output_path, pagesize=A4, pageCompression=1)
             
-            heading_style = ParagraphStyle(
-                'CustomHeading',
-                parent=styles['Heading2'],
-                fontSize=14,
-                spaceAfter=8,
-                textColor=colors.darkgreen
-            )
-            
-            # Parse HTML and convert to reportlab elements
-            lines = html_content.split('\n')
-            i = 0
-            while i < len(lines):
-                line = lines[i].strip()
-                
-                if line.startswith('<h1>'):
-                    # Title
-                    text = re.sub(r'<h1>(.*?)</h1>', r'\1', line)
-                    story.append(Paragraph(text, title_style))
-                    story.append(Spacer(1, 12))
-                    
-                elif line.startswith('<h2>'):
-                    # Heading
-                    text = re.sub(r'<h2>(.*?)</h2>', r'\1', line)
-                    story.append(Paragraph(text, heading_style))
-                    story.append(Spacer(1, 8))
-                    
-                elif line.startswith('<h3>'):
-                    # Subheading
-                    text = re.sub(r'<h3>(.*?)</h3>', r'\1', line)
-                    story.append(Paragraph(text, styles['Heading3']))
-                    story.append(Spacer(1, 6))
-                    
-                elif line.startswith('<table>'):
-                    # Handle table
-                    table_data = []
-                    i += 1  # Skip <table> tag
-                    while i < len(lines) and not lines[i].strip().startswith('</table>'):
-                        if lines[i].strip().startswith('<tr>'):
-                            row = []
-                            i += 1
-                            while i < len(lines) and not lines[i].strip().startswith('</tr>'):
-                                cell_match = re.search(r'<t[dh]>(.*?)</t[dh]>', lines[i])
-                                if cell_match:
-                                    row.append(cell_match.group(1))
-                                i += 1
-                            if row:
-                                table_data.append(row)
-                        i += 1
-                    
-                    if table_data:
-                        table = Table(table_data)
-                        table.setStyle(TableStyle([
-                            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                            ('FONTSIZE', (0, 0), (-1, 0), 12),
-                            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                        ]))
-                        story.append(table)
-                        story.append(Spacer(1, 12))
-                    
-                elif line.startswith('<ul>') or line.startswith('<ol>'):
-                    # Handle lists
-                    i += 1
-                    while i < len(lines) and not lines[i].strip().startswith('</ul>') and not lines[i].strip().startswith('</ol>'):
-                        if lines[i].strip().startswith('<li>'):
-                            text = re.sub(r'<li>(.*?)</li>', r'• \1', lines[i])
-                            story.append(Paragraph(text, styles['Normal']))
-                        i += 1
-                    story.append(Spacer(1, 6))
-                    
-                elif line.startswith('<p>'):
-                    # Paragraph
-                    text = re.sub(r'<p>(.*?)</p>', r'\1', line)
-                    # Convert markdown bold/italic
-                    text = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', text)
-                    text = re.sub(r'\*(.*?)\*', r'<i>\1</i>', text)
-                    story.append(Paragraph(text, styles['Normal']))
-                    story.append(Spacer(1, 6))
-                    
-                elif line and not line.startswith('<'):
-                    # Plain text
-                    text = line
-                    text = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', text)
-                    text = re.sub(r'\*(.*?)\*', r'<i>\1</i>', text)
-                    story.append(Paragraph(text, styles['Normal']))
-                    story.append(Spacer(1, 6))
-                
-                i += 1
+            # Convert the HTML to reportlab elements in one pass
+            builder = _StoryBuilder(_pdf_block_styles(), _pdf_table_style())
+            builder.feed(html_content)
+            builder.close()
+            story = builder.story
             
             # Build PDF
             doc.build(story)
@@ -273,11 +985,7 @@ class AISummarizer:
             output_cost_per_1k = 0.002
         
         input_tokens = text_length * 1.3  # Rough estimate
-        output_tokens = {
-            'short': 150,
-            'medium': 300,
-            'long': 500
-        }.get(length, 300)
+        output_tokens = _LENGTH_CONSTRAINTS.get(length, 300)
         
         input_cost = (input_tokens / 1000) * input_cost_per_1k
         output_cost = (output_tokens / 1000) * output_cost_per_1k
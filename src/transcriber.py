@@ -4,36 +4,103 @@ Optimized for M2 MacBook Air performance.
 """
 
 import os
+import dataclasses
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
-from faster_whisper import WhisperModel
+from typing import Optional, Dict, Any, List, Tuple
+import numpy as np
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 
 console = Console()
 
+# Sample rate Whisper works at; decode_audio resamples to it
+_SAMPLE_RATE = 16000
+
+# Chunk boundaries for parallel transcription move to the quietest 100 ms
+# frame within this many seconds of the nominal boundary
+_SPLIT_SEARCH_SEC = 5.0
+_SPLIT_FRAME = _SAMPLE_RATE // 10
+
+
+def _split_points(audio: np.ndarray, chunk_sec: float) -> List[Tuple[int, int]]:
+    """
+    Split audio into (start, end) sample ranges of about ``chunk_sec`` seconds.
+    
+    Each boundary is placed in the quietest frame near the nominal one, so
+    chunks tend to split between words rather than inside them.
+    """
+    chunk = int(chunk_sec * _SAMPLE_RATE)
+    search = int(_SPLIT_SEARCH_SEC * _SAMPLE_RATE)
+    bounds = [0]
+    while len(audio) - bounds[-1] > chunk + search:
+        target = bounds[-1] + chunk
+        window = audio[target - search:target + search]
+        frames = window[:len(window) // _SPLIT_FRAME * _SPLIT_FRAME].reshape(-1, _SPLIT_FRAME)
+        quietest = int(np.argmin(np.square(frames).mean(axis=1)))
+        bounds.append(target - search + quietest * _SPLIT_FRAME + _SPLIT_FRAME // 2)
+    bounds.append(len(audio))
+    return list(zip(bounds, bounds[1:]))
+
+
+class _NullProgress:
+    """Stands in for a Rich Progress when output is not a terminal: no refresh thread, no output."""
+    
+    def add_task(self, description: str, **kwargs) -> int:
+        return 0
+    
+    def update(self, task_id: int, **kwargs):
+        pass
+
+
+def _shift_word(word, offset: float):
+    """Move a faster-whisper Word (dataclass, or NamedTuple in older releases) by ``offset`` seconds."""
+    if hasattr(word, '_replace'):
+        return word._replace(start=word.start + offset, end=word.end + offset)
+    return dataclasses.replace(word, start=word.start + offset, end=word.end + offset)
+
+
 class WhisperTranscriber:
     """Handles audio transcription using Whisper."""
     
-    def __init__(self, model_size: str = "small", device: str = "auto", compute_type: str = "float16"):
+    def __init__(self, model_size: str = "small", device: str = "auto", compute_type: str = "int8", batch_size: int = 0,
+                 num_workers: int = 1, cpu_threads: int = 0):
         """
         Initialize Whisper transcriber.
         
         Args:
             model_size: Whisper model size (tiny, base, small, medium, large)
             device: Device to use (auto, cpu, cuda, mps)
-            compute_type: Compute type (float16, float32, int8)
+            compute_type: Compute type (float16, float32, int8, int8_float16)
+            batch_size: Decode this many audio chunks per batch (0 = sequential decoding)
+            num_workers: Transcriptions the model can run at once (see ``transcribe_parallel``)
+            cpu_threads: CPU threads per transcription (0 = CTranslate2's default of 4)
         """
         self.model_size = model_size
         self.device = device
         self.compute_type = compute_type
+        self.batch_size = batch_size
+        self.num_workers = max(1, num_workers)
+        self._duration_cache: Dict[Tuple[str, int, int], float] = {}  # duration per (path, mtime, size)
+        
+        # faster-whisper (and CTranslate2) load only when a transcriber is created
+        from faster_whisper import WhisperModel
         
         console.print(f"[blue]Loading Whisper model: {model_size}[/blue]")
         self.model = WhisperModel(
             model_size,
             device=device,
-            compute_type=compute_type
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            num_workers=num_workers
         )
+        # Batched pipeline: VAD-splits the audio and decodes the chunks batch_size at a time.
+        # Imported only when asked for, as it needs faster-whisper 1.1 or later
+        self.pipeline = None
+        if batch_size > 0:
+            from faster_whisper import BatchedInferencePipeline
+            self.pipeline = BatchedInferencePipeline(model=self.model)
         console.print(f"[green]✅ Whisper model loaded successfully![/green]")
     
     def transcribe(self, audio_path: str, language: Optional[str] = None) -> Dict[str, Any]:
@@ -55,31 +122,46 @@ class WhisperTranscriber:
         # Get audio duration for progress tracking
         audio_duration = self._get_audio_duration(audio_path)
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-            console=console
-        ) as progress:
+        # The live display (and its refresh thread) only when output is a terminal
+        if console.is_terminal:
+            progress_display = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                TimeElapsedColumn(),
+                console=console
+            )
+        else:
+            progress_display = nullcontext(_NullProgress())
+        
+        with progress_display as progress:
             task = progress.add_task("Transcribing...", total=audio_duration)
             
             try:
                 # Transcribe with progress updates
-                segments, info = self.model.transcribe(
-                    audio_path,
-                    language=language,
-                    beam_size=5,
-                    word_timestamps=True
-                )
+                if self.pipeline is not None:
+                    segments, info = self.pipeline.transcribe(
+                        audio_path,
+                        language=language,
+                        beam_size=5,
+                        word_timestamps=True,
+                        batch_size=self.batch_size
+                    )
+                else:
+                    segments, info = self.model.transcribe(
+                        audio_path,
+                        language=language,
+                        beam_size=5,
+                        word_timestamps=True
+                    )
                 
                 # Process segments
-                full_text = ""
+                text_parts = []
                 segments_list = []
                 
                 for segment in segments:
-                    full_text += segment.text + " "
+                    text_parts.append(segment.text)
                     segments_list.append({
                         'start': segment.start,
                         'end': segment.end,
@@ -93,7 +175,7 @@ class WhisperTranscriber:
                 progress.update(task, description="✅ Transcription completed!")
                 
                 return {
-                    'text': full_text.strip(),
+                    'text': " ".join(text_parts).strip(),
                     'segments': segments_list,
                     'language': info.language,
                     'language_probability': info.language_probability,
@@ -104,8 +186,103 @@ class WhisperTranscriber:
                 progress.update(task, description=f"❌ Transcription failed: {e}")
                 raise
     
+    def transcribe_parallel(self, audio_path: str, language: Optional[str] = None,
+                            chunk_sec: float = 120, workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Transcribe audio file as chunks decoded concurrently.
+        
+        The audio is decoded once and split near ``chunk_sec`` boundaries at
+        quiet points; chunks are transcribed on a thread pool (CTranslate2
+        releases the GIL) and their timestamps shifted back into place. The
+        model only runs as many chunks at once as its ``num_workers``, so the
+        pool is capped there. Without a language, it is detected on the first
+        chunk and used for all the others.
+        
+        Args:
+            audio_path: Path to audio file
+            language: Language code (optional, auto-detected if None)
+            chunk_sec: Approximate chunk length in seconds
+            workers: Number of chunks transcribed at once (default: the model's ``num_workers``)
+            
+        Returns:
+            Dictionary containing transcription data, as from ``transcribe``
+        """
+        if not os.path.exists(audio_path):
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        
+        console.print(f"[blue]Starting parallel transcription of: {Path(audio_path).name}[/blue]")
+        
+        from faster_whisper import decode_audio
+        
+        audio = decode_audio(audio_path, sampling_rate=_SAMPLE_RATE)
+        bounds = _split_points(audio, chunk_sec)
+        
+        chunks = [(audio[start:end], start / _SAMPLE_RATE) for start, end in bounds]
+        pool_size = max(1, min(workers or self.num_workers, self.num_workers, len(chunks)))
+        
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            first = executor.submit(self._transcribe_chunk, *chunks[0], language)
+            if language is None:
+                # Chunks would each detect their own language; detect it once and share it
+                language = first.result()[1].language
+            futures = [first] + [
+                executor.submit(self._transcribe_chunk, chunk, offset, language)
+                for chunk, offset in chunks[1:]
+            ]
+            results = [future.result() for future in futures]
+        
+        segments_list = [segment for segments, _ in results for segment in segments]
+        info = results[0][1]
+        
+        console.print(f"[green]✅ Transcribed {len(bounds)} chunks[/green]")
+        
+        return {
+            'text': " ".join(segment['text'] for segment in segments_list).strip(),
+            'segments': segments_list,
+            'language': info.language,
+            'language_probability': info.language_probability,
+            'duration': len(audio) / _SAMPLE_RATE
+        }
+    
+    def _transcribe_chunk(self, audio: np.ndarray, offset: float, language: Optional[str]):
+        """Transcribe one chunk of decoded audio, with timestamps shifted by ``offset`` seconds."""
+        segments, info = self.model.transcribe(
+            audio,
+            language=language,
+            beam_size=5,
+            word_timestamps=True
+        )
+        return [
+            {
+                'start': segment.start + offset,
+                'end': segment.end + offset,
+                'text': segment.text,
+                'words': [_shift_word(word, offset) for word in segment.words or []]
+            }
+            for segment in segments
+        ], info
+    
     def _get_audio_duration(self, audio_path: str) -> float:
-        """Get audio duration in seconds."""
+        """Get audio duration in seconds, probing each version of a file once."""
+        stat = os.stat(audio_path)
+        key = (audio_path, stat.st_mtime_ns, stat.st_size)
+        duration = self._duration_cache.get(key)
+        if duration is None:
+            duration = self._duration_cache[key] = self._probe_duration(audio_path, stat.st_size)
+        return duration
+    
+    @staticmethod
+    def _probe_duration(audio_path: str, file_size: int) -> float:
+        """Read audio duration from the container header, else ffprobe, else estimate from size."""
+        # mutagen (optional) reads the container header without an ffprobe process
+        try:
+            from mutagen import File as MutagenFile
+            audio = MutagenFile(audio_path)
+            if audio is not None and audio.info.length:
+                return float(audio.info.length)
+        except Exception:
+            pass
+        
         try:
             import ffmpeg
             probe = ffmpeg.probe(audio_path)
@@ -113,7 +290,6 @@ class WhisperTranscriber:
             return duration
         except Exception:
             # Fallback: estimate based on file size
-            file_size = os.path.getsize(audio_path)
             # Rough estimate: 1MB ≈ 1 minute of audio
             return file_size / (1024 * 1024) * 60
     
@@ -131,16 +307,18 @@ class WhisperTranscriber:
         Estimate transcription time based on audio duration.
         Optimized for M2 MacBook Air performance.
         """
-        # Rough estimates based on M2 performance
+        # Rough estimates based on M2 performance with float weights;
+        # int8 quantized models run about twice as fast
+        speedup = 0.5 if self.compute_type.startswith('int8') else 1.0
         if self.model_size == "tiny":
-            return audio_duration * 0.1
+            return audio_duration * 0.1 * speedup
         elif self.model_size == "base":
-            return audio_duration * 0.15
+            return audio_duration * 0.15 * speedup
         elif self.model_size == "small":
-            return audio_duration * 0.2
+            return audio_duration * 0.2 * speedup
         elif self.model_size == "medium":
-            return audio_duration * 0.4
+            return audio_duration * 0.4 * speedup
         elif self.model_size == "large":
-            return audio_duration * 0.8
+            return audio_duration * 0.8 * speedup
         else:
-            return audio_duration * 0.3
+            return audio_duration * 0.3 * speedup
@@ -5,24 +5,51 @@ Utility functions for the YouTube Summarizer.
 import os
 import json
 import re
-from pathlib import Path
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
+from typing import Dict, Any, Iterable, Optional, Set, Tuple
 from datetime import datetime
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
+# orjson encodes summary JSON faster when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 
+# Output directories already created by save_summary_to_file in this process
+_created_dirs: Set[str] = set()
+
+# Characters not allowed in filenames, each replaced by an underscore
+_INVALID_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+_WHITESPACE_RE = re.compile(r'\s+')
+
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for safe file operations."""
-    # Remove or replace invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    # Remove extra spaces and limit length
-    filename = re.sub(r'\s+', ' ', filename).strip()
-    return filename[:100]  # Limit length
+    # Replace invalid characters, collapse extra spaces and limit length
+    return _WHITESPACE_RE.sub(' ', filename.translate(_INVALID_FILENAME_CHARS)).strip()[:100]
 
-def save_summary_to_file(summary_data: Dict[str, Any], output_path: str, format: str = "text"):
+def url_hash(url: str) -> str:
+    """
+    Short, stable ID for a URL without a recognizable video ID.
+    
+    Unlike ``hash()``, which is randomized per process, the same URL always
+    maps to the same 8 hex characters, so caches and output files keyed by
+    video ID still match after a restart.
+    """
+    return blake2b(url.encode(), digest_size=4).hexdigest()
+
+def _generated_timestamp() -> str:
+    """Local time as 'YYYY-MM-DD HH:MM:SS' for the 'Generated on' line of summary files."""
+    # isoformat gives the same text as strftime('%Y-%m-%d %H:%M:%S') without its locale handling
+    return datetime.now().isoformat(sep=' ', timespec='seconds')
+
+def save_summary_to_file(summary_data: Dict[str, Any], output_path: str, format: str = "text", pretty: bool = False,
+                         generated_at: Optional[str] = None):
     """
     Save summary to file in specified format.
     
@@ -30,35 +57,65 @@ def save_summary_to_file(summary_data: Dict[str, Any], output_path: str, format:
         summary_data: Summary data dictionary
         output_path: Output file path
         format: Output format (text, markdown, json)
+        pretty: Indent JSON output for reading (default: compact)
+        generated_at: 'Generated on' timestamp (default: now)
     """
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    directory = os.path.dirname(output_path)
+    if directory and directory not in _created_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _created_dirs.add(directory)
     
     if format == "json":
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(summary_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            data = orjson.dumps(summary_data, option=orjson.OPT_INDENT_2 if pretty else 0)
+        else:
+            data = json.dumps(summary_data, indent=2 if pretty else None, ensure_ascii=False).encode('utf-8')
+        with open(output_path, 'wb') as f:
+            f.write(data)
     
     elif format == "markdown":
+        generated_at = generated_at or _generated_timestamp()
+        content = "".join((
+            f"# {summary_data.get('title', 'Video Summary')}\n\n",
+            f"**Uploader:** {summary_data.get('uploader', 'Unknown')}\n",
+            f"**Duration:** {summary_data.get('duration_minutes', 0):.1f} minutes\n",
+            f"**Language:** {summary_data.get('language', 'Unknown')}\n",
+            f"**Summary Length:** {summary_data.get('summary_length', 'medium')}\n\n",
+            "## Summary\n\n",
+            summary_data.get('summary', ''),
+            "\n\n",
+            f"*Generated on {generated_at}*",
+        ))
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(f"# {summary_data.get('title', 'Video Summary')}\n\n")
-            f.write(f"**Uploader:** {summary_data.get('uploader', 'Unknown')}\n")
-            f.write(f"**Duration:** {summary_data.get('duration_minutes', 0):.1f} minutes\n")
-            f.write(f"**Language:** {summary_data.get('language', 'Unknown')}\n")
-            f.write(f"**Summary Length:** {summary_data.get('summary_length', 'medium')}\n\n")
-            f.write("## Summary\n\n")
-            f.write(summary_data.get('summary', ''))
-            f.write("\n\n")
-            f.write(f"*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
+            f.write(content)
     
     else:  # text format
+        generated_at = generated_at or _generated_timestamp()
+        content = "".join((
+            f"Video: {summary_data.get('title', 'Unknown')}\n",
+            f"Uploader: {summary_data.get('uploader', 'Unknown')}\n",
+            f"Duration: {summary_data.get('duration_minutes', 0):.1f} minutes\n",
+            f"Language: {summary_data.get('language', 'Unknown')}\n",
+            f"Summary Length: {summary_data.get('summary_length', 'medium')}\n",
+            "=" * 50 + "\n\n",
+            summary_data.get('summary', ''),
+            f"\n\nGenerated on {generated_at}",
+        ))
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(f"Video: {summary_data.get('title', 'Unknown')}\n")
-            f.write(f"Uploader: {summary_data.get('uploader', 'Unknown')}\n")
-            f.write(f"Duration: {summary_data.get('duration_minutes', 0):.1f} minutes\n")
-            f.write(f"Language: {summary_data.get('language', 'Unknown')}\n")
-            f.write(f"Summary Length: {summary_data.get('summary_length', 'medium')}\n")
-            f.write("=" * 50 + "\n\n")
-            f.write(summary_data.get('summary', ''))
-            f.write(f"\n\nGenerated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            f.write(content)
+
+def save_summaries(summaries: Iterable[Tuple[Dict[str, Any], str]], format: str = "text", pretty: bool = False):
+    """
+    Save several summaries, stamped with one shared 'Generated on' time.
+    
+    Args:
+        summaries: (summary data, output path) pairs
+        format: Output format (text, markdown, json)
+        pretty: Indent JSON output for reading (default: compact)
+    """
+    generated_at = _generated_timestamp()
+    for summary_data, output_path in summaries:
+        save_summary_to_file(summary_data, output_path, format, pretty, generated_at)
 
 def display_summary_info(summary_data: Dict[str, Any]):
     """Display summary information in a nice format."""
@@ -126,18 +183,39 @@ def estimate_processing_time(video_info: Dict[str, Any], whisper_model: str = "s
         'total': download_time + transcription_time + summarization_time
     }
 
-def cleanup_old_files(directory: str, max_age_hours: int = 24):
-    """Clean up old temporary files."""
+def cleanup_old_files(directory: str, max_age_hours: int = 24, max_workers: int = 8):
+    """
+    Clean up old temporary files.
+    
+    The directory is listed once with ``os.scandir`` (whose entries carry
+    their stat data), and expired files are unlinked on a small thread pool.
+    
+    Args:
+        directory: Directory to clean (not recursive)
+        max_age_hours: Remove files last modified longer ago than this
+        max_workers: Maximum number of concurrent unlinks
+    """
     import time
     current_time = time.time()
     max_age_seconds = max_age_hours * 3600
     
-    for file_path in Path(directory).glob("*"):
-        if file_path.is_file():
-            file_age = current_time - file_path.stat().st_mtime
-            if file_age > max_age_seconds:
-                try:
-                    file_path.unlink()
-                    console.print(f"[green]Cleaned up old file: {file_path.name}[/green]")
-                except Exception as e:
-                    console.print(f"[yellow]Could not clean up {file_path.name}: {e}[/yellow]")
+    # Hidden files (e.g. .gitkeep) are left alone, as glob("*") used to
+    with os.scandir(directory) as entries:
+        expired = [
+            entry for entry in entries
+            if not entry.name.startswith('.') and entry.is_file(follow_symlinks=False)
+            and current_time - entry.stat(follow_symlinks=False).st_mtime > max_age_seconds
+        ]
+    if not expired:
+        return
+    
+    def _unlink(entry: os.DirEntry):
+        try:
+            os.unlink(entry.path)
+            console.print(f"[green]Cleaned up old file: {entry.name}[/green]")
+        except Exception as e:
+            console.print(f"[yellow]Could not clean up {entry.name}: {e}[/yellow]")
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(expired)))) as executor:
+        # list() waits for every unlink
+        list(executor.map(_unlink, expired))
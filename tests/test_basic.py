@@ -39,7 +39,7 @@ def test_transcriber_initialization():
 
 def test_utils_functions():
     """Test utility functions."""
-    from src.utils import sanitize_filename, format_duration
+    from src.utils import sanitize_filename, format_duration, url_hash
     
     # Test filename sanitization
     assert sanitize_filename("test<>file.mp3") == "test__file.mp3"
@@ -48,6 +48,34 @@ def test_utils_functions():
     assert format_duration(30) == "30.0s"
     assert format_duration(90) == "1.5m"
     assert format_duration(7200) == "2.0h"
+    
+    # Test URL hashing is stable and 8 hex characters
+    assert url_hash("https://example.com/video") == url_hash("https://example.com/video")
+    assert len(url_hash("https://example.com/video")) == 8
+
+def test_chunk_text():
+    """Test that long transcripts are split at sentence breaks without losing text."""
+    from src.summarizer import _chunk_text
+    
+    text = "One short sentence here. " * 400
+    chunks = _chunk_text(text, tokens_per_chunk=500)
+    
+    assert len(chunks) > 1
+    assert all(chunk.endswith(".") for chunk in chunks)
+    assert " ".join(chunks) == text.strip()
+
+def test_audio_split_points():
+    """Test that parallel transcription chunks cover the audio and split at quiet points."""
+    import numpy as np
+    from src.transcriber import _split_points
+    
+    audio = np.ones(16000 * 300, dtype=np.float32)
+    audio[16000 * 117:16000 * 118] = 0
+    bounds = _split_points(audio, chunk_sec=120)
+    
+    assert bounds[0][0] == 0 and bounds[-1][1] == len(audio)
+    assert all(end == start for (_, end), (start, _) in zip(bounds, bounds[1:]))
+    assert 16000 * 117 <= bounds[0][1] <= 16000 * 118
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,43 @@
+"""
+Tests for the transcript cache.
+"""
+
+import pytest
+from src.cache import SummaryCache, TranscriptCache
+
+
+def test_transcript_cache_roundtrip(tmp_path):
+    """Test that stored transcripts are returned on later lookups."""
+    cache = TranscriptCache(str(tmp_path / "transcripts.sqlite"))
+    key = TranscriptCache.make_key(" https://youtu.be/abc ", "whisper", "small", "int8")
+    assert cache.get(key) is None
+
+    transcript = {'text': 'hello world', 'segments': [{'start': 0.0, 'end': 1.0, 'text': 'hello world', 'words': []}]}
+    cache.put(key, transcript)
+    cache.close()
+
+    reopened = TranscriptCache(str(tmp_path / "transcripts.sqlite"))
+    assert reopened.get(TranscriptCache.make_key("https://youtu.be/abc", "whisper", "small", "int8")) == transcript
+    assert reopened.get(TranscriptCache.make_key("https://youtu.be/abc", "whisper", "tiny", "int8")) is None
+    reopened.close()
+
+
+def test_summary_cache_roundtrip_and_expiry(tmp_path):
+    """Test that summaries are keyed by model, style, length and text, and expire."""
+    cache = SummaryCache(str(tmp_path / "cache.sqlite"))
+    key = SummaryCache.make_key("gpt-4o", "comprehensive", "medium", "transcript")
+    summary = {'summary': 'short', 'length': 'medium', 'style': 'comprehensive', 'word_count': 1,
+               'model_used': 'gpt-4o', 'tokens_used': 10}
+    cache.put(key, summary)
+
+    assert cache.get(key) == summary
+    assert cache.get(SummaryCache.make_key("gpt-4o", "comprehensive", "long", "transcript")) is None
+    cache.close()
+
+    expired = SummaryCache(str(tmp_path / "cache.sqlite"), ttl_days=0)
+    assert expired.get(key) is None
+    expired.close()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
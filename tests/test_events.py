@@ -0,0 +1,156 @@
+"""
+Tests for the event bus.
+"""
+
+import pytest
+import threading
+from src.events import Event, EventBus, TranscriptGeneratedEvent, VideoDiscoveredEvent, VideoProcessingErrorEvent
+from src.events.events.transcript_events import TranscriptSegment, TranscriptSegments
+from src.events.handlers.event_handler import EventHandler, EventProcessor
+
+
+class RecordingHandler(EventHandler):
+    """Handler that records the events it receives."""
+
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    def handle(self, event):
+        self.events.append(event)
+
+
+class TestEventBus:
+    """Test cases for EventBus."""
+
+    def test_publish_to_handler_object(self):
+        """Test that handler objects are dispatched through handle()."""
+        bus = EventBus()
+        handler = RecordingHandler()
+        bus.subscribe(VideoDiscoveredEvent, handler)
+
+        event = VideoDiscoveredEvent(url="https://example.com/video")
+        bus.publish(event)
+        bus.publish(VideoProcessingErrorEvent(video_id="abc", error_message="boom"))
+
+        assert handler.events == [event]
+
+    def test_publish_to_base_class_subscribers(self):
+        """Test that subscribers of a base event type receive subclass events."""
+        bus = EventBus()
+        all_events = RecordingHandler()
+        discovered = RecordingHandler()
+        bus.subscribe(Event, all_events)
+        bus.subscribe(VideoDiscoveredEvent, discovered)
+
+        event = VideoDiscoveredEvent(url="https://example.com/video")
+        error = VideoProcessingErrorEvent(video_id="abc", error_message="boom")
+        bus.publish(event)
+        bus.publish(error)
+
+        assert discovered.events == [event]
+        assert all_events.events == [event, error]
+
+    def test_publish_from_multiple_threads(self):
+        """Test that concurrent publishers all reach the subscriber."""
+        bus = EventBus()
+        received = []
+        lock = threading.Lock()
+
+        def handler(event):
+            with lock:
+                received.append(event.url)
+
+        bus.subscribe(VideoDiscoveredEvent, handler)
+
+        threads = [
+            threading.Thread(target=bus.publish, args=(VideoDiscoveredEvent(url=f"https://example.com/{i}"),))
+            for i in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(received) == 20
+        assert len(bus.get_event_history(VideoDiscoveredEvent)) == 20
+
+    def test_async_dispatch_flush(self):
+        """Test that async dispatch runs handlers off the publishing thread."""
+        bus = EventBus(async_dispatch=True)
+        handler = RecordingHandler()
+        publisher = threading.current_thread()
+        threads = []
+        bus.subscribe(VideoDiscoveredEvent, handler)
+        bus.subscribe(VideoDiscoveredEvent, lambda event: threads.append(threading.current_thread()))
+
+        events = [VideoDiscoveredEvent(url=f"https://example.com/{i}") for i in range(10)]
+        for event in events:
+            bus.publish(event)
+        bus.flush()
+
+        assert sorted(e.url for e in handler.events) == sorted(e.url for e in events)
+        assert publisher not in threads
+
+
+class PoolProcessor(EventProcessor):
+    """Processor that records the thread each event was handled on."""
+
+    def __init__(self, event_bus):
+        super().__init__(event_bus, max_workers=2)
+        self.threads = []
+
+    def handle(self, event):
+        self.threads.append(threading.current_thread())
+        if event.url.endswith('fail'):
+            raise ValueError("boom")
+
+
+def test_processor_thread_pool():
+    """Test that a processor with max_workers runs handle off the publishing thread."""
+    bus = EventBus()
+    processor = PoolProcessor(bus)
+    bus.subscribe(VideoDiscoveredEvent, processor)
+
+    for i in range(5):
+        bus.publish(VideoDiscoveredEvent(url=f"https://example.com/{i}"))
+    bus.publish(VideoDiscoveredEvent(url="https://example.com/fail"))
+    processor.drain()
+    processor.shutdown()
+
+    assert len(processor.threads) == 6
+    assert threading.current_thread() not in processor.threads
+    assert processor.error_count == 1
+
+
+def test_transcript_segments_from_dicts():
+    """Test that Whisper segment dicts are stored column-wise."""
+    segments = [
+        {'start': 0.0, 'end': 1.5, 'text': 'hello', 'words': []},
+        {'start': 1.5, 'end': 3.0, 'text': 'world', 'words': []},
+    ]
+    event = TranscriptGeneratedEvent(video_id="abc", transcript_text="hello world", segments=segments)
+
+    assert isinstance(event.segments, TranscriptSegments)
+    assert len(event.segments) == 2
+    assert event.segments[1] == TranscriptSegment(start=1.5, end=3.0, text='world')
+    assert [segment.text for segment in event.segments] == ['hello', 'world']
+    assert list(event.segments[1:].texts) == ['world']
+
+
+
+def test_event_to_dict():
+    """Test that to_dict serializes subclass fields and value objects."""
+    segments = [{'start': 0.0, 'end': 1.5, 'text': 'hello'}]
+    event = TranscriptGeneratedEvent(video_id="abc", transcript_text="hello", segments=segments)
+    data = event.to_dict()
+
+    assert data['event_type'] == 'TranscriptGeneratedEvent'
+    assert data['video_id'] == 'abc'
+    assert data['segments'] == [{'start': 0.0, 'end': 1.5, 'text': 'hello', 'confidence': 0.0}]
+    assert data['timestamp'] == event.timestamp.isoformat()
+    assert '"video_id": "abc"' in event.to_json()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
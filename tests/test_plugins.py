@@ -0,0 +1,34 @@
+"""
+Tests for the bundled plugins.
+"""
+
+import pytest
+from src.events import EventBus, TranscriptGeneratedEvent
+from src.plugins.sentiment_analyzer import SentimentAnalyzer
+
+
+def test_sentiment_counts_each_occurrence():
+    """Test that repeated keywords are counted once per occurrence."""
+    analyzer = SentimentAnalyzer(EventBus())
+    event = TranscriptGeneratedEvent(video_id="abc", transcript_text="terrible terrible")
+    result = analyzer.process_event(event)
+
+    assert result['negative_words'] == 2
+    assert result['positive_words'] == 0
+    assert result['total_words'] == 2
+    assert result['sentiment'] == 'negative'
+    assert result['analysis_type'] == 'transcript'
+
+
+def test_sentiment_ignores_case():
+    """Test that keywords match regardless of case, but only as whole words."""
+    analyzer = SentimentAnalyzer(EventBus())
+    event = TranscriptGeneratedEvent(video_id="abc", transcript_text="Great talk, I LOVE it. Dislike nothing.")
+    result = analyzer.process_event(event)
+
+    assert result['positive_words'] == 2
+    assert result['negative_words'] == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
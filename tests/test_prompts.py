@@ -95,6 +95,37 @@ class TestPromptManager:
         
         assert default in ['comprehensive', 'bullet_points', 'key_points', 'market_news']
 
+    def test_config_shared_until_file_changes(self, tmp_path):
+        """Test that parsed configs are reused until the file changes."""
+        prompt_file = tmp_path / "short.txt"
+        prompt_file.write_text("Summarize: {text}")
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(f"prompts:\n  short:\n    path: {prompt_file}\n    variables: [text]\n")
+
+        first = PromptManager(str(config_file))
+        second = PromptManager(str(config_file))
+        assert first.config is second.config
+
+        first.add_prompt('long', str(prompt_file), 'Long summary', ['text'])
+        assert 'long' not in second.config['prompts']
+        assert 'long' not in PromptManager(str(config_file)).config['prompts']
+        first.flush()
+
+        third = PromptManager(str(config_file))
+        assert 'long' in third.config['prompts']
+        assert third.get_prompt('short', {'text': 'hi'}) == "Summarize: hi"
+
+    def test_compiled_template_matches_format(self, tmp_path):
+        """Test that compiled templates render like str.format."""
+        prompt_file = tmp_path / "braces.txt"
+        prompt_file.write_text("Return {{\"summary\": ...}} for: {text} ({max_length:>5} words)")
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(f"prompts:\n  braces:\n    path: {prompt_file}\n    variables: [text, max_length]\n")
+
+        manager = PromptManager(str(config_file))
+        variables = {'text': 'hi', 'max_length': 150}
+        assert manager.get_prompt('braces', variables) == prompt_file.read_text().format(**variables)
+
 
 if __name__ == '__main__':
     pytest.main([__file__]) 
\ No newline at end of file